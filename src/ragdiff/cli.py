@@ -10,7 +10,7 @@ Commands:
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 
 import typer
 from dotenv import load_dotenv
@@ -29,6 +29,7 @@ from .comparison import compare_runs
 from .comparison.reference_evaluator import evaluate_run_threaded
 from .core.errors import ComparisonError, RunError
 from .core.logging import setup_logging
+from .core.models import DEFAULT_LLM_MODEL
 from .core.storage import load_comparison, load_run
 from .execution import execute_run
 
@@ -46,6 +47,8 @@ app = typer.Typer(
 # Initialize Rich console for output
 console = Console()
 
+T = TypeVar("T")
+
 
 # ============================================================================
 # Run Command
@@ -74,6 +77,11 @@ def run(
     ),
     concurrency: int = typer.Option(10, help="Maximum concurrent queries"),
     timeout: float = typer.Option(30.0, help="Timeout per query in seconds"),
+    use_async: bool = typer.Option(
+        False,
+        "--async",
+        help="Run queries on one event loop (providers with async search only)",
+    ),
     quiet: bool = typer.Option(False, "--quiet", help="Suppress progress output"),
 ):
     """Execute a query set against a provider.
@@ -94,60 +102,23 @@ def run(
     domains_path = domain_dir.parent
 
     try:
-        # Show progress bar unless quiet mode
-        if not quiet:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console,
-            ) as progress:
-                # Track progress
-                task = progress.add_task(
-                    f"Executing run: {domain}/{provider}/{query_set}", total=100
-                )
-
-                completed_queries = 0
-                total_queries = 0
-
-                def progress_callback(current, total, successes, failures):
-                    nonlocal completed_queries, total_queries
-                    completed_queries = current
-                    total_queries = total
-                    progress.update(
-                        task,
-                        completed=current,
-                        total=total,
-                        description=f"Query {current}/{total} ({successes} ok, {failures} failed)",
-                    )
-
-                # Execute run
-                result = execute_run(
-                    domain=domain,
-                    provider=provider,
-                    query_set=query_set,
-                    label=label,
-                    concurrency=concurrency,
-                    per_query_timeout=timeout,
-                    progress_callback=progress_callback,
-                    domains_dir=domains_path,
-                )
-
-                progress.update(task, completed=total_queries, total=total_queries)
-        else:
-            # Quiet mode - no progress bar
-            result = execute_run(
+        # Execute run (with a progress bar unless quiet mode)
+        result = _run_with_progress(
+            f"Executing run: {domain}/{provider}/{query_set}",
+            "Query",
+            quiet,
+            lambda progress_callback: execute_run(
                 domain=domain,
                 provider=provider,
                 query_set=query_set,
                 label=label,
                 concurrency=concurrency,
                 per_query_timeout=timeout,
-                progress_callback=None,
+                progress_callback=progress_callback,
                 domains_dir=domains_path,
-            )
+                use_async=use_async,
+            ),
+        )
 
         # Display results
         console.print()
@@ -418,58 +389,22 @@ def _compare_head_to_head(
     from .display.formatting import calculate_provider_stats_from_runs
 
     try:
-        # Show progress bar unless quiet mode
-        if not quiet:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console,
-            ) as progress:
-                # Track progress
-                task = progress.add_task(f"Comparing {len(run_ids)} runs", total=100)
-
-                completed_evals = 0
-                total_evals = 0
-
-                def progress_callback(current, total, successes, failures):
-                    nonlocal completed_evals, total_evals
-                    completed_evals = current
-                    total_evals = total
-                    progress.update(
-                        task,
-                        completed=current,
-                        total=total,
-                        description=f"Evaluation {current}/{total} ({successes} ok, {failures} failed)",
-                    )
-
-                # Execute comparison
-                result = compare_runs(
-                    domain=domain,
-                    run_ids=run_ids,
-                    label=label,
-                    model=model,
-                    temperature=temperature,
-                    concurrency=concurrency,
-                    progress_callback=progress_callback,
-                    domains_dir=domains_path,
-                )
-
-                progress.update(task, completed=total_evals, total=total_evals)
-        else:
-            # Quiet mode - no progress bar
-            result = compare_runs(
+        # Execute comparison (with a progress bar unless quiet mode)
+        result = _run_with_progress(
+            f"Comparing {len(run_ids)} runs",
+            "Evaluation",
+            quiet,
+            lambda progress_callback: compare_runs(
                 domain=domain,
                 run_ids=run_ids,
                 label=label,
                 model=model,
                 temperature=temperature,
                 concurrency=concurrency,
-                progress_callback=None,
+                progress_callback=progress_callback,
                 domains_dir=domains_path,
-            )
+            ),
+        )
 
         # Calculate statistics
         # Load runs to get stats (latency, cost)
@@ -550,53 +485,18 @@ def _compare_with_references(
                 )
 
             # Run batched comparison with progress
-            if not quiet:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    TimeElapsedColumn(),
-                    console=console,
-                ) as progress:
-                    progress_task = progress.add_task(
-                        f"Comparing {len(runs)} runs", total=100
-                    )
-
-                    completed_evals = 0
-                    total_evals = 0
-
-                    def progress_callback(current, total, successes, failures):
-                        nonlocal completed_evals, total_evals
-                        completed_evals = current
-                        total_evals = total
-                        progress.update(
-                            progress_task,
-                            completed=current,
-                            total=total,
-                            description=f"Comparison {current}/{total} ({successes} ok, {failures} failed)",
-                        )
-
-                    comparison_result = compare_multiple_runs_batched(
-                        runs=runs,
-                        evaluator_config=evaluator_config,
-                        concurrency=concurrency,
-                        progress_callback=progress_callback,
-                        limit=limit,
-                    )
-
-                    progress.update(
-                        progress_task, completed=total_evals, total=total_evals
-                    )
-            else:
-                # Quiet mode
-                comparison_result = compare_multiple_runs_batched(
+            comparison_result = _run_with_progress(
+                f"Comparing {len(runs)} runs",
+                "Comparison",
+                quiet,
+                lambda progress_callback: compare_multiple_runs_batched(
                     runs=runs,
                     evaluator_config=evaluator_config,
                     concurrency=concurrency,
-                    progress_callback=None,
+                    progress_callback=progress_callback,
                     limit=limit,
-                )
+                ),
+            )
 
             # Output batched comparison results
             _output_batched_comparison(comparison_result, output, format)
@@ -608,53 +508,18 @@ def _compare_with_references(
                 console.print(f"\n[cyan]Evaluating run: {run_ids[0]}[/cyan]")
 
             # Evaluate with progress
-            if not quiet:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                    TimeElapsedColumn(),
-                    console=console,
-                ) as progress:
-                    progress_task = progress.add_task(
-                        f"Evaluating {run_ids[0]}", total=100
-                    )
-
-                    completed_evals = 0
-                    total_evals = 0
-
-                    def progress_callback(current, total, successes, failures):
-                        nonlocal completed_evals, total_evals
-                        completed_evals = current
-                        total_evals = total
-                        progress.update(
-                            progress_task,
-                            completed=current,
-                            total=total,
-                            description=f"Evaluation {current}/{total} ({successes} ok, {failures} failed)",
-                        )
-
-                    eval_result = evaluate_run_threaded(
-                        run=run_obj,
-                        evaluator_config=evaluator_config,
-                        concurrency=concurrency,
-                        progress_callback=progress_callback,
-                        limit=limit,
-                    )
-
-                    progress.update(
-                        progress_task, completed=total_evals, total=total_evals
-                    )
-            else:
-                # Quiet mode
-                eval_result = evaluate_run_threaded(
+            eval_result = _run_with_progress(
+                f"Evaluating {run_ids[0]}",
+                "Evaluation",
+                quiet,
+                lambda progress_callback: evaluate_run_threaded(
                     run=run_obj,
                     evaluator_config=evaluator_config,
                     concurrency=concurrency,
-                    progress_callback=None,
+                    progress_callback=progress_callback,
                     limit=limit,
-                )
+                ),
+            )
 
             # Output single run evaluation
             if format == "json":
@@ -966,7 +831,7 @@ def generate_provider(
     ),
     method: Optional[str] = typer.Option(None, "--method", help="Override HTTP method"),
     model: str = typer.Option(
-        "claude-3-5-sonnet-20241022", "--model", "-m", help="LLM model for generation"
+        DEFAULT_LLM_MODEL, "--model", "-m", help="LLM model for generation"
     ),
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Enable verbose output"
@@ -1072,6 +937,52 @@ def generate_provider(
 # ============================================================================
 
 
+def _run_with_progress(
+    description: str,
+    item_name: str,
+    quiet: bool,
+    task_fn: Callable[[Optional[Callable[[int, int, int, int], None]]], T],
+) -> T:
+    """Call ``task_fn(progress_callback)`` under a progress bar.
+
+    Args:
+        description: Initial progress bar description
+        item_name: Name of each unit of work (e.g., "Query", "Evaluation")
+        quiet: If True, skip the progress bar and pass ``None`` as the callback
+        task_fn: Runs the work, reporting progress through the given callback
+
+    Returns:
+        Whatever ``task_fn`` returns
+    """
+    if quiet:
+        return task_fn(None)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task(description, total=100)
+        total_items = 0
+
+        def progress_callback(current, total, successes, failures):
+            nonlocal total_items
+            total_items = total
+            progress.update(
+                task,
+                completed=current,
+                total=total,
+                description=f"{item_name} {current}/{total} ({successes} ok, {failures} failed)",
+            )
+
+        result = task_fn(progress_callback)
+        progress.update(task, completed=total_items, total=total_items)
+        return result
+
+
 def _output_table(comparison, output_path, provider_stats=None):
     """Output comparison results as a table."""
     if output_path:
@@ -1164,15 +1075,16 @@ def _output_table(comparison, output_path, provider_stats=None):
 
     # Show sample evaluations
     console.print("[bold]Sample Evaluations:[/bold]")
+    provider_names = tuple(provider_stats or ())
     for i, eval_result in enumerate(comparison.evaluations[:5], 1):
         console.print(f"\n[cyan]{i}. Query:[/cyan] {eval_result.query[:80]}...")
         if "winner" in eval_result.evaluation:
             winner = eval_result.evaluation.get("winner", "unknown")
             # Map back to provider name if possible
-            if winner == "a" and provider_stats and len(provider_stats) >= 1:
-                winner = list(provider_stats.keys())[0]
-            elif winner == "b" and provider_stats and len(provider_stats) >= 2:
-                winner = list(provider_stats.keys())[1]
+            if winner == "a" and len(provider_names) >= 1:
+                winner = provider_names[0]
+            elif winner == "b" and len(provider_names) >= 2:
+                winner = provider_names[1]
 
             console.print(f"   [green]Winner:[/green] {winner}")
         if "reasoning" in eval_result.evaluation:
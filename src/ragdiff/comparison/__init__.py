@@ -3,7 +3,7 @@
 v2.0: Domain-based comparison with LLM evaluation.
 """
 
-from .evaluator import compare_runs
+from .evaluator import compare_runs, iter_evaluations
 from .reference_evaluator import evaluate_run
 
-__all__ = ["compare_runs", "evaluate_run"]
+__all__ = ["compare_runs", "evaluate_run", "iter_evaluations"]
@@ -6,8 +6,10 @@ Key features:
 - Load and compare multiple runs
 - LLM evaluation using LiteLLM (supports 100+ providers)
 - Retry logic with exponential backoff
+- Optional Anthropic Message Batches evaluation for Claude models
 - Cost tracking per evaluation
 - Error handling (per-query evaluation errors don't crash)
+- Streaming evaluations as they complete (iter_evaluations)
 - Comparison file storage
 
 Example:
@@ -19,35 +21,88 @@ Example:
     >>> print(f"Comparison {comparison.id}: {len(comparison.evaluations)} evaluations")
 """
 
+import importlib.util
 import os
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Union
 from uuid import UUID, uuid4
 
+from ..core.cache import SqliteCache, prompt_hash
 from ..core.errors import ComparisonError
 from ..core.loaders import load_domain
 from ..core.logging import get_logger
-from ..core.models import Comparison, Domain, EvaluationResult, EvaluatorConfig
+from ..core.models import (
+    Comparison,
+    Domain,
+    EvaluationResult,
+    EvaluatorConfig,
+    Run,
+)
+from ..core.pricing import calculate_llm_cost
 from ..core.storage import load_run, save_comparison
+from .rate_limit import RateLimiter
 
 logger = get_logger(__name__)
 
-# Try to import LiteLLM
-try:
-    import litellm
+# Seconds to wait before each retry of a rate-limited (429) LLM call
+RATE_LIMIT_BACKOFF = (5, 15, 60)
+
+# Anthropic Message Batches: output cap per evaluation, status poll interval
+# and wait limit (seconds; the API expires batches after 24 hours) and the
+# batch price relative to synchronous calls
+BATCH_MAX_TOKENS = 4096
+BATCH_POLL_INTERVAL = 10.0
+BATCH_TIMEOUT = 24 * 60 * 60.0
+BATCH_DISCOUNT = 0.5
+
+# Wraps several evaluation prompts into one LLM call (queries_per_call > 1)
+PACKED_PROMPT_TEMPLATE = """Below are {count} independent evaluation tasks, \
+each between <task id="..."> and </task> tags. Complete every task on its own, \
+following that task's instructions.
 
-    LITELLM_AVAILABLE = True
-except ImportError:
-    LITELLM_AVAILABLE = False
+Respond with only a JSON array containing one object per task: the JSON \
+object that task asks for (as JSON even if the task requests another format), \
+plus an "id" field holding the task id.
+
+{tasks}"""
+
+# LiteLLM takes seconds to import, so only check that it is installed here;
+# it is imported where completions are made
+LITELLM_AVAILABLE = importlib.util.find_spec("litellm") is not None
+if not LITELLM_AVAILABLE:
     logger.warning(
         "LiteLLM not installed. Install with: pip install litellm. "
         "Comparison functionality will not work without it."
     )
 
 
+# Model name prefixes -> environment variable holding the provider's API key
+API_KEY_ENV_VARS = {
+    "claude": "ANTHROPIC_API_KEY",
+    "gpt": "OPENAI_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+    "o1": "OPENAI_API_KEY",
+}
+
+
+@lru_cache(maxsize=64)
+def _api_key_env_var(model: str) -> str | None:
+    """Return the environment variable holding the API key for ``model``.
+
+    Only the prefix match is memoized; the variable itself is read from the
+    environment on every check so keys set later are still picked up.
+    """
+    for prefix, env_var in API_KEY_ENV_VARS.items():
+        if model.startswith(prefix):
+            return env_var
+    return None
+
+
 def _validate_api_key(model: str) -> None:
     """Validate that the required API key is available for the model.
 
@@ -57,21 +112,7 @@ def _validate_api_key(model: str) -> None:
     Raises:
         ComparisonError: If the required API key is not set
     """
-    # Map model prefixes to required environment variables
-    api_key_mapping = {
-        "claude": "ANTHROPIC_API_KEY",
-        "gpt": "OPENAI_API_KEY",
-        "gemini": "GEMINI_API_KEY",
-        "o1": "OPENAI_API_KEY",
-    }
-
-    # Find the required key
-    required_key = None
-    for prefix, env_var in api_key_mapping.items():
-        if model.startswith(prefix):
-            required_key = env_var
-            break
-
+    required_key = _api_key_env_var(model)
     if not required_key:
         logger.warning(
             f"Unknown model prefix for '{model}', skipping API key validation"
@@ -98,6 +139,11 @@ def compare_runs(
     concurrency: int = 1,
     progress_callback: Callable[[int, int, int, int], None] | None = None,
     domains_dir: Path = Path("domains"),
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+    use_batch: bool = False,
+    batch_timeout: float = BATCH_TIMEOUT,
+    queries_per_call: int = 1,
 ) -> Comparison:
     """Compare multiple runs using LLM evaluation.
 
@@ -119,6 +165,19 @@ def compare_runs(
         concurrency: Maximum number of concurrent evaluations (default: 1 for sequential)
         progress_callback: Optional callback for progress updates (current, total, successes, failures)
         domains_dir: Root directory containing all domains (only used for string parameters)
+        requests_per_minute: Optional cap on LLM requests per minute, to stay
+            under the provider's quota instead of retrying after 429s
+        tokens_per_minute: Optional cap on estimated prompt tokens per minute
+            (only applied together with requests_per_minute)
+        use_batch: Submit all evaluations as one Anthropic Message Batch
+            (Claude models only). Billed at the batch discount and exempt from
+            synchronous rate limits, but waits for the whole batch to finish
+        batch_timeout: Seconds to wait for a batch (use_batch) before
+            cancelling it and raising ComparisonError (default: 24 hours)
+        queries_per_call: Evaluate this many queries per LLM call by packing
+            their prompts into one request (default: 1). Cuts round-trips and
+            per-call overhead; each evaluation is billed a share of the call.
+            Not supported with use_batch
 
     Returns:
         Comparison object with evaluation results
@@ -142,6 +201,12 @@ def compare_runs(
         raise ComparisonError(
             "LiteLLM is required for comparisons. Install with: pip install litellm"
         )
+    if queries_per_call < 1:
+        raise ComparisonError(
+            f"queries_per_call must be at least 1 (got {queries_per_call})"
+        )
+    if use_batch and queries_per_call > 1:
+        raise ComparisonError("queries_per_call is not supported with use_batch")
 
     logger.info(
         f"Starting comparison: domain={domain}, run_ids={run_ids}, model={model}"
@@ -170,29 +235,7 @@ def compare_runs(
             domain_obj = domain
             logger.debug(f"Using provided Domain object: {domain_name}")
 
-        # Load all runs
-        runs = []
-        run_uuids = []
-        for run_id in run_ids:
-            run = load_run(domain_name, run_id, domains_dir)
-            runs.append(run)
-            run_uuids.append(run.id)
-
-        logger.info(f"Loaded {len(runs)} runs")
-
-        # Validate runs are from same domain
-        if not all(r.domain == domain_name for r in runs):
-            domains = {r.domain for r in runs}
-            raise ComparisonError(
-                f"Cannot compare runs from different domains: {domains}"
-            )
-
-        # Validate runs use compatible query sets
-        query_set_names = {r.query_set for r in runs}
-        if len(query_set_names) > 1:
-            raise ComparisonError(
-                f"Cannot compare runs with different query sets: {query_set_names}"
-            )
+        runs = _load_comparable_runs(domain_name, run_ids, domains_dir)
 
         # Get evaluator config
         if model or temperature is not None:
@@ -215,27 +258,65 @@ def compare_runs(
         # Validate API key is available before starting evaluation
         _validate_api_key(evaluator_config.model)
 
+        # Message Batches is an Anthropic API
+        batch_model = evaluator_config.model.removeprefix("anthropic/")
+        if use_batch and not batch_model.startswith("claude"):
+            raise ComparisonError(
+                f"Batch evaluation requires a Claude model, got "
+                f"'{evaluator_config.model}'"
+            )
+
     except ComparisonError:
         raise
     except Exception as e:
         logger.error(f"Failed to initialize comparison: {e}")
         raise ComparisonError(f"Failed to initialize comparison: {e}") from e
 
-    # Evaluate each query
-    evaluations = _evaluate_all_queries(
-        runs=runs,
-        evaluator_config=evaluator_config,
-        max_retries=max_retries,
-        concurrency=concurrency,
-        progress_callback=progress_callback,
+    # Pace LLM calls client-side when the caller knows its provider quota
+    rate_limiter = (
+        RateLimiter(requests_per_minute, tokens_per_minute)
+        if requests_per_minute
+        else None
     )
 
+    # Reuse responses from earlier identical evaluations when enabled
+    cache = None
+    if domain_obj.cache.enabled and not use_batch:
+        cache_path = domains_dir / domain_name / domain_obj.cache.path
+        cache = SqliteCache(cache_path, ttl_days=domain_obj.cache.ttl_days)
+        logger.info(f"Using evaluation cache at {cache_path}")
+
+    # Evaluate each query
+    try:
+        if use_batch:
+            evaluations = _evaluate_queries_batch(
+                runs=runs,
+                queries=runs[0].query_set_snapshot.queries,
+                evaluator_config=evaluator_config,
+                progress_callback=progress_callback,
+                timeout=batch_timeout,
+            )
+        else:
+            evaluations = _evaluate_all_queries(
+                runs=runs,
+                evaluator_config=evaluator_config,
+                max_retries=max_retries,
+                concurrency=concurrency,
+                progress_callback=progress_callback,
+                rate_limiter=rate_limiter,
+                queries_per_call=queries_per_call,
+                cache=cache,
+            )
+    finally:
+        if cache is not None:
+            cache.close()
+
     # Create comparison object
     comparison = Comparison(
         id=comparison_id,
         label=label,
         domain=domain_name,
-        runs=run_uuids,
+        runs=[run.id for run in runs],
         evaluations=evaluations,
         evaluator_config=evaluator_config,
         created_at=created_at,
@@ -261,12 +342,49 @@ def compare_runs(
     return comparison
 
 
+def _load_comparable_runs(
+    domain_name: str, run_ids: list[str | UUID], domains_dir: Path
+) -> list[Run]:
+    """Load runs and check that they can be compared with each other.
+
+    Args:
+        domain_name: Domain every run must belong to
+        run_ids: Run IDs (full UUID or short prefix)
+        domains_dir: Root directory containing all domains
+
+    Returns:
+        Loaded runs, in ``run_ids`` order
+
+    Raises:
+        ComparisonError: If runs are from different domains or query sets
+    """
+    runs = [load_run(domain_name, run_id, domains_dir) for run_id in run_ids]
+    logger.info(f"Loaded {len(runs)} runs")
+
+    # Validate runs are from same domain
+    if not all(r.domain == domain_name for r in runs):
+        domains = {r.domain for r in runs}
+        raise ComparisonError(f"Cannot compare runs from different domains: {domains}")
+
+    # Validate runs use compatible query sets
+    query_set_names = {r.query_set for r in runs}
+    if len(query_set_names) > 1:
+        raise ComparisonError(
+            f"Cannot compare runs with different query sets: {query_set_names}"
+        )
+
+    return runs
+
+
 def _evaluate_all_queries(
     runs,
     evaluator_config: EvaluatorConfig,
     max_retries: int,
     concurrency: int,
     progress_callback: Callable[[int, int, int, int], None] | None,
+    rate_limiter: RateLimiter | None = None,
+    queries_per_call: int = 1,
+    cache: SqliteCache | None = None,
 ) -> list[EvaluationResult]:
     """Evaluate all queries across runs (parallel or sequential).
 
@@ -276,6 +394,9 @@ def _evaluate_all_queries(
         max_retries: Maximum retries for LLM calls
         concurrency: Maximum concurrent evaluations (1 = sequential)
         progress_callback: Optional progress callback
+        rate_limiter: Optional limiter shared by all LLM calls
+        queries_per_call: Queries packed into each LLM call
+        cache: Optional cache of LLM responses
 
     Returns:
         List of EvaluationResult objects
@@ -289,24 +410,108 @@ def _evaluate_all_queries(
         f"(concurrency={concurrency})"
     )
 
-    if concurrency == 1:
+    # Repeated (text, reference) pairs produce identical prompts; at
+    # temperature 0 evaluate each once and copy the result to the repeats
+    queries = query_set.queries
+    if evaluator_config.temperature == 0:
+        distinct = {}
+        for query in queries:
+            distinct.setdefault((query.text, query.reference), query)
+        if len(distinct) < len(queries):
+            logger.info(
+                f"Evaluating {len(distinct)} distinct queries; "
+                f"{len(queries) - len(distinct)} duplicates reuse their results"
+            )
+            queries = list(distinct.values())
+
+    evaluations = _dispatch_evaluations(
+        runs=runs,
+        queries=queries,
+        evaluator_config=evaluator_config,
+        max_retries=max_retries,
+        concurrency=concurrency,
+        progress_callback=progress_callback,
+        rate_limiter=rate_limiter,
+        queries_per_call=queries_per_call,
+        cache=cache,
+    )
+    if len(queries) == total_queries:
+        return evaluations
+
+    # Fan results back out in query set order, copying for each repeat
+    by_key = {(e.query, e.reference): e for e in evaluations}
+    seen = set()
+    results = []
+    for query in query_set.queries:
+        key = (query.text, query.reference)
+        result = by_key[key]
+        results.append(result.model_copy(deep=True) if key in seen else result)
+        seen.add(key)
+    return results
+
+
+def _dispatch_evaluations(
+    runs,
+    queries,
+    evaluator_config: EvaluatorConfig,
+    max_retries: int,
+    concurrency: int,
+    progress_callback: Callable[[int, int, int, int], None] | None,
+    rate_limiter: RateLimiter | None,
+    queries_per_call: int,
+    cache: SqliteCache | None,
+) -> list[EvaluationResult]:
+    """Evaluate queries with the packed, sequential or parallel strategy.
+
+    Args:
+        runs: List of Run objects
+        queries: List of Query objects to evaluate
+        evaluator_config: Evaluator configuration
+        max_retries: Maximum retries for LLM calls
+        concurrency: Maximum concurrent evaluations (1 = sequential)
+        progress_callback: Optional progress callback
+        rate_limiter: Optional limiter shared by all LLM calls
+        queries_per_call: Queries packed into each LLM call
+        cache: Optional cache of LLM responses
+
+    Returns:
+        List of EvaluationResult objects (in same order as queries)
+    """
+    if queries_per_call > 1:
+        # Several queries per LLM call
+        return _evaluate_queries_packed(
+            runs=runs,
+            queries=queries,
+            evaluator_config=evaluator_config,
+            max_retries=max_retries,
+            concurrency=concurrency,
+            queries_per_call=queries_per_call,
+            progress_callback=progress_callback,
+            rate_limiter=rate_limiter,
+            cache=cache,
+        )
+    elif concurrency == 1:
         # Sequential execution
         return _evaluate_queries_sequential(
             runs=runs,
-            queries=query_set.queries,
+            queries=queries,
             evaluator_config=evaluator_config,
             max_retries=max_retries,
             progress_callback=progress_callback,
+            rate_limiter=rate_limiter,
+            cache=cache,
         )
     else:
         # Parallel execution
         return _evaluate_queries_parallel(
             runs=runs,
-            queries=query_set.queries,
+            queries=queries,
             evaluator_config=evaluator_config,
             max_retries=max_retries,
             concurrency=concurrency,
             progress_callback=progress_callback,
+            rate_limiter=rate_limiter,
+            cache=cache,
         )
 
 
@@ -316,6 +521,8 @@ def _evaluate_queries_sequential(
     evaluator_config: EvaluatorConfig,
     max_retries: int,
     progress_callback: Callable[[int, int, int, int], None] | None,
+    rate_limiter: RateLimiter | None = None,
+    cache: SqliteCache | None = None,
 ) -> list[EvaluationResult]:
     """Execute evaluations sequentially (original behavior).
 
@@ -325,6 +532,8 @@ def _evaluate_queries_sequential(
         evaluator_config: Evaluator configuration
         max_retries: Maximum retries for LLM calls
         progress_callback: Optional progress callback
+        rate_limiter: Optional limiter shared by all LLM calls
+        cache: Optional cache of LLM responses
 
     Returns:
         List of EvaluationResult objects
@@ -333,20 +542,13 @@ def _evaluate_queries_sequential(
     total_queries = len(queries)
     successes = 0
     failures = 0
+    run_indexes = _index_run_results(runs)
 
     for i, query in enumerate(queries):
         logger.debug(f"Evaluating query {i+1}/{total_queries}: {query.text[:50]}...")
 
         # Gather results from all runs for this query
-        run_results = {}
-        for run in runs:
-            # Use label or ID as key to ensure uniqueness
-            key = run.label or str(run.id)
-
-            # Find matching result for this query
-            matching_results = [r for r in run.results if r.query == query.text]
-            if matching_results:
-                run_results[key] = matching_results[0].retrieved
+        run_results = _gather_run_results(run_indexes, query)
 
         # Evaluate this query
         evaluation_result = _evaluate_single_query(
@@ -355,6 +557,8 @@ def _evaluate_queries_sequential(
             run_results=run_results,
             evaluator_config=evaluator_config,
             max_retries=max_retries,
+            rate_limiter=rate_limiter,
+            cache=cache,
         )
 
         evaluations.append(evaluation_result)
@@ -373,6 +577,70 @@ def _evaluate_queries_sequential(
     return evaluations
 
 
+def iter_evaluations(
+    runs,
+    evaluator_config: EvaluatorConfig,
+    queries=None,
+    concurrency: int = 10,
+    max_retries: int = 3,
+    rate_limiter: RateLimiter | None = None,
+    cache: SqliteCache | None = None,
+) -> Iterator[tuple[int, EvaluationResult]]:
+    """Evaluate queries on a thread pool, yielding each result as it completes.
+
+    Unlike ``compare_runs``, evaluations are not collected into a Comparison,
+    so a caller that writes each one out (e.g. to JSONL) holds only the
+    in-flight ones. Evaluations not yet started are cancelled if the caller
+    stops iterating early.
+
+    Args:
+        runs: Run objects to compare (same query set)
+        evaluator_config: Evaluator configuration
+        queries: Queries to evaluate (default: the runs' whole query set)
+        concurrency: Maximum number of concurrent evaluations (default: 10)
+        max_retries: Maximum retries for LLM calls (default: 3)
+        rate_limiter: Optional limiter shared by all LLM calls
+        cache: Optional cache of LLM responses
+
+    Yields:
+        (index into ``queries``, EvaluationResult) tuples in completion order.
+        LLM errors are reported in ``EvaluationResult.evaluation["error"]``,
+        never raised.
+
+    Example:
+        >>> runs = [load_run("tafsir", run_id) for run_id in run_ids]
+        >>> for i, result in iter_evaluations(runs, domain.evaluator):
+        ...     out.write(result.model_dump_json() + "\\n")
+    """
+    if queries is None:
+        queries = runs[0].query_set_snapshot.queries
+    run_indexes = _index_run_results(runs)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        future_to_index = {
+            executor.submit(
+                _evaluate_single_query,
+                query.text,
+                query.reference,
+                _gather_run_results(run_indexes, query),
+                evaluator_config,
+                max_retries,
+                rate_limiter,
+                cache,
+            ): i
+            for i, query in enumerate(queries)
+        }
+
+        for future in as_completed(future_to_index):
+            # Drop our reference so the result can be freed once yielded
+            index = future_to_index.pop(future)
+            # This won't raise since _evaluate_single_query catches LLM errors
+            yield index, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _evaluate_queries_parallel(
     runs,
     queries,
@@ -380,6 +648,8 @@ def _evaluate_queries_parallel(
     max_retries: int,
     concurrency: int,
     progress_callback: Callable[[int, int, int, int], None] | None,
+    rate_limiter: RateLimiter | None = None,
+    cache: SqliteCache | None = None,
 ) -> list[EvaluationResult]:
     """Execute evaluations in parallel using ThreadPoolExecutor.
 
@@ -390,6 +660,8 @@ def _evaluate_queries_parallel(
         max_retries: Maximum retries for LLM calls
         concurrency: Maximum number of concurrent evaluations
         progress_callback: Optional progress callback
+        rate_limiter: Optional limiter shared by all LLM calls
+        cache: Optional cache of LLM responses
 
     Returns:
         List of EvaluationResult objects (in same order as queries)
@@ -401,60 +673,435 @@ def _evaluate_queries_parallel(
 
     logger.info(f"Executing {total} evaluations with concurrency={concurrency}")
 
-    # Create thread pool
+    for index, evaluation_result in iter_evaluations(
+        runs,
+        evaluator_config,
+        queries=queries,
+        concurrency=concurrency,
+        max_retries=max_retries,
+        rate_limiter=rate_limiter,
+        cache=cache,
+    ):
+        # Store result
+        results[index] = evaluation_result
+
+        # Update progress
+        if "error" not in evaluation_result.evaluation:
+            successes += 1
+        else:
+            failures += 1
+
+        # Call progress callback
+        if progress_callback:
+            progress_callback(index + 1, total, successes, failures)
+
+    logger.info(f"Evaluation complete: {successes} successes, {failures} failures")
+    return results
+
+
+def _evaluate_queries_packed(
+    runs,
+    queries,
+    evaluator_config: EvaluatorConfig,
+    max_retries: int,
+    concurrency: int,
+    queries_per_call: int,
+    progress_callback: Callable[[int, int, int, int], None] | None,
+    rate_limiter: RateLimiter | None = None,
+    cache: SqliteCache | None = None,
+) -> list[EvaluationResult]:
+    """Evaluate queries in groups, one LLM call per group of queries.
+
+    Args:
+        runs: List of Run objects
+        queries: List of Query objects
+        evaluator_config: Evaluator configuration
+        max_retries: Maximum retries for LLM calls
+        concurrency: Maximum number of concurrent LLM calls
+        queries_per_call: Maximum queries in each group
+        progress_callback: Optional progress callback
+        rate_limiter: Optional limiter shared by all LLM calls
+        cache: Optional cache of LLM responses
+
+    Returns:
+        List of EvaluationResult objects (in same order as queries)
+    """
+    total = len(queries)
+    run_indexes = _index_run_results(runs)
+    groups = [
+        queries[start : start + queries_per_call]
+        for start in range(0, total, queries_per_call)
+    ]
+    group_results = [None] * len(groups)
+    completed = 0
+    successes = 0
+
+    logger.info(
+        f"Executing {total} evaluations in {len(groups)} LLM calls "
+        f"with concurrency={concurrency}"
+    )
+
     with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        # Submit all evaluations
-        future_to_index = {}
-        for i, query in enumerate(queries):
-            # Gather results from all runs for this query
-            run_results = {}
-            for run in runs:
-                # Use label or ID as key to ensure uniqueness
-                key = run.label or str(run.id)
-
-                # Find matching result for this query
-                matching_results = [r for r in run.results if r.query == query.text]
-                if matching_results:
-                    run_results[key] = matching_results[0].retrieved
-
-            future = executor.submit(
-                _evaluate_single_query,
-                query.text,
-                query.reference,
-                run_results,
+        future_to_index = {
+            executor.submit(
+                _evaluate_query_group,
+                group,
+                run_indexes,
                 evaluator_config,
                 max_retries,
-            )
-            future_to_index[future] = i
+                rate_limiter,
+                cache,
+            ): i
+            for i, group in enumerate(groups)
+        }
 
-        # Process completed evaluations
         for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            evaluation_result = future.result()
+            evaluation_results = future.result()
+            group_results[future_to_index[future]] = evaluation_results
+
+            completed += len(evaluation_results)
+            successes += sum(
+                1 for r in evaluation_results if "error" not in r.evaluation
+            )
+            if progress_callback:
+                progress_callback(completed, total, successes, completed - successes)
+
+    return [result for group in group_results for result in group]
+
+
+def _evaluate_query_group(
+    queries,
+    run_indexes: list[tuple[str, dict]],
+    evaluator_config: EvaluatorConfig,
+    max_retries: int,
+    rate_limiter: RateLimiter | None = None,
+    cache: SqliteCache | None = None,
+) -> list[EvaluationResult]:
+    """Evaluate several queries with a single LLM call.
 
-            # Store result
-            results[index] = evaluation_result
+    Each query's prompt is built exactly as for a single evaluation, then the
+    prompts are wrapped in ``PACKED_PROMPT_TEMPLATE``. The call's cost and
+    token counts are split evenly across the queries.
+
+    Args:
+        queries: Query objects to evaluate together
+        run_indexes: Output of ``_index_run_results``
+        evaluator_config: Evaluator configuration
+        max_retries: Maximum retries
+        rate_limiter: Optional limiter shared by all LLM calls
+        cache: Optional cache of LLM responses
+
+    Returns:
+        EvaluationResult per query, in the same order
+    """
+    all_run_results = [_gather_run_results(run_indexes, query) for query in queries]
+    if len(queries) == 1:
+        return [
+            _evaluate_single_query(
+                query=queries[0].text,
+                reference=queries[0].reference,
+                run_results=all_run_results[0],
+                evaluator_config=evaluator_config,
+                max_retries=max_retries,
+                rate_limiter=rate_limiter,
+                cache=cache,
+            )
+        ]
+
+    tasks = "\n\n".join(
+        f'<task id="{i}">\n'
+        + _format_evaluation_prompt(
+            query=query.text,
+            reference=query.reference,
+            run_results=run_results,
+            prompt_template=evaluator_config.prompt_template,
+        )
+        + "\n</task>"
+        for i, (query, run_results) in enumerate(zip(queries, all_run_results))
+    )
+    packed = _call_llm_with_retry(
+        prompt=PACKED_PROMPT_TEMPLATE.format(count=len(queries), tasks=tasks),
+        model=evaluator_config.model,
+        temperature=evaluator_config.temperature,
+        max_retries=max_retries,
+        rate_limiter=rate_limiter,
+        parse_response=_parse_packed_response,
+        cache=cache,
+    )
+
+    # Each query carries an even share of the call's usage
+    share = None
+    if "_metadata" in packed:
+        share = dict(packed["_metadata"], queries_per_call=len(queries))
+        share["cost"] = (share.get("cost") or 0.0) / len(queries)
+        for key in ("input_tokens", "output_tokens", "total_tokens"):
+            share[key] = (share.get(key) or 0) // len(queries)
+
+    results = []
+    for i, (query, run_results) in enumerate(zip(queries, all_run_results)):
+        names = list(run_results)
+        provider_a = names[0] if len(names) > 0 else "Provider A"
+        provider_b = names[1] if len(names) > 1 else "Provider B"
+
+        raw = packed.get("evaluations", {}).get(i)
+        if "error" in packed:
+            evaluation = dict(packed)
+        elif raw is None:
+            evaluation = {
+                "error": "Missing from packed response",
+                "winner": "unknown",
+                "reasoning": "Evaluation failed: missing from packed response",
+            }
+        else:
+            try:
+                evaluation = _normalize_evaluation(raw, provider_a, provider_b)
+                if share is not None:
+                    evaluation["_metadata"] = dict(share)
+            except Exception as e:
+                evaluation = {
+                    "error": str(e),
+                    "winner": "unknown",
+                    "reasoning": f"Evaluation failed: {e}",
+                }
+
+        results.append(
+            EvaluationResult(
+                query=query.text,
+                reference=query.reference,
+                run_results=run_results,
+                evaluation=evaluation,
+            )
+        )
+    return results
+
+
+def _parse_packed_response(content: str) -> dict[str, Any]:
+    """Parse the JSON array returned for a packed evaluation prompt.
+
+    Args:
+        content: Raw LLM response text
+
+    Returns:
+        Dict with "evaluations" mapping task id -> evaluation object
 
-            # Update progress
-            if "error" not in evaluation_result.evaluation:
-                successes += 1
+    Raises:
+        ValueError: If the response is not a JSON array of objects
+    """
+    import json
+
+    items = json.loads(_strip_code_fence(content))
+    if isinstance(items, dict) and len(items) == 1:
+        # Some models wrap the array in an object, e.g. {"evaluations": [...]}
+        (items,) = items.values()
+    if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+        raise ValueError("Packed evaluation response is not a JSON array of objects")
+
+    evaluations = {}
+    for item in items:
+        item = dict(item)
+        task_id = item.pop("id", None)
+        try:
+            evaluations.setdefault(int(task_id), item)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring packed evaluation with invalid id: {task_id!r}")
+    return {"evaluations": evaluations}
+
+
+def _evaluate_queries_batch(
+    runs,
+    queries,
+    evaluator_config: EvaluatorConfig,
+    progress_callback: Callable[[int, int, int, int], None] | None,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    timeout: float = BATCH_TIMEOUT,
+) -> list[EvaluationResult]:
+    """Evaluate all queries in one Anthropic Message Batch.
+
+    One batch request replaces a call per query: it is billed at the batch
+    discount and does not count against the synchronous rate limits, at the
+    cost of waiting for the batch to finish (usually minutes).
+
+    Args:
+        runs: List of Run objects
+        queries: List of Query objects
+        evaluator_config: Evaluator configuration (Claude model)
+        progress_callback: Optional progress callback
+        poll_interval: Seconds between batch status checks
+        timeout: Seconds to wait for the batch to end before cancelling it
+
+    Returns:
+        List of EvaluationResult objects (in same order as queries)
+
+    Raises:
+        ComparisonError: If the batch cannot be submitted or polled, or does
+            not end within timeout
+    """
+    import anthropic
+
+    model = evaluator_config.model.removeprefix("anthropic/")
+    run_indexes = _index_run_results(runs)
+    all_run_results = [_gather_run_results(run_indexes, query) for query in queries]
+
+    try:
+        client = anthropic.Anthropic()
+        batch = client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": f"q{i}",
+                    "params": {
+                        "model": model,
+                        "max_tokens": BATCH_MAX_TOKENS,
+                        "temperature": evaluator_config.temperature,
+                        "messages": [
+                            {
+                                "role": "user",
+                                "content": _format_evaluation_prompt(
+                                    query=query.text,
+                                    reference=query.reference,
+                                    run_results=run_results,
+                                    prompt_template=evaluator_config.prompt_template,
+                                ),
+                            }
+                        ],
+                    },
+                }
+                for i, (query, run_results) in enumerate(zip(queries, all_run_results))
+            ]
+        )
+        logger.info(f"Submitted evaluation batch {batch.id} ({len(queries)} requests)")
+
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                client.messages.batches.cancel(batch.id)
+                raise ComparisonError(
+                    f"Evaluation batch {batch.id} did not finish within "
+                    f"{timeout:g}s; cancelled it"
+                )
+            time.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+
+        entries = {
+            int(entry.custom_id[1:]): entry.result
+            for entry in client.messages.batches.results(batch.id)
+        }
+    except anthropic.APIError as e:
+        raise ComparisonError(f"Evaluation batch failed: {e}") from e
+
+    total = len(queries)
+    results = []
+    successes = 0
+    failures = 0
+
+    for i, (query, run_results) in enumerate(zip(queries, all_run_results)):
+        result = entries.get(i)
+        if result is not None and result.type == "succeeded":
+            message = result.message
+            content = "".join(
+                block.text for block in message.content if block.type == "text"
+            )
+            names = list(run_results)
+            provider_a = names[0] if len(names) > 0 else "Provider A"
+            provider_b = names[1] if len(names) > 1 else "Provider B"
+            try:
+                evaluation = _parse_evaluation_response(content, provider_a, provider_b)
+            except Exception as e:
+                evaluation = {
+                    "error": str(e),
+                    "winner": "unknown",
+                    "reasoning": f"Evaluation failed: {e}",
+                }
             else:
-                failures += 1
+                input_tokens = message.usage.input_tokens
+                output_tokens = message.usage.output_tokens
+                cost = calculate_llm_cost(model, input_tokens, output_tokens)
+                evaluation["_metadata"] = {
+                    "model": evaluator_config.model,
+                    "temperature": evaluator_config.temperature,
+                    "batch_id": batch.id,
+                    "cost": cost * BATCH_DISCOUNT if cost is not None else 0.0,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "total_tokens": input_tokens + output_tokens,
+                }
+        else:
+            status = result.type if result is not None else "missing"
+            evaluation = {
+                "error": f"Batch request {status}",
+                "winner": "unknown",
+                "reasoning": f"Evaluation failed: batch request {status}",
+            }
 
-            # Call progress callback
-            if progress_callback:
-                progress_callback(index + 1, total, successes, failures)
+        results.append(
+            EvaluationResult(
+                query=query.text,
+                reference=query.reference,
+                run_results=run_results,
+                evaluation=evaluation,
+            )
+        )
 
-    logger.info(f"Evaluation complete: {successes} successes, {failures} failures")
+        if "error" not in evaluation:
+            successes += 1
+        else:
+            failures += 1
+
+        if progress_callback:
+            progress_callback(i + 1, total, successes, failures)
+
+    logger.info(
+        f"Batch evaluation complete: {successes} successes, {failures} failures"
+    )
     return results
 
 
+def _index_run_results(runs) -> list[tuple[str, dict]]:
+    """Index each run's retrieved chunks by query text, once per comparison.
+
+    Args:
+        runs: List of Run objects
+
+    Returns:
+        List of (run label or ID, dict mapping query text -> list[RetrievedChunk])
+    """
+    run_indexes = []
+    for run in runs:
+        # Use label or ID as key to ensure uniqueness
+        key = run.label or str(run.id)
+
+        # Keep the first result for each query text
+        by_query = {}
+        for result in run.results:
+            by_query.setdefault(result.query, result.retrieved)
+        run_indexes.append((key, by_query))
+    return run_indexes
+
+
+def _gather_run_results(run_indexes, query) -> dict:
+    """Collect each run's retrieved chunks for a query, keyed by run label or ID.
+
+    Args:
+        run_indexes: Output of ``_index_run_results``
+        query: Query object
+
+    Returns:
+        Dict mapping run label (or ID) -> list[RetrievedChunk]
+    """
+    return {
+        key: by_query[query.text]
+        for key, by_query in run_indexes
+        if query.text in by_query
+    }
+
+
 def _evaluate_single_query(
     query: str,
     reference: str | None,
     run_results: dict,
     evaluator_config: EvaluatorConfig,
     max_retries: int,
+    rate_limiter: RateLimiter | None = None,
+    cache: SqliteCache | None = None,
 ) -> EvaluationResult:
     """Evaluate a single query using LLM.
 
@@ -464,6 +1111,8 @@ def _evaluate_single_query(
         run_results: Dict mapping system name -> list[RetrievedChunk]
         evaluator_config: Evaluator configuration
         max_retries: Maximum retries
+        rate_limiter: Optional limiter shared by all LLM calls
+        cache: Optional cache of LLM responses
 
     Returns:
         EvaluationResult with evaluation or error
@@ -489,6 +1138,8 @@ def _evaluate_single_query(
         max_retries=max_retries,
         provider_a=provider_a,
         provider_b=provider_b,
+        rate_limiter=rate_limiter,
+        cache=cache,
     )
 
     return EvaluationResult(
@@ -568,6 +1219,9 @@ def _call_llm_with_retry(
     max_retries: int,
     provider_a: str | None = None,
     provider_b: str | None = None,
+    rate_limiter: RateLimiter | None = None,
+    parse_response: Callable[[str], dict[str, Any]] | None = None,
+    cache: SqliteCache | None = None,
 ) -> dict[str, Any]:
     """Call LLM with retry logic and cost tracking.
 
@@ -578,13 +1232,53 @@ def _call_llm_with_retry(
         max_retries: Maximum retries
         provider_a: Name of first provider (for normalizing JSON keys)
         provider_b: Name of second provider (for normalizing JSON keys)
+        rate_limiter: Optional limiter to wait on before each attempt
+        parse_response: Optional parser for the response text, used instead of
+            ``_parse_evaluation_response``; a parse error triggers a retry
+        cache: Optional cache; a hit skips the call, and successfully parsed
+            responses are stored
 
     Returns:
         Dict with evaluation results and metadata (cost, tokens, etc.)
     """
+    import litellm
+
+    def parse(content: str) -> dict[str, Any]:
+        if parse_response is not None:
+            return parse_response(content)
+        return _parse_evaluation_response(content, provider_a, provider_b)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = prompt_hash(model, temperature, prompt)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            try:
+                evaluation = parse(cached)
+            except Exception as e:
+                logger.warning(f"Ignoring unparseable cached response: {e}")
+            else:
+                # Nothing was spent on this evaluation
+                evaluation["_metadata"] = {
+                    "model": model,
+                    "temperature": temperature,
+                    "duration_ms": 0.0,
+                    "cost": 0.0,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "total_tokens": 0,
+                    "cached": True,
+                }
+                logger.debug("LLM evaluation served from cache")
+                return evaluation
+
     for attempt in range(max_retries + 1):
         try:
-            start_time = time.time()
+            if rate_limiter is not None:
+                # Rough prompt-token estimate (~4 characters per token)
+                rate_limiter.acquire(tokens=len(prompt) // 4)
+
+            start_time = time.perf_counter()
 
             # Call LiteLLM
             response = litellm.completion(
@@ -593,7 +1287,10 @@ def _call_llm_with_retry(
                 temperature=temperature,
             )
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            if rate_limiter is not None:
+                rate_limiter.on_success()
 
             # Extract response
             content = response.choices[0].message.content
@@ -606,89 +1303,9 @@ def _call_llm_with_retry(
                 cost = 0.0
 
             # Parse response (JSON parsing with key normalization)
-            try:
-                import json
-                import re
-
-                # Clean up markdown code blocks if present
-                clean_content = content.strip()
-                if clean_content.startswith("```json"):
-                    clean_content = clean_content[7:]
-                elif clean_content.startswith("```"):
-                    clean_content = clean_content[3:]
-                if clean_content.endswith("```"):
-                    clean_content = clean_content[:-3]
-                clean_content = clean_content.strip()
-
-                raw_json = json.loads(clean_content)
-
-                # Normalize provider-specific keys to generic a/b keys
-                evaluation = {}
-                for key, value in raw_json.items():
-                    if provider_a and key == f"score_{provider_a}":
-                        evaluation["score_a"] = value
-                    elif provider_b and key == f"score_{provider_b}":
-                        evaluation["score_b"] = value
-                    elif key == "winner":
-                        # Normalize winner to a/b/tie
-                        winner_value = value.lower()
-                        if provider_a and provider_a.lower() in winner_value:
-                            evaluation["winner"] = "a"
-                        elif provider_b and provider_b.lower() in winner_value:
-                            evaluation["winner"] = "b"
-                        elif "tie" in winner_value:
-                            evaluation["winner"] = "tie"
-                        else:
-                            evaluation["winner"] = winner_value
-                    else:
-                        evaluation[key] = value
-            except json.JSONDecodeError:
-                # If not JSON, parse as text response
-                # Expected format with scores:
-                # Score A: 75
-                # Score B: 82
-                # Winner: B
-                # Reasoning: ...
-
-                import re
-
-                score_a = None
-                score_b = None
-                winner = "unknown"
-                reasoning = content
-
-                # Try to parse structured format
-                score_a_match = re.search(r"Score\s+A:\s*(\d+)", content, re.IGNORECASE)
-                score_b_match = re.search(r"Score\s+B:\s*(\d+)", content, re.IGNORECASE)
-                winner_match = re.search(r"Winner:\s*(A|B|tie)", content, re.IGNORECASE)
-                reasoning_match = re.search(
-                    r"Reasoning:\s*(.+)", content, re.IGNORECASE | re.DOTALL
-                )
-
-                if score_a_match:
-                    score_a = int(score_a_match.group(1))
-                if score_b_match:
-                    score_b = int(score_b_match.group(1))
-                if winner_match:
-                    winner = winner_match.group(1).lower()
-                if reasoning_match:
-                    reasoning = reasoning_match.group(1).strip()
-
-                # If structured format not found, try simple format
-                if winner == "unknown":
-                    lines = content.strip().split("\n", 1)
-                    first_line = lines[0].strip().upper()
-                    if first_line in ["A", "B", "TIE"]:
-                        winner = first_line.lower()
-                        reasoning = lines[1].strip() if len(lines) > 1 else content
-
-                evaluation = {
-                    "response": content,
-                    "score_a": score_a,
-                    "score_b": score_b,
-                    "winner": winner,
-                    "reasoning": reasoning,
-                }
+            evaluation = parse(content)
+            if cache is not None:
+                cache.put(cache_key, model, content)
 
             # Add metadata
             evaluation["_metadata"] = {
@@ -709,16 +1326,26 @@ def _call_llm_with_retry(
             return evaluation
 
         except Exception as e:
+            rate_limited = isinstance(e, litellm.RateLimitError)
+            if rate_limited and rate_limiter is not None:
+                rate_limiter.on_rate_limited()
+
             if attempt < max_retries:
-                # Exponential backoff: 2s, 4s, 8s
-                wait_time = 2**attempt
+                if rate_limited:
+                    # Quota windows are per minute; short retries just fail again
+                    wait_time = RATE_LIMIT_BACKOFF[
+                        min(attempt, len(RATE_LIMIT_BACKOFF) - 1)
+                    ]
+                else:
+                    # Exponential backoff: 2s, 4s, 8s
+                    wait_time = 2**attempt
                 logger.warning(
-                    f"LLM call failed (attempt {attempt+1}/{max_retries+1}): {e}. "
+                    f"LLM call failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
                     f"Retrying in {wait_time}s..."
                 )
                 time.sleep(wait_time)
             else:
-                logger.error(f"LLM call failed after {max_retries+1} attempts: {e}")
+                logger.error(f"LLM call failed after {max_retries + 1} attempts: {e}")
                 return {
                     "error": str(e),
                     "winner": "unknown",
@@ -731,3 +1358,123 @@ def _call_llm_with_retry(
         "winner": "unknown",
         "reasoning": "Evaluation failed after max retries",
     }
+
+
+def _strip_code_fence(content: str) -> str:
+    """Remove a surrounding markdown code block (```json ... ```) if present."""
+    clean_content = content.strip()
+    if clean_content.startswith("```json"):
+        clean_content = clean_content[7:]
+    elif clean_content.startswith("```"):
+        clean_content = clean_content[3:]
+    if clean_content.endswith("```"):
+        clean_content = clean_content[:-3]
+    return clean_content.strip()
+
+
+def _normalize_evaluation(
+    raw_json: dict[str, Any],
+    provider_a: str | None = None,
+    provider_b: str | None = None,
+) -> dict[str, Any]:
+    """Normalize provider-specific keys in a JSON evaluation to generic a/b keys.
+
+    Args:
+        raw_json: Evaluation object returned by the LLM
+        provider_a: Name of first provider
+        provider_b: Name of second provider
+
+    Returns:
+        Evaluation dict with score_a/score_b and winner normalized to a/b/tie
+    """
+    evaluation = {}
+    for key, value in raw_json.items():
+        if provider_a and key == f"score_{provider_a}":
+            evaluation["score_a"] = value
+        elif provider_b and key == f"score_{provider_b}":
+            evaluation["score_b"] = value
+        elif key == "winner":
+            # Normalize winner to a/b/tie
+            winner_value = value.lower()
+            if provider_a and provider_a.lower() in winner_value:
+                evaluation["winner"] = "a"
+            elif provider_b and provider_b.lower() in winner_value:
+                evaluation["winner"] = "b"
+            elif "tie" in winner_value:
+                evaluation["winner"] = "tie"
+            else:
+                evaluation["winner"] = winner_value
+        else:
+            evaluation[key] = value
+    return evaluation
+
+
+def _parse_evaluation_response(
+    content: str,
+    provider_a: str | None = None,
+    provider_b: str | None = None,
+) -> dict[str, Any]:
+    """Parse an LLM evaluation response into an evaluation dict.
+
+    Args:
+        content: Raw LLM response text (JSON, possibly fenced, or plain text)
+        provider_a: Name of first provider (for normalizing JSON keys)
+        provider_b: Name of second provider (for normalizing JSON keys)
+
+    Returns:
+        Dict with winner, reasoning and score_a/score_b where available
+    """
+    try:
+        import json
+
+        raw_json = json.loads(_strip_code_fence(content))
+        evaluation = _normalize_evaluation(raw_json, provider_a, provider_b)
+    except json.JSONDecodeError:
+        # If not JSON, parse as text response
+        # Expected format with scores:
+        # Score A: 75
+        # Score B: 82
+        # Winner: B
+        # Reasoning: ...
+
+        import re
+
+        score_a = None
+        score_b = None
+        winner = "unknown"
+        reasoning = content
+
+        # Try to parse structured format
+        score_a_match = re.search(r"Score\s+A:\s*(\d+)", content, re.IGNORECASE)
+        score_b_match = re.search(r"Score\s+B:\s*(\d+)", content, re.IGNORECASE)
+        winner_match = re.search(r"Winner:\s*(A|B|tie)", content, re.IGNORECASE)
+        reasoning_match = re.search(
+            r"Reasoning:\s*(.+)", content, re.IGNORECASE | re.DOTALL
+        )
+
+        if score_a_match:
+            score_a = int(score_a_match.group(1))
+        if score_b_match:
+            score_b = int(score_b_match.group(1))
+        if winner_match:
+            winner = winner_match.group(1).lower()
+        if reasoning_match:
+            reasoning = reasoning_match.group(1).strip()
+
+        # If structured format not found, try simple format
+        if winner == "unknown":
+            lines = content.strip().split("\n", 1)
+            first_line = lines[0].strip().upper()
+            if first_line in ["A", "B", "TIE"]:
+                winner = first_line.lower()
+                reasoning = lines[1].strip() if len(lines) > 1 else content
+
+        evaluation = {
+            "response": content,
+            "score_a": score_a,
+            "score_b": score_b,
+            "winner": winner,
+            "reasoning": reasoning,
+        }
+
+    return evaluation
@@ -0,0 +1,132 @@
+"""Client-side rate limiting for LLM evaluation calls.
+
+Evaluations run in a thread pool, so a large comparison can fire requests
+faster than the provider's per-minute quota and then spend most of its time
+in retry backoff after 429 responses. ``RateLimiter`` paces requests up front
+with token buckets for requests and (optionally) prompt tokens per minute, and
+adapts its request rate AIMD-style: halved on a rate-limit error, recovered
+one request per minute per success.
+
+Example:
+    >>> limiter = RateLimiter(requests_per_minute=50, tokens_per_minute=80_000)
+    >>> limiter.acquire(tokens=len(prompt) // 4)
+    >>> response = litellm.completion(...)
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Never throttle below one request per minute after repeated 429s
+MIN_REQUESTS_PER_MINUTE = 1.0
+
+
+class RateLimiter:
+    """Thread-safe token-bucket limiter for requests and tokens per minute.
+
+    Requests are spaced evenly (no bursts), while the token bucket holds up
+    to one minute of quota. ``acquire`` blocks until both allow the request.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the limiter with full buckets.
+
+        Args:
+            requests_per_minute: Maximum request rate
+            tokens_per_minute: Optional maximum prompt-token rate
+            clock: Monotonic clock in seconds (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+
+        Raises:
+            ValueError: If a rate is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError("tokens_per_minute must be positive")
+
+        self.max_requests_per_minute = float(requests_per_minute)
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._request_allowance = 1.0
+        self._token_allowance = float(tokens_per_minute or 0)
+        self._last_refill = clock()
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request of ``tokens`` prompt tokens may be sent.
+
+        Requests larger than a full minute of token quota are let through once
+        the token bucket is full rather than waiting forever.
+
+        Args:
+            tokens: Estimated prompt tokens for the request
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                token_cost = (
+                    min(tokens, self.tokens_per_minute) if self.tokens_per_minute else 0
+                )
+                if self._request_allowance >= 1 and self._token_allowance >= token_cost:
+                    self._request_allowance -= 1
+                    self._token_allowance -= token_cost
+                    return
+
+                # Time until both buckets have refilled enough
+                wait = (1 - self._request_allowance) * 60 / self.requests_per_minute
+                if token_cost:
+                    token_wait = (
+                        (token_cost - self._token_allowance)
+                        * 60
+                        / self.tokens_per_minute
+                    )
+                    wait = max(wait, token_wait)
+
+            self._sleep(max(wait, 0.0))
+
+    def on_success(self) -> None:
+        """Additively raise the request rate back toward its configured maximum."""
+        with self._lock:
+            self.requests_per_minute = min(
+                self.requests_per_minute + 1, self.max_requests_per_minute
+            )
+
+    def on_rate_limited(self) -> None:
+        """Halve the request rate after the provider rejected a request."""
+        with self._lock:
+            self.requests_per_minute = max(
+                self.requests_per_minute / 2, MIN_REQUESTS_PER_MINUTE
+            )
+            logger.warning(
+                f"Rate limited by LLM provider; pacing evaluations at "
+                f"{self.requests_per_minute:g} requests/min"
+            )
+
+    def _refill(self) -> None:
+        """Top up both buckets for the time elapsed since the last refill."""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        # Cap at one request so idle time never builds up a burst
+        self._request_allowance = min(
+            self._request_allowance + elapsed * self.requests_per_minute / 60, 1.0
+        )
+        if self.tokens_per_minute:
+            self._token_allowance = min(
+                self._token_allowance + elapsed * self.tokens_per_minute / 60,
+                self.tokens_per_minute,
+            )
@@ -5,21 +5,21 @@ against ground truth reference answers. Uses LLM to assess correctness,
 relevance, and quality of retrieved information.
 """
 
+import importlib.util
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable
 
-try:
-    from litellm import completion
-except ImportError:
-    completion = None
-
 from ..core.errors import ComparisonError
 from ..core.logging import get_logger
 from ..core.models import EvaluatorConfig, QueryResult, Run
 from ..core.storage import load_run
+from .evaluator import _validate_api_key
 
 logger = get_logger(__name__)
 
+# LiteLLM takes seconds to import; it is imported where completions are made
+LITELLM_AVAILABLE = importlib.util.find_spec("litellm") is not None
+
 
 def evaluate_result_against_reference(
     query: str,
@@ -47,10 +47,11 @@ def evaluate_result_against_reference(
     Raises:
         ComparisonError: If LiteLLM is not available or LLM call fails
     """
-    if completion is None:
+    if not LITELLM_AVAILABLE:
         raise ComparisonError(
             "LiteLLM is not installed. Install with: pip install litellm"
         )
+    from litellm import completion
 
     # Combine all retrieved chunks
     # Handle both Pydantic QueryResult and dict from JSON
@@ -148,7 +149,8 @@ def evaluate_run_threaded(
         - metadata: Evaluation metadata
 
     Raises:
-        ComparisonError: If run has no references or evaluation fails
+        ComparisonError: If run has no references, the evaluator model's API
+            key is not set, or evaluation fails
     """
     # Check that results have references
     results_with_refs = [result for result in run.results if result.reference]
@@ -163,35 +165,23 @@ def evaluate_run_threaded(
     if limit is not None and limit > 0:
         results_with_refs = results_with_refs[:limit]
 
+    # Fail once up front rather than once per query without an API key
+    _validate_api_key(evaluator_config.model)
+
     logger.info(
         f"Evaluating {len(results_with_refs)} results against references "
         f"(concurrency={concurrency})"
     )
 
-    # Track progress
-    completed = 0
-    successes = 0
-    failures = 0
-    evaluations = []
-
     def evaluate_one(result):
         """Evaluate a single result."""
-        nonlocal completed, successes, failures
-
         try:
             logger.info(f"Starting evaluation for query: {result.query[:50]}...")
             evaluation = evaluate_result_against_reference(
                 result.query, result.reference, result, evaluator_config
             )
-            completed += 1
-            successes += 1
             logger.info(f"Completed evaluation for query: {result.query[:50]}...")
 
-            if progress_callback:
-                progress_callback(
-                    completed, len(results_with_refs), successes, failures
-                )
-
             return {
                 "query": result.query,
                 "reference": result.reference,
@@ -199,17 +189,9 @@ def evaluate_run_threaded(
                 "status": "success",
             }
         except Exception as e:
-            completed += 1
-            failures += 1
             logger.error(
                 f"Evaluation failed for query '{result.query}': {e}", exc_info=True
             )
-
-            if progress_callback:
-                progress_callback(
-                    completed, len(results_with_refs), successes, failures
-                )
-
             logger.warning(f"Evaluation failed for query '{result.query}': {e}")
             return {
                 "query": result.query,
@@ -219,18 +201,12 @@ def evaluate_run_threaded(
                 "error": str(e),
             }
 
-    # Run evaluations concurrently using ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        # Submit all tasks
-        future_to_result = {
-            executor.submit(evaluate_one, result): result
-            for result in results_with_refs
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_result):
-            evaluation = future.result()
-            evaluations.append(evaluation)
+    # Run evaluations concurrently, keeping them in query order
+    evaluations = [None] * len(results_with_refs)
+    successes = _run_indexed(
+        evaluate_one, results_with_refs, evaluations, concurrency, progress_callback
+    )
+    failures = len(evaluations) - successes
 
     # Calculate summary statistics
     successful_evals = [e for e in evaluations if e["status"] == "success"]
@@ -275,6 +251,50 @@ def evaluate_run_threaded(
     }
 
 
+def _run_indexed(
+    task: Callable[[Any], dict[str, Any]],
+    items,
+    results: list,
+    concurrency: int,
+    progress_callback: Callable[[int, int, int, int], None] | None,
+) -> int:
+    """Run ``task`` over ``items`` on a thread pool, storing results in order.
+
+    Progress is counted here, on the calling thread, so worker threads never
+    update shared counters.
+
+    Args:
+        task: Returns a dict whose "status" is "success" or "failed"
+        items: Inputs, one per slot in ``results``
+        results: Pre-sized list that receives ``task(items[i])`` at index i
+        concurrency: Maximum concurrent tasks
+        progress_callback: Optional callback(current, total, successes, failures)
+
+    Returns:
+        Number of successful tasks
+    """
+    total = len(results)
+    completed = 0
+    successes = 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        future_to_index = {
+            executor.submit(task, item): i for i, item in enumerate(items)
+        }
+
+        for future in as_completed(future_to_index):
+            result = future.result()
+            results[future_to_index[future]] = result
+
+            completed += 1
+            if result["status"] == "success":
+                successes += 1
+            if progress_callback:
+                progress_callback(completed, total, successes, completed - successes)
+
+    return successes
+
+
 def evaluate_run(
     run_id: str,
     domain_name: str,
@@ -352,12 +372,14 @@ def compare_multiple_runs_batched(
         - metadata: Comparison metadata
 
     Raises:
-        ComparisonError: If runs don't have references or are from different query sets
+        ComparisonError: If runs don't have references, are from different query
+            sets, or the evaluator model's API key is not set
     """
-    if completion is None:
+    if not LITELLM_AVAILABLE:
         raise ComparisonError(
             "LiteLLM is not installed. Install with: pip install litellm"
         )
+    from litellm import completion
 
     if len(runs) < 2:
         raise ComparisonError("Need at least 2 runs to compare")
@@ -392,21 +414,25 @@ def compare_multiple_runs_batched(
     if limit is not None and limit > 0:
         queries_to_compare = min(limit, num_queries)
 
+    # Fail once up front rather than once per query without an API key
+    _validate_api_key(evaluator_config.model)
+
     logger.info(
         f"Comparing {len(runs)} runs on {queries_to_compare} queries "
         f"(concurrency={concurrency})"
     )
 
-    # Track progress
-    completed = 0
-    successes = 0
-    failures = 0
-    comparisons = []
+    # Per-run prompt pieces are identical for every query; build them once
+    run_headers = [
+        f"**{run.provider}** (Run: {run.label or str(run.id)[:8]}...):" for run in runs
+    ]
+    rankings_schema = ", ".join(
+        f'"{run.provider}": {{"rank": <1-{len(runs)}>, "score": <0-100>, "reasoning": "..."}}'
+        for run in runs
+    )
 
     def compare_one_query(query_index: int):
         """Compare all runs' results for a single query."""
-        nonlocal completed, successes, failures
-
         try:
             # Get results from all runs for this query
             query = runs[0].results[query_index].query
@@ -414,7 +440,7 @@ def compare_multiple_runs_batched(
 
             # Build comparison prompt with all runs' results
             runs_text = []
-            for _i, run in enumerate(runs):
+            for run_header, run in zip(run_headers, runs):
                 result = run.results[query_index]
                 chunks = result.retrieved
                 retrieved_text = "\n".join(
@@ -424,14 +450,11 @@ def compare_multiple_runs_batched(
                     ]
                 )
 
-                runs_text.append(
-                    f"**{run.provider}** (Run: {run.label or str(run.id)[:8]}...):\n{retrieved_text}"
-                )
+                runs_text.append(f"{run_header}\n{retrieved_text}")
 
             all_results = "\n\n".join(runs_text)
 
             # Create comparison prompt
-            provider_names = [run.provider for run in runs]
             prompt = f"""Compare the quality of retrieved information from {len(runs)} different RAG systems for answering the given query.
 
 Query: {query}
@@ -450,7 +473,7 @@ Please compare and rank these systems based on:
 Respond in JSON format:
 {{
   "rankings": {{
-    {", ".join([f'"{name}": {{"rank": <1-{len(runs)}>, "score": <0-100>, "reasoning": "..."}}'  for name in provider_names])}
+    {rankings_schema}
   }},
   "winner": "<provider_name>",
   "overall_reasoning": "<detailed comparison explanation>"
@@ -485,13 +508,8 @@ Note: Rank 1 is best, {len(runs)} is worst. Ties are allowed."""
                     ),
                 }
 
-            completed += 1
-            successes += 1
             logger.info(f"Completed comparison for query: {query[:50]}...")
 
-            if progress_callback:
-                progress_callback(completed, queries_to_compare, successes, failures)
-
             return {
                 "query": query,
                 "reference": reference,
@@ -500,15 +518,10 @@ Note: Rank 1 is best, {len(runs)} is worst. Ties are allowed."""
             }
 
         except Exception as e:
-            completed += 1
-            failures += 1
             logger.error(
                 f"Comparison failed for query index {query_index}: {e}", exc_info=True
             )
 
-            if progress_callback:
-                progress_callback(completed, queries_to_compare, successes, failures)
-
             return {
                 "query": runs[0].results[query_index].query
                 if query_index < len(runs[0].results)
@@ -521,17 +534,16 @@ Note: Rank 1 is best, {len(runs)} is worst. Ties are allowed."""
                 "error": str(e),
             }
 
-    # Run comparisons concurrently using ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        # Submit all tasks
-        future_to_index = {
-            executor.submit(compare_one_query, i): i for i in range(queries_to_compare)
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_index):
-            comparison = future.result()
-            comparisons.append(comparison)
+    # Run comparisons concurrently, keeping them in query order
+    comparisons = [None] * queries_to_compare
+    successes = _run_indexed(
+        compare_one_query,
+        range(queries_to_compare),
+        comparisons,
+        concurrency,
+        progress_callback,
+    )
+    failures = queries_to_compare - successes
 
     # Calculate summary statistics
     successful_comps = [c for c in comparisons if c["status"] == "success"]
@@ -0,0 +1,140 @@
+"""Persistent SQLite cache for LLM evaluation responses.
+
+Re-running a comparison (e.g. after a crash, or in CI) sends the exact same
+prompts to the evaluator again. With caching enabled in domain.yaml, responses
+are stored by a hash of (model, temperature, prompt), so repeat evaluations
+are answered from disk instead of paying for the call again.
+
+Example domain.yaml:
+    cache:
+      enabled: true
+      path: .cache/evaluations.sqlite  # relative to the domain directory
+      ttl_days: 30
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Optional faster JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    prompt_hash TEXT PRIMARY KEY,
+    model_name TEXT NOT NULL,
+    response_text TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    ttl_days REAL
+)
+"""
+
+
+def fingerprint(obj: Any) -> str:
+    """Hash a JSON-serializable value into a short, content-addressed key.
+
+    Keys need to be stable, not cryptographically strong, so this uses
+    BLAKE2b with a 128-bit digest. Keys are only guaranteed stable within one
+    install: the stdlib fallback matches orjson for strings, ints and most
+    floats, but writes very small or large floats differently (``1e-07`` vs
+    ``1e-7``), so adding or removing orjson can change some keys.
+
+    Args:
+        obj: JSON-serializable value (dict keys must be strings)
+
+    Returns:
+        32-character hex digest
+    """
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def prompt_hash(model: str, temperature: float, prompt: str) -> str:
+    """Compute the cache key for an LLM call.
+
+    Args:
+        model: Model name (LiteLLM format)
+        temperature: Sampling temperature
+        prompt: Full prompt text
+
+    Returns:
+        Hex digest identifying the call
+    """
+    return fingerprint({"model": model, "temperature": temperature, "prompt": prompt})
+
+
+class SqliteCache:
+    """Thread-safe on-disk cache of LLM response texts.
+
+    One connection is shared by all threads behind a lock; WAL mode lets
+    several processes read and write the same file.
+    """
+
+    def __init__(self, path: Path, ttl_days: float | None = None):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            ttl_days: Days before new entries expire (None = never)
+        """
+        self.path = Path(path)
+        self.ttl_days = ttl_days
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_text, created_at, ttl_days FROM llm_cache "
+                "WHERE prompt_hash = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            response_text, created_at, ttl_days = row
+            if ttl_days is not None and time.time() > created_at + ttl_days * 86400:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE prompt_hash = ?", (key,)
+                )
+                self._conn.commit()
+                return None
+            return response_text
+
+    def put(self, key: str, model_name: str, response_text: str) -> None:
+        """Store (or replace) the response for ``key``."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(prompt_hash, model_name, response_text, created_at, ttl_days) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model_name, response_text, time.time(), self.ttl_days),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
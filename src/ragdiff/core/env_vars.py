@@ -157,6 +157,64 @@ def validate_env_vars(value: Any, *, required_vars: set[str] | None = None) -> s
     return required_vars
 
 
+def resolve_env_vars(value: Any) -> Any:
+    """Check and substitute ${VAR_NAME} placeholders in a single pass.
+
+    Equivalent to ``check_required_vars`` followed by ``substitute_env_vars``
+    with ``resolve_secrets=True``, but walks the value and reads the
+    environment only once.
+
+    Args:
+        value: Value to process (str, dict, list, or primitive)
+
+    Returns:
+        Value with all placeholders substituted
+
+    Raises:
+        ConfigError: If any referenced variable is not set (all missing
+            variables are reported together)
+
+    Example:
+        >>> os.environ['API_KEY'] = 'secret123'
+        >>> resolve_env_vars({'api_key': '${API_KEY}', 'top_k': 5})
+        {'api_key': 'secret123', 'top_k': 5}
+    """
+    missing: set[str] = set()
+    resolved = _resolve_value(value, missing)
+
+    if missing:
+        raise ConfigError(
+            f"Missing required environment variables: {', '.join(sorted(missing))}. "
+            f"Set them in your environment or .env file."
+        )
+
+    return resolved
+
+
+def _resolve_value(value: Any, missing: set[str]) -> Any:
+    """Substitute placeholders recursively, collecting unset variable names."""
+    if isinstance(value, str):
+        # Most config strings have no placeholders; skip the regex for them
+        if "${" not in value:
+            return value
+
+        def replace_match(match: re.Match) -> str:
+            var_name = match.group(1)
+            resolved = os.environ.get(var_name)
+            if resolved is None:
+                missing.add(var_name)
+                return match.group(0)
+            return resolved
+
+        return ENV_VAR_PATTERN.sub(replace_match, value)
+    elif isinstance(value, dict):
+        return {k: _resolve_value(v, missing) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_resolve_value(item, missing) for item in value]
+    else:
+        return value
+
+
 def check_required_vars(value: Any) -> None:
     """Check that all ${VAR_NAME} placeholders can be resolved.
 
@@ -4,24 +4,37 @@ This module provides functions to load domains, systems, and query sets
 from the file system.
 """
 
+import copy
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import ValidationError
 
-from .env_vars import check_required_vars, substitute_env_vars
+from .env_vars import resolve_env_vars, substitute_env_vars
 from .errors import ConfigError
 from .logging import get_logger
 from .models import Domain, ProviderConfig, Query, QuerySet
 
 logger = get_logger(__name__)
 
+# libyaml's C loader parses several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load and parse a YAML file.
 
+    Parsed files are cached by (path, mtime, size), so loading the same
+    unchanged file again skips PyYAML. Each call returns a fresh copy that the
+    caller may modify.
+
     Args:
         path: Path to YAML file
 
@@ -32,13 +45,15 @@ def load_yaml(path: Path) -> dict[str, Any]:
         ConfigError: If file cannot be read or YAML is invalid
     """
     try:
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            if not isinstance(data, dict):
-                raise ConfigError(
-                    f"Invalid YAML in {path}: expected dictionary, got {type(data).__name__}"
-                )
-            return data
+        stat = os.stat(path)
+        data = _parse_yaml_cached(
+            str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        if not isinstance(data, dict):
+            raise ConfigError(
+                f"Invalid YAML in {path}: expected dictionary, got {type(data).__name__}"
+            )
+        return copy.deepcopy(data)
     except FileNotFoundError:
         raise ConfigError(f"Configuration file not found: {path}") from None
     except yaml.YAMLError as e:
@@ -47,6 +62,30 @@ def load_yaml(path: Path) -> dict[str, Any]:
         raise ConfigError(f"Failed to read {path}: {e}") from e
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime_ns and size only key the cache."""
+    with open(path, encoding="utf-8") as f:
+        return safe_load_yaml(f)
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """Parse YAML like ``yaml.safe_load``, using libyaml when PyYAML has it.
+
+    Args:
+        stream: YAML string or open text file
+
+    Returns:
+        Parsed YAML document
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML parses (e.g. after editing files within one tick)."""
+    _parse_yaml_cached.cache_clear()
+
+
 def load_domain(domain_name: str, domains_dir: Path = Path("domains")) -> Domain:
     """Load domain configuration from domains/<domain>/domain.yaml.
 
@@ -84,11 +123,9 @@ def load_domain(domain_name: str, domains_dir: Path = Path("domains")) -> Domain
         if "name" not in raw_data:
             raw_data["name"] = domain_name
 
-        # Validate all environment variables are set before substituting
-        check_required_vars(raw_data)
-
-        # Substitute environment variables (resolve secrets for runtime use)
-        resolved_data = substitute_env_vars(raw_data, resolve_secrets=True)
+        # Validate and substitute environment variables in one pass
+        # (resolve secrets for runtime use)
+        resolved_data = resolve_env_vars(raw_data)
 
         # Validate with Pydantic
         return Domain(**resolved_data)
@@ -137,11 +174,9 @@ def load_provider(
         if "name" not in raw_data:
             raw_data["name"] = provider_name
 
-        # Validate all environment variables are set
-        check_required_vars(raw_data)
-
-        # Substitute environment variables (resolve secrets for runtime use)
-        resolved_data = substitute_env_vars(raw_data, resolve_secrets=True)
+        # Validate and substitute environment variables in one pass
+        # (resolve secrets for runtime use)
+        resolved_data = resolve_env_vars(raw_data)
 
         # Validate with Pydantic
         return ProviderConfig(**resolved_data)
@@ -202,6 +237,38 @@ def load_provider_for_snapshot(
         ) from e
 
 
+def resolve_provider_secrets(snapshot: ProviderConfig) -> ProviderConfig:
+    """Resolve ${VAR_NAME} placeholders in an already-loaded provider config.
+
+    Equivalent to calling ``load_provider`` for the same file, but reuses the
+    snapshot instead of reading and parsing the YAML a second time.
+
+    Args:
+        snapshot: ProviderConfig from ``load_provider_for_snapshot``
+
+    Returns:
+        New ProviderConfig with secrets resolved (the snapshot is unchanged)
+
+    Raises:
+        ConfigError: If any referenced variable is not set
+
+    Example:
+        >>> snapshot = load_provider_for_snapshot("tafsir", "vectara-default")
+        >>> provider = resolve_provider_secrets(snapshot)
+        >>> print(provider.config['api_key'])
+        'sk-...'
+    """
+    # name is validated as alphanumeric, so it can never hold a placeholder
+    resolved = resolve_env_vars(
+        {
+            "tool": snapshot.tool,
+            "config": snapshot.config,
+            "metadata": snapshot.metadata,
+        }
+    )
+    return snapshot.model_copy(update=resolved)
+
+
 def load_query_set(
     domain_name: str, query_set_name: str, domains_dir: Path = Path("domains")
 ) -> QuerySet:
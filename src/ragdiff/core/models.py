@@ -69,15 +69,26 @@ class Query(BaseModel):
 # Configuration Models
 # ============================================================================
 
+# Default LLM for evaluation and provider generation
+DEFAULT_LLM_MODEL = "claude-3-5-sonnet-20241022"
+
 
 class EvaluatorConfig(BaseModel):
     """LLM evaluator configuration for comparisons."""
 
-    model: str = "claude-3-5-sonnet-20241022"
+    model: str = DEFAULT_LLM_MODEL
     temperature: float = 0.0
     prompt_template: str
 
 
+class CacheConfig(BaseModel):
+    """On-disk cache for LLM evaluation responses (disabled by default)."""
+
+    enabled: bool = False
+    path: str = ".cache/evaluations.sqlite"  # relative to the domain directory
+    ttl_days: float | None = None  # None = entries never expire
+
+
 class Domain(BaseModel):
     """Domain configuration (loaded from domains/<domain>/domain.yaml)."""
 
@@ -86,6 +97,7 @@ class Domain(BaseModel):
     variables: dict[str, Any] = Field(default_factory=dict)
     secrets: dict[str, str] = Field(default_factory=dict)  # env var names
     evaluator: EvaluatorConfig
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
     @field_validator("name")
@@ -1,10 +1,8 @@
 """Pricing utilities for RAGDiff."""
 
+from functools import lru_cache
 from typing import Optional
 
-import litellm
-import tiktoken
-
 # Pricing constants (USD per 1M tokens)
 # Updated: Nov 2025 (Estimated based on search results)
 
@@ -38,15 +36,23 @@ ANTHROPIC_PRICING = {
     "claude-3-haiku-20240307": {"input": 0.25, "output": 1.25},
 }
 
+# Checked in order; the first table with a matching key wins
+_PRICING_TABLES = (GEMINI_PRICING, OPENAI_PRICING, ANTHROPIC_PRICING)
+
 
 def count_tokens(model: str, text: str) -> int:
     """Count tokens in a text using LiteLLM (or tiktoken for OpenAI fallback)."""
     try:
-        # Use litellm.encode for broader model support
+        # Use litellm.encode for broader model support (imported here because
+        # importing litellm takes seconds and most callers never need it)
+        import litellm
+
         return len(litellm.encode(model=model, text=text))
     except Exception:
         # Fallback to tiktoken for OpenAI models if litellm fails or not available
         if model.startswith("gpt") or model.startswith("text-davinci"):
+            import tiktoken
+
             try:
                 encoding = tiktoken.encoding_for_model(model)
                 return len(encoding.encode(text))
@@ -71,31 +77,7 @@ def calculate_llm_cost(
     Returns:
         Estimated cost in USD, or None if model pricing is unknown.
     """
-    # Normalize model string (handle prefixes like "models/")
-    clean_model = model.lower().replace("models/", "")
-
-    # Check providers
-    pricing = None
-
-    # Check Gemini
-    for k, v in GEMINI_PRICING.items():
-        if k in clean_model:  # Prefix match or exact match
-            pricing = v
-            break
-
-    if not pricing:
-        # Check OpenAI
-        for k, v in OPENAI_PRICING.items():
-            if k in clean_model:
-                pricing = v
-                break
-
-    if not pricing:
-        # Check Anthropic
-        for k, v in ANTHROPIC_PRICING.items():
-            if k in clean_model:
-                pricing = v
-                break
+    pricing = _lookup_pricing(model)
 
     if pricing:
         input_cost = (input_tokens / 1_000_000) * pricing["input"]
@@ -103,3 +85,21 @@ def calculate_llm_cost(
         return input_cost + output_cost
 
     return None
+
+
+@lru_cache(maxsize=128)
+def _lookup_pricing(model: str) -> Optional[dict[str, float]]:
+    """Find the pricing entry for a model name.
+
+    A run only ever sees a handful of model names, so the substring scan is
+    cached per name instead of repeated for every query.
+    """
+    # Normalize model string (handle prefixes like "models/")
+    clean_model = model.lower().replace("models/", "")
+
+    for table in _PRICING_TABLES:
+        for k, v in table.items():
+            if k in clean_model:  # Prefix match or exact match
+                return v
+
+    return None
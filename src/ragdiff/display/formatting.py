@@ -100,6 +100,9 @@ def format_comparison_markdown(
         else comparison.evaluations[:max_evaluations]
     )
 
+    # Provider names for mapping 'a'/'b' back, built once rather than per evaluation
+    provider_names = tuple(provider_stats or ())
+
     # Add individual evaluations
     for i, eval_result in enumerate(evaluations_to_show, 1):
         lines.append(f"### {i}. {eval_result.query}")
@@ -115,10 +118,10 @@ def format_comparison_markdown(
             winner_key = evaluation.get("winner", "unknown")
             # Map 'a', 'b' back to provider names if possible
             winner_display = winner_key
-            if winner_key == "a" and len(provider_stats) >= 1:
-                winner_display = list(provider_stats.keys())[0]
-            elif winner_key == "b" and len(provider_stats) >= 2:
-                winner_display = list(provider_stats.keys())[1]
+            if winner_key == "a" and len(provider_names) >= 1:
+                winner_display = provider_names[0]
+            elif winner_key == "b" and len(provider_names) >= 2:
+                winner_display = provider_names[1]
 
             lines.append(f"**Winner:** {winner_display}")
             lines.append("")
@@ -133,10 +136,10 @@ def format_comparison_markdown(
         for key in sorted(score_keys):
             if evaluation[key] is not None:
                 # Extract provider name from key
-                if key == "score_a" and len(provider_stats) >= 1:
-                    provider_name = list(provider_stats.keys())[0]
-                elif key == "score_b" and len(provider_stats) >= 2:
-                    provider_name = list(provider_stats.keys())[1]
+                if key == "score_a" and len(provider_names) >= 1:
+                    provider_name = provider_names[0]
+                elif key == "score_b" and len(provider_names) >= 2:
+                    provider_name = provider_names[1]
                 else:
                     provider_name = key.replace("score_", "")
 
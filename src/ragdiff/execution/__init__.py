@@ -4,6 +4,7 @@ This module provides the execution engine for running query sets against systems
 
 Public API:
     - execute_run: Execute a query set against a system
+    - iter_query_results: Yield query results as they complete, without a Run
 
 Example:
     >>> from ragdiff.execution import execute_run
@@ -17,6 +18,6 @@ Example:
     >>> print(f"Status: {run.status}, Results: {len(run.results)}")
 """
 
-from .executor import execute_run
+from .executor import execute_run, iter_query_results
 
-__all__ = ["execute_run"]
+__all__ = ["execute_run", "iter_query_results"]
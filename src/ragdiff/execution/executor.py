@@ -4,10 +4,12 @@ This module executes query sets against providers and saves the results as Runs.
 
 Key features:
 - Parallel query execution with configurable concurrency
+- Optional asyncio execution for providers with async search
 - Per-query error handling (don't crash entire run)
 - Config snapshotting (preserves ${VAR_NAME} for security)
 - Run state management (pending → running → completed/failed/partial)
 - Progress reporting callbacks
+- Streaming results as they complete (iter_query_results)
 - Atomic file writes
 
 Example:
@@ -20,7 +22,9 @@ Example:
     >>> print(f"Run {run.id}: {run.status}, {len(run.results)} queries")
 """
 
+import asyncio
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
@@ -28,11 +32,17 @@ from typing import Callable, Union
 from uuid import uuid4
 
 from ..core.errors import RunError
-from ..core.loaders import load_domain, load_provider_for_snapshot, load_query_set
+from ..core.loaders import (
+    load_domain,
+    load_provider_for_snapshot,
+    load_query_set,
+    resolve_provider_secrets,
+)
 from ..core.logging import get_logger
 from ..core.models import (
     Domain,
     ProviderConfig,
+    Query,
     QueryResult,
     QuerySet,
     Run,
@@ -40,7 +50,8 @@ from ..core.models import (
     SearchResult,
 )
 from ..core.storage import save_run
-from ..providers import create_provider
+from ..providers import Provider, create_provider, get_cached_provider
+from ..providers.factory import _close_provider
 
 logger = get_logger(__name__)
 
@@ -58,6 +69,8 @@ def execute_run(
     per_query_timeout: float = 30.0,
     progress_callback: ProgressCallback | None = None,
     domains_dir: Path = Path("domains"),
+    use_async: bool = False,
+    reuse_provider: bool = False,
 ) -> Run:
     """Execute a query set against a system and save the run.
 
@@ -79,12 +92,18 @@ def execute_run(
         per_query_timeout: Timeout per query in seconds (default: 30.0)
         progress_callback: Optional callback for progress updates
         domains_dir: Root directory containing all domains (only used for string parameters)
+        use_async: Run queries on one event loop via the provider's ``asearch``
+            when it has one, enforcing per_query_timeout (default: False)
+        reuse_provider: Share the provider instance with earlier runs that used
+            an identical config (see ``get_cached_provider``), skipping client
+            setup on repeated runs in one process (default: False)
 
     Returns:
         Completed Run object with all results
 
     Raises:
-        RunError: If provider initialization fails or run cannot be saved
+        RunError: If arguments are invalid, provider initialization fails or
+            run cannot be saved
 
     Examples:
         File-based (existing usage):
@@ -108,6 +127,12 @@ def execute_run(
         f"concurrency={concurrency}"
     )
 
+    # Reject bad arguments before loading configs or creating the provider
+    if concurrency < 1:
+        raise RunError(f"concurrency must be at least 1 (got {concurrency})")
+    if per_query_timeout <= 0:
+        raise RunError(f"per_query_timeout must be positive (got {per_query_timeout})")
+
     run_id = uuid4()
     started_at = datetime.now(timezone.utc)
 
@@ -143,10 +168,10 @@ def execute_run(
             provider_name = provider
             logger.debug("Loaded provider config snapshot (secrets preserved)")
 
-            # Load provider config WITH resolved secrets for creating instance
-            from ..core.loaders import load_provider
-
-            provider_config_resolved = load_provider(domain_name, provider, domains_dir)
+            # Resolve secrets from the snapshot for creating the instance
+            provider_config_resolved = resolve_provider_secrets(
+                provider_config_snapshot
+            )
         else:
             # Use provided ProviderConfig object
             provider_config_snapshot = provider
@@ -174,7 +199,10 @@ def execute_run(
             )
 
         # Create Provider instance (resolves ${VAR_NAME})
-        provider_instance = create_provider(provider_config_resolved)
+        if reuse_provider:
+            provider_instance = get_cached_provider(provider_config_resolved)
+        else:
+            provider_instance = create_provider(provider_config_resolved)
         logger.info(f"Created provider instance: {provider_instance}")
 
     except Exception as e:
@@ -211,14 +239,30 @@ def execute_run(
     run.status = RunStatus.RUNNING
     logger.info(f"Run {run_id} status: RUNNING")
 
-    # Execute queries in parallel
-    results = _execute_queries_parallel(
-        provider_instance=provider_instance,
-        queries=query_set_obj.queries,
-        concurrency=concurrency,
-        per_query_timeout=per_query_timeout,
-        progress_callback=progress_callback,
-    )
+    # Execute queries in parallel, then release the provider unless it is
+    # shared with later runs
+    try:
+        if use_async and getattr(provider_instance, "asearch", None) is not None:
+            results = asyncio.run(
+                _execute_queries_async(
+                    provider_instance=provider_instance,
+                    queries=query_set_obj.queries,
+                    concurrency=concurrency,
+                    per_query_timeout=per_query_timeout,
+                    progress_callback=progress_callback,
+                )
+            )
+        else:
+            results = _execute_queries_parallel(
+                provider_instance=provider_instance,
+                queries=query_set_obj.queries,
+                concurrency=concurrency,
+                per_query_timeout=per_query_timeout,
+                progress_callback=progress_callback,
+            )
+    finally:
+        if not reuse_provider:
+            _close_provider(provider_instance)
 
     # Update run with results
     run.results = results
@@ -266,6 +310,55 @@ def execute_run(
     return run
 
 
+def iter_query_results(
+    provider_instance: Provider,
+    queries: list[Query],
+    concurrency: int = 10,
+    per_query_timeout: float = 30.0,
+) -> Iterator[tuple[int, QueryResult]]:
+    """Run queries on a thread pool, yielding each result as it completes.
+
+    Unlike ``execute_run``, results are not collected into a Run, so a caller
+    that writes each one out (e.g. to JSONL) holds only the in-flight ones.
+    Queries not yet started are cancelled if the caller stops iterating early.
+
+    Args:
+        provider_instance: Provider to search with
+        queries: Queries to run
+        concurrency: Maximum number of concurrent queries (default: 10)
+        per_query_timeout: Timeout per query in seconds (default: 30.0)
+
+    Yields:
+        (index into ``queries``, QueryResult) tuples in completion order.
+        Query errors are reported in ``QueryResult.error``, never raised.
+
+    Example:
+        >>> provider = create_provider(load_provider("tafsir", "vectara-default"))
+        >>> for i, result in iter_query_results(provider, query_set.queries):
+        ...     out.write(result.model_dump_json() + "\\n")
+    """
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        future_to_index = {
+            executor.submit(
+                _execute_single_query,
+                provider_instance,
+                query.text,
+                query.reference,
+                per_query_timeout,
+            ): i
+            for i, query in enumerate(queries)
+        }
+
+        for future in as_completed(future_to_index):
+            # Drop our reference so the result can be freed once yielded
+            index = future_to_index.pop(future)
+            # This won't raise since we catch in _execute_single_query
+            yield index, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _execute_queries_parallel(
     provider_instance,
     queries,
@@ -292,39 +385,81 @@ def _execute_queries_parallel(
 
     logger.info(f"Executing {total} queries with concurrency={concurrency}")
 
-    # Create thread pool
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        # Submit all queries
-        future_to_index = {}
-        for i, query in enumerate(queries):
-            future = executor.submit(
-                _execute_single_query,
-                provider_instance,
-                query.text,
-                query.reference,
-                per_query_timeout,
+    for index, query_result in iter_query_results(
+        provider_instance, queries, concurrency, per_query_timeout
+    ):
+        # Store result
+        results[index] = query_result
+
+        # Update progress
+        if query_result.error is None:
+            successes += 1
+        else:
+            failures += 1
+
+        # Call progress callback
+        if progress_callback:
+            progress_callback(index + 1, total, successes, failures)
+
+    logger.info(f"Query execution complete: {successes} successes, {failures} failures")
+    return results
+
+
+async def _execute_queries_async(
+    provider_instance,
+    queries,
+    concurrency: int,
+    per_query_timeout: float,
+    progress_callback: ProgressCallback | None,
+) -> list[QueryResult]:
+    """Execute queries concurrently on the running event loop.
+
+    At most ``concurrency`` searches are in flight at once. Unlike the thread
+    pool path, per_query_timeout is enforced here.
+
+    Args:
+        provider_instance: Provider with an ``asearch`` coroutine method
+        queries: List of Query objects
+        concurrency: Maximum number of concurrent queries
+        per_query_timeout: Timeout per query in seconds
+        progress_callback: Optional progress callback
+
+    Returns:
+        List of QueryResult objects (same order as input queries)
+    """
+    total = len(queries)
+    results = [None] * total
+    successes = 0
+    failures = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_query(index: int, query) -> tuple[int, QueryResult]:
+        async with semaphore:
+            return index, await _aexecute_single_query(
+                provider_instance, query.text, query.reference, per_query_timeout
             )
-            future_to_index[future] = i
 
-        # Process completed queries
-        for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            query_result = (
-                future.result()
-            )  # This won't raise since we catch in _execute_single_query
+    logger.info(f"Executing {total} queries asynchronously, concurrency={concurrency}")
 
-            # Store result
+    try:
+        for next_done in asyncio.as_completed(
+            [run_query(i, query) for i, query in enumerate(queries)]
+        ):
+            index, query_result = await next_done
             results[index] = query_result
 
-            # Update progress
             if query_result.error is None:
                 successes += 1
             else:
                 failures += 1
 
-            # Call progress callback
             if progress_callback:
                 progress_callback(index + 1, total, successes, failures)
+    finally:
+        # Async clients are bound to this loop, which asyncio.run closes next
+        aclose = getattr(provider_instance, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
     logger.info(f"Query execution complete: {successes} successes, {failures} failures")
     return results
@@ -347,7 +482,7 @@ def _execute_single_query(
     Returns:
         QueryResult with results or error
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         # Execute search with timeout
@@ -355,33 +490,11 @@ def _execute_single_query(
         # so we rely on the system's internal timeout or HTTP client timeout
         result = provider_instance.search(query_text, top_k=5)
 
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Handle both list (legacy) and SearchResult (new) return types
-        if isinstance(result, SearchResult):
-            retrieved = result.chunks
-            cost = result.cost
-            total_tokens_returned = result.total_tokens_returned
-        else:
-            # Legacy behavior: provider returns list of RetrievedChunk
-            retrieved = result
-            cost = None
-            total_tokens_returned = sum(
-                c.token_count for c in retrieved if c.token_count is not None
-            )
-
-        return QueryResult(
-            query=query_text,
-            retrieved=retrieved,
-            reference=reference,
-            duration_ms=duration_ms,
-            cost=cost,
-            total_tokens_returned=total_tokens_returned,
-            error=None,
-        )
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        return _to_query_result(result, query_text, reference, duration_ms)
 
     except Exception as e:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         logger.warning(f"Query failed: '{query_text[:50]}...' - {e}")
 
@@ -392,3 +505,74 @@ def _execute_single_query(
             duration_ms=duration_ms,
             error=str(e),
         )
+
+
+async def _aexecute_single_query(
+    provider_instance,
+    query_text: str,
+    reference: str | None,
+    timeout: float,
+) -> QueryResult:
+    """Async counterpart of _execute_single_query, with the timeout enforced.
+
+    Args:
+        provider_instance: Provider with an ``asearch`` coroutine method
+        query_text: Query text
+        reference: Optional reference answer
+        timeout: Timeout in seconds
+
+    Returns:
+        QueryResult with results or error
+    """
+    start_time = time.perf_counter()
+
+    try:
+        result = await asyncio.wait_for(
+            provider_instance.asearch(query_text, top_k=5), timeout
+        )
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        return _to_query_result(result, query_text, reference, duration_ms)
+
+    except asyncio.TimeoutError:
+        error = f"Query timed out after {timeout}s"
+    except Exception as e:
+        error = str(e)
+
+    duration_ms = (time.perf_counter() - start_time) * 1000
+    logger.warning(f"Query failed: '{query_text[:50]}...' - {error}")
+
+    return QueryResult(
+        query=query_text,
+        retrieved=[],
+        reference=reference,
+        duration_ms=duration_ms,
+        error=error,
+    )
+
+
+def _to_query_result(
+    result, query_text: str, reference: str | None, duration_ms: float
+) -> QueryResult:
+    """Build a successful QueryResult from a provider search result."""
+    # Handle both list (legacy) and SearchResult (new) return types
+    if isinstance(result, SearchResult):
+        retrieved = result.chunks
+        cost = result.cost
+        total_tokens_returned = result.total_tokens_returned
+    else:
+        # Legacy behavior: provider returns list of RetrievedChunk
+        retrieved = result
+        cost = None
+        total_tokens_returned = sum(
+            c.token_count for c in retrieved if c.token_count is not None
+        )
+
+    return QueryResult(
+        query=query_text,
+        retrieved=retrieved,
+        reference=reference,
+        duration_ms=duration_ms,
+        cost=cost,
+        total_tokens_returned=total_tokens_returned,
+        error=None,
+    )
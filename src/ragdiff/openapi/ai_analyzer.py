@@ -11,6 +11,7 @@ from typing import Any
 from litellm import completion
 
 from ..core.errors import ConfigurationError
+from ..core.models import DEFAULT_LLM_MODEL
 from .models import EndpointInfo
 
 logger = logging.getLogger(__name__)
@@ -29,7 +30,7 @@ class AIAnalyzer:
     - etc.
     """
 
-    def __init__(self, model: str = "claude-3-5-sonnet-20241022"):
+    def __init__(self, model: str = DEFAULT_LLM_MODEL):
         """Initialize AI analyzer.
 
         Args:
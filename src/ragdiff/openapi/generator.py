@@ -9,6 +9,7 @@ from typing import Any, Optional
 import requests
 
 from ..core.errors import ConfigError, RunError
+from ..core.models import DEFAULT_LLM_MODEL
 from ..providers.openapi import OpenAPIProvider
 from .ai_analyzer import AIAnalyzer
 from .parser import OpenAPISpec
@@ -28,7 +29,7 @@ class ConfigGenerator:
     6. Validate config
     """
 
-    def __init__(self, model: str = "claude-3-5-sonnet-20241022"):
+    def __init__(self, model: str = DEFAULT_LLM_MODEL):
         """Initialize config generator.
 
         Args:
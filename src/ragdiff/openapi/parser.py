@@ -5,17 +5,40 @@ Fetches and parses OpenAPI 3.x specifications from URLs or files.
 
 import json
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import requests
-import yaml
 
 from ..core.errors import ConfigurationError
+from ..core.loaders import safe_load_yaml
 from .models import AuthScheme, EndpointInfo, OpenAPIInfo
 
 logger = logging.getLogger(__name__)
 
+# Only OpenAPI 3.x specs are supported; any minor/patch release is accepted
+SUPPORTED_OPENAPI_MAJOR = 3
+
+_SEMVER_PATTERN = re.compile(r"(\d+)\.(\d+)(?:\.(\d+))?")
+
+
+@lru_cache(maxsize=128)
+def _parse_semver(version: str) -> Optional[tuple[int, int, int]]:
+    """Parse a "major.minor[.patch]" version into an int tuple.
+
+    Pre-release and build suffixes (``3.1.0-rc1``) are ignored.
+
+    Returns:
+        (major, minor, patch) tuple, or None if the string is not a version
+    """
+    match = _SEMVER_PATTERN.match(version)
+    if match is None:
+        return None
+    major, minor, patch = match.groups()
+    return int(major), int(minor), int(patch or 0)
+
 
 class OpenAPISpec:
     """Parsed OpenAPI specification.
@@ -47,9 +70,11 @@ class OpenAPISpec:
         """
         self.spec = spec_dict
 
-        # Validate OpenAPI version
-        openapi_version = spec_dict.get("openapi", "")
-        if not openapi_version.startswith("3."):
+        # Validate OpenAPI version. YAML reads an unquoted "3.0" as a float,
+        # so normalize to a string before parsing.
+        openapi_version = str(spec_dict.get("openapi", ""))
+        parsed = _parse_semver(openapi_version)
+        if parsed is None or parsed[0] != SUPPORTED_OPENAPI_MAJOR:
             raise ConfigurationError(
                 f"Unsupported OpenAPI version: {openapi_version}. "
                 "Only OpenAPI 3.x is supported."
@@ -82,7 +107,9 @@ class OpenAPISpec:
             response = requests.get(url, timeout=timeout)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            raise ConfigurationError(f"Failed to fetch OpenAPI spec from {url}: {e}") from e
+            raise ConfigurationError(
+                f"Failed to fetch OpenAPI spec from {url}: {e}"
+            ) from e
 
         # Determine format (JSON or YAML) from content-type or URL
         content_type = response.headers.get("content-type", "").lower()
@@ -91,13 +118,13 @@ class OpenAPISpec:
             if "json" in content_type or url.endswith(".json"):
                 spec_dict = response.json()
             elif "yaml" in content_type or url.endswith((".yaml", ".yml")):
-                spec_dict = yaml.safe_load(response.text)
+                spec_dict = safe_load_yaml(response.text)
             else:
                 # Try JSON first, fallback to YAML
                 try:
                     spec_dict = response.json()
                 except json.JSONDecodeError:
-                    spec_dict = yaml.safe_load(response.text)
+                    spec_dict = safe_load_yaml(response.text)
 
         except Exception as e:
             raise ConfigurationError(f"Failed to parse OpenAPI spec: {e}") from e
@@ -131,16 +158,18 @@ class OpenAPISpec:
             if path_obj.suffix == ".json":
                 spec_dict = json.loads(content)
             elif path_obj.suffix in (".yaml", ".yml"):
-                spec_dict = yaml.safe_load(content)
+                spec_dict = safe_load_yaml(content)
             else:
                 # Try JSON first, fallback to YAML
                 try:
                     spec_dict = json.loads(content)
                 except json.JSONDecodeError:
-                    spec_dict = yaml.safe_load(content)
+                    spec_dict = safe_load_yaml(content)
 
         except Exception as e:
-            raise ConfigurationError(f"Failed to parse OpenAPI spec from {path}: {e}") from e
+            raise ConfigurationError(
+                f"Failed to parse OpenAPI spec from {path}: {e}"
+            ) from e
 
         return cls(spec_dict)
 
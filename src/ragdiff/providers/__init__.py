@@ -9,6 +9,8 @@ Public API:
     - register_tool: Register a tool in the registry
     - get_tool: Get a tool class from the registry
     - list_tools: List all registered tools
+    - search_across: Query several providers concurrently
+    - asearch_across: Async variant of search_across
 
 Example:
     >>> from ragdiff.providers import create_provider
@@ -34,7 +36,13 @@ from . import (
     vectara,
 )  # noqa: F401
 from .abc import Provider
-from .factory import create_provider, validate_provider_config
+from .factory import (
+    clear_provider_cache,
+    create_provider,
+    get_cached_provider,
+    validate_provider_config,
+)
+from .parallel import asearch_across, create_providers, search_across
 from .registry import get_tool, is_tool_registered, list_tools, register_tool
 
 __all__ = [
@@ -42,7 +50,13 @@ __all__ = [
     "Provider",
     # Factory
     "create_provider",
+    "get_cached_provider",
+    "clear_provider_cache",
     "validate_provider_config",
+    # Concurrency
+    "create_providers",
+    "search_across",
+    "asearch_across",
     # Registry
     "register_tool",
     "get_tool",
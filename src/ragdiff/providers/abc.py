@@ -33,6 +33,11 @@ class Provider(ABC):
         underlying client is not thread-safe, use locks or create per-query
         clients.
 
+    Resources:
+        Create connection pools (e.g. a ``requests.Session``) once in
+        ``__init__`` so every query reuses kept-alive connections, and release
+        them in ``close()``.
+
     Attributes:
         config: Dictionary of provider-specific configuration (API keys, endpoints, etc.)
 
@@ -101,6 +106,23 @@ class Provider(ABC):
         """
         pass
 
+    def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release resources held by the provider (connections, threads, etc.).
+
+        The default does nothing. Providers holding pooled HTTP sessions,
+        database clients or background threads override it. ``execute_run``
+        calls it once the run no longer needs the provider. Providers also
+        work as context managers that close on exit.
+        """
+
+    def __enter__(self) -> "Provider":
+        """Return the provider for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the provider when leaving a ``with`` block."""
+        self.close()
+
     def __repr__(self) -> str:
         """String representation of the provider."""
         return f"{self.__class__.__name__}()"
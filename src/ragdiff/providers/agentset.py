@@ -18,16 +18,16 @@ Example:
     >>> chunks = system.search("What is Islamic law?", top_k=5)
 """
 
-from typing import Any
-
-from agentset import Agentset
-from agentset.models.searchop import SearchData
+from typing import TYPE_CHECKING, Any
 
 from ..core.errors import ConfigError, RunError
 from ..core.logging import get_logger
 from ..core.models import RetrievedChunk
 from .abc import Provider
 
+if TYPE_CHECKING:
+    from agentset.models.searchop import SearchData
+
 logger = get_logger(__name__)
 
 
@@ -67,6 +67,9 @@ class AgentsetProvider(Provider):
         self.rerank = config.get("rerank", True)
         self.timeout = config.get("timeout", 60)
 
+        # Imported here: the SDK is slow to import and only needed once used
+        from agentset import Agentset
+
         # Initialize Agentset client
         try:
             self.client = Agentset(token=self.api_token, namespace_id=self.namespace_id)
@@ -13,6 +13,10 @@ Example:
     >>> chunks = provider.search("What is Islamic law?")
 """
 
+import threading
+from collections import OrderedDict
+
+from ..core.cache import fingerprint
 from ..core.errors import ConfigError, RunError
 from ..core.logging import get_logger
 from ..core.models import ProviderConfig
@@ -21,6 +25,12 @@ from .registry import get_tool
 
 logger = get_logger(__name__)
 
+# Provider instances kept by get_cached_provider (least recently used evicted)
+PROVIDER_CACHE_SIZE = 64
+
+_provider_cache: OrderedDict[tuple, Provider] = OrderedDict()
+_provider_cache_lock = threading.Lock()
+
 
 def create_provider(config: ProviderConfig) -> Provider:
     """Create a Provider instance from a ProviderConfig.
@@ -70,6 +80,86 @@ def create_provider(config: ProviderConfig) -> Provider:
         ) from e
 
 
+def get_cached_provider(config: ProviderConfig) -> Provider:
+    """Return a shared Provider instance for a config, creating it on first use.
+
+    Like ``create_provider``, but repeated calls with an equal config reuse the
+    same instance. Clients, HTTP sessions and loaded indexes then survive
+    across runs instead of being rebuilt each time. Providers must already be
+    thread-safe, so sharing an instance is safe. Configs holding values that
+    are not JSON-serializable cannot be keyed and always get a new instance.
+    Once ``PROVIDER_CACHE_SIZE`` providers are cached, the least recently used
+    one is evicted and closed.
+
+    Args:
+        config: ProviderConfig with tool name and (resolved) configuration
+
+    Returns:
+        Initialized Provider instance, possibly shared
+
+    Raises:
+        ConfigError: If tool not found in registry
+        RunError: If provider initialization fails
+
+    Example:
+        >>> config = load_provider("tafsir", "vectara-default")
+        >>> get_cached_provider(config) is get_cached_provider(config)
+        True
+    """
+    try:
+        tool_class = get_tool(config.tool)
+        config_key = fingerprint(config.config)
+    except (ConfigError, TypeError, ValueError):
+        return create_provider(config)
+
+    # The class is part of the key so re-registering a tool invalidates it
+    key = (tool_class, config.name, config.tool, config_key)
+    with _provider_cache_lock:
+        provider = _provider_cache.get(key)
+        if provider is not None:
+            _provider_cache.move_to_end(key)
+            return provider
+
+    # Create outside the lock from a private copy, so later changes to the
+    # caller's config can't reach the shared provider; failures are not cached
+    provider = create_provider(config.model_copy(deep=True))
+
+    evicted = []
+    with _provider_cache_lock:
+        existing = _provider_cache.get(key)
+        if existing is not None:
+            # Another thread created one first; keep that one
+            _provider_cache.move_to_end(key)
+            evicted.append(provider)
+            provider = existing
+        else:
+            _provider_cache[key] = provider
+            while len(_provider_cache) > PROVIDER_CACHE_SIZE:
+                evicted.append(_provider_cache.popitem(last=False)[1])
+
+    for stale in evicted:
+        _close_provider(stale)
+    return provider
+
+
+def clear_provider_cache() -> None:
+    """Close and drop all providers kept by ``get_cached_provider``."""
+    with _provider_cache_lock:
+        providers = list(_provider_cache.values())
+        _provider_cache.clear()
+
+    for provider in providers:
+        _close_provider(provider)
+
+
+def _close_provider(provider: Provider) -> None:
+    """Close a provider, logging rather than raising on failure."""
+    try:
+        provider.close()
+    except Exception as e:
+        logger.warning(f"Failed to close provider {provider}: {e}")
+
+
 def validate_provider_config(config: ProviderConfig) -> None:
     """Validate that a provider config can be used to create a provider.
 
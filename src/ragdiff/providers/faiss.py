@@ -10,6 +10,7 @@ Configuration:
     embedding_model: Model name (string, default: "all-MiniLM-L6-v2")
     dimensions: Expected vector dimensions for validation (int, optional)
     api_key: API key for OpenAI/Anthropic (string, optional - from env var)
+    embedding_chunk_size: Max texts per OpenAI embeddings request in async batches (int, default: 1000)
 
 Example:
     >>> provider = FAISSProvider(config={
@@ -19,8 +20,10 @@ Example:
     ...     "embedding_model": "all-MiniLM-L6-v2"
     ... })
     >>> chunks = provider.search("What is FAISS?", top_k=5)
+    >>> batches = asyncio.run(provider.asearch_batch(["q1", "q2"], top_k=5))
 """
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
@@ -66,6 +69,8 @@ class FAISSProvider(Provider):
         self.embedding_model = config.get("embedding_model", "all-MiniLM-L6-v2")
         self.dimensions = config.get("dimensions")
         self.api_key = config.get("api_key")  # For OpenAI/Anthropic
+        self.embedding_chunk_size = config.get("embedding_chunk_size", 1000)
+        self.async_openai_client: Any = None
 
         # Initialize embedding service
         self._init_embedding_service()
@@ -113,6 +118,7 @@ class FAISSProvider(Provider):
                 import openai
 
                 self.openai_client = openai.OpenAI(api_key=self.api_key)
+                self.async_openai_client = openai.AsyncOpenAI(api_key=self.api_key)
                 self.encoder = None  # We'll use the API directly
                 logger.info(
                     f"Initialized OpenAI embeddings with model: {self.embedding_model}"
@@ -266,35 +272,160 @@ class FAISSProvider(Provider):
             # Search index
             distances, indices = self.index.search(query_vector, top_k)
 
-            # Convert to results
-            chunks = []
-            for distance, idx in zip(distances[0], indices[0]):
-                # Skip invalid indices
-                if idx < 0 or idx >= len(self.documents):
-                    logger.warning(f"Invalid index {idx}, skipping")
-                    continue
-
-                doc = self.documents[idx]
-
-                # Convert distance to similarity score (0-1)
-                # For L2 distance, smaller is better, so invert
-                # Normalize using sigmoid-like function
-                score = 1.0 / (1.0 + float(distance))
-
-                chunk = RetrievedChunk(
-                    content=doc["text"],
-                    score=score,
-                    metadata={
-                        "id": str(doc["id"]),
-                        "source": doc.get("source", "FAISS"),
-                        **(doc.get("metadata", {})),
-                        "faiss_distance": float(distance),
-                        "faiss_index": int(idx),
-                    },
+            return self._to_chunks(distances[0], indices[0])
+
+        except Exception as e:
+            logger.error(f"FAISS search failed: {e}")
+            raise RunError(f"FAISS search failed: {e}") from e
+
+    def _to_chunks(self, distances: Any, indices: Any) -> list[RetrievedChunk]:
+        """Convert one row of FAISS search output to RetrievedChunk objects.
+
+        Args:
+            distances: L2 distances for a single query
+            indices: Document indices for a single query
+
+        Returns:
+            List of RetrievedChunk objects
+        """
+        chunks = []
+        for distance, idx in zip(distances, indices):
+            # Skip invalid indices
+            if idx < 0 or idx >= len(self.documents):
+                logger.warning(f"Invalid index {idx}, skipping")
+                continue
+
+            doc = self.documents[idx]
+
+            # Convert distance to similarity score (0-1)
+            # For L2 distance, smaller is better, so invert
+            # Normalize using sigmoid-like function
+            score = 1.0 / (1.0 + float(distance))
+
+            chunk = RetrievedChunk(
+                content=doc["text"],
+                score=score,
+                metadata={
+                    "id": str(doc["id"]),
+                    "source": doc.get("source", "FAISS"),
+                    **(doc.get("metadata", {})),
+                    "faiss_distance": float(distance),
+                    "faiss_index": int(idx),
+                },
+            )
+            chunks.append(chunk)
+
+        return chunks
+
+    async def _aencode_many(self, texts: list[str]) -> Any:
+        """Encode many texts concurrently.
+
+        For OpenAI, texts are sorted by length (similar lengths batch more
+        efficiently), split into ``embedding_chunk_size`` requests and sent
+        concurrently. Sentence-transformers encodes in a worker thread so the
+        event loop is not blocked.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding matrix (float32) with rows in input order
+
+        Raises:
+            RunError: If encoding fails
+        """
+        import numpy as np
+
+        try:
+            if self.embedding_service == "sentence-transformers":
+                embeddings = await asyncio.to_thread(self.encoder.encode, texts)
+                return np.asarray(embeddings, dtype="float32")
+
+            elif self.embedding_service == "openai":
+                order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+                shards = [
+                    order[i : i + self.embedding_chunk_size]
+                    for i in range(0, len(order), self.embedding_chunk_size)
+                ]
+                responses = await asyncio.gather(
+                    *[
+                        self.async_openai_client.embeddings.create(
+                            input=[texts[i] for i in shard],
+                            model=self.embedding_model,
+                        )
+                        for shard in shards
+                    ]
+                )
+
+                embeddings = [None] * len(texts)
+                for shard, response in zip(shards, responses):
+                    for i, item in zip(shard, response.data):
+                        embeddings[i] = item.embedding
+                return np.array(embeddings, dtype="float32")
+
+            else:
+                raise RunError(
+                    f"Unsupported embedding service: {self.embedding_service}"
                 )
-                chunks.append(chunk)
 
-            return chunks
+        except Exception as e:
+            logger.error(f"Failed to encode queries: {e}")
+            raise RunError(f"Query encoding failed: {e}") from e
+
+    async def aclose(self) -> None:
+        """Release the async OpenAI client's connections.
+
+        Its connection pool belongs to the event loop that used it, so a
+        fresh (unconnected) client replaces it for the next loop.
+        """
+        if self.async_openai_client is not None:
+            import openai
+
+            client = self.async_openai_client
+            self.async_openai_client = openai.AsyncOpenAI(api_key=self.api_key)
+            await client.close()
+
+    async def asearch(self, query: str, top_k: int = 5) -> list[RetrievedChunk]:
+        """Async variant of search().
+
+        Args:
+            query: Search query text
+            top_k: Maximum results to return
+
+        Returns:
+            List of RetrievedChunk objects
+
+        Raises:
+            RunError: If search fails
+        """
+        return (await self.asearch_batch([query], top_k=top_k))[0]
+
+    async def asearch_batch(
+        self, queries: list[str], top_k: int = 5
+    ) -> list[list[RetrievedChunk]]:
+        """Search for several queries with concurrent embedding requests.
+
+        Args:
+            queries: Search query texts
+            top_k: Maximum results to return per query
+
+        Returns:
+            One list of RetrievedChunk objects per query, in input order
+
+        Raises:
+            RunError: If search fails
+        """
+        if not queries:
+            return []
+
+        query_vectors = await self._aencode_many(queries)
+
+        try:
+            distances, indices = self.index.search(query_vectors, top_k)
+            return [
+                self._to_chunks(row_distances, row_indices)
+                for row_distances, row_indices in zip(distances, indices)
+            ]
 
         except Exception as e:
             logger.error(f"FAISS search failed: {e}")
@@ -33,18 +33,36 @@ from .abc import Provider
 
 logger = get_logger(__name__)
 
-# Optional Goodmem client import
-try:
-    from goodmem_client import ApiClient, Configuration
-    from goodmem_client.streaming import MemoryStreamClient
-
-    GOODMEM_AVAILABLE = True
-except ImportError:
-    GOODMEM_AVAILABLE = False
-    logger.warning("goodmem-client not installed. Using CLI fallback only.")
-    ApiClient = None  # type: ignore
-    Configuration = None  # type: ignore
-    MemoryStreamClient = None  # type: ignore
+
+def _load_goodmem_client():
+    """Import the optional goodmem-client SDK on first use.
+
+    The SDK is slow to import, so it is only loaded when a Goodmem provider is
+    actually constructed rather than whenever the providers package is imported.
+
+    Returns:
+        Tuple of (ApiClient, Configuration, MemoryStreamClient), or None if
+        goodmem-client is not installed
+    """
+    global _GOODMEM_CLIENT
+    if _GOODMEM_CLIENT is _UNLOADED:
+        try:
+            from goodmem_client import ApiClient, Configuration
+            from goodmem_client.streaming import MemoryStreamClient
+
+            _GOODMEM_CLIENT = (ApiClient, Configuration, MemoryStreamClient)
+        except ImportError:
+            logger.warning("goodmem-client not installed. Using CLI fallback only.")
+            _GOODMEM_CLIENT = None
+    return _GOODMEM_CLIENT
+
+
+# Pooled connections per provider; covers the executor's default concurrency
+SESSION_POOL_MAXSIZE = 16
+
+# Sentinel distinguishing "not imported yet" from "not installed" (None)
+_UNLOADED = object()
+_GOODMEM_CLIENT: Any = _UNLOADED
 
 # Space ID to human-readable name mapping
 _SPACE_NAMES = {
@@ -92,8 +110,21 @@ class GoodmemProvider(Provider):
             "308764dc-fb1e-4877-9b09-831fafefbd9a",
         ]
 
+        # Keep-alive session for /v1/memories:retrieve, shared by the executor's
+        # query threads so each query reuses a pooled connection
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=SESSION_POOL_MAXSIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(
+            {"Accept": "application/x-ndjson", "x-api-key": self.api_key}
+        )
+
         # Initialize Goodmem client if available
-        if GOODMEM_AVAILABLE:
+        client_classes = _load_goodmem_client()
+        self.api_available = client_classes is not None
+        if client_classes is not None:
+            ApiClient, Configuration, MemoryStreamClient = client_classes
             try:
                 configuration = Configuration(host=self.base_url)
                 configuration.api_key["ApiKeyAuth"] = self.api_key
@@ -122,7 +153,7 @@ class GoodmemProvider(Provider):
 
         logger.debug(
             f"Initialized Goodmem provider: {len(self.space_ids)} spaces, "
-            f"api={GOODMEM_AVAILABLE}"
+            f"api={self.api_available}"
         )
 
     def search(self, query: str, top_k: int = 5) -> SearchResult:
@@ -139,7 +170,7 @@ class GoodmemProvider(Provider):
             RunError: If search fails
         """
         # Try HTTP API first if available
-        if GOODMEM_AVAILABLE and self.stream_client:
+        if self.api_available and self.stream_client:
             try:
                 return self._search_via_api(query, top_k)
             except Exception as e:
@@ -148,6 +179,10 @@ class GoodmemProvider(Provider):
         # Fall back to CLI-based search
         return self._search_via_cli(query, top_k)
 
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._session.close()
+
     def _search_via_api(self, query: str, top_k: int) -> SearchResult:
         """Search Goodmem using HTTP API.
 
@@ -182,11 +217,7 @@ class GoodmemProvider(Provider):
 
             # Make HTTP request
             url = f"{self.api_client.configuration.host}/v1/memories:retrieve"
-            headers = {"Accept": "application/x-ndjson", "x-api-key": self.api_key}
-
-            response = requests.get(
-                url, params=params, headers=headers, timeout=self.timeout
-            )
+            response = self._session.get(url, params=params, timeout=self.timeout)
 
             if response.status_code != 200:
                 raise RunError(f"Goodmem API returned HTTP {response.status_code}")
@@ -1,15 +1,26 @@
 import os
 from typing import List
 
-from google import genai
-from google.genai import types
-
 from ..core.errors import ConfigError, RunError
 from ..core.models import RetrievedChunk, SearchResult
 from ..core.pricing import calculate_llm_cost, count_tokens
 from .abc import Provider
 
 
+def __getattr__(name: str):
+    # google-genai takes ~0.5s to import, so it is loaded on first use rather
+    # than whenever the provider registry is imported
+    if name == "genai":
+        from google import genai
+
+        return genai
+    if name == "types":
+        from google.genai import types
+
+        return types
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class GoogleFileSearchProvider(Provider):
     """
     Provider for Google's File Search API (via Gemini API).
@@ -39,6 +50,8 @@ class GoogleFileSearchProvider(Provider):
             "model", "gemini-1.5-flash-lite"
         )  # Updated default
 
+        from google import genai
+
         try:
             self.client = genai.Client(api_key=self.api_key)
         except Exception as e:
@@ -53,6 +66,8 @@ class GoogleFileSearchProvider(Provider):
         top_k is not directly supported by the API in the same way as vector DBs,
         but we can try to influence it or just take what we get.
         """
+        from google.genai import types
+
         try:
             # Determine top_k: prefer config, then argument
             config_top_k = self.config.get("top_k")
@@ -1,18 +1,36 @@
 """MongoDB system for RAGDiff v2.0.
 
 MongoDB vector search using sentence-transformers for local embedding generation.
-Requires optional dependencies: pymongo, sentence-transformers.
+Requires optional dependencies: pymongo, sentence-transformers. Install
+pymongo[zstd] to compress the wire traffic of embedding-heavy scans.
 
 Configuration:
     connection_uri: MongoDB connection string (string, required)
     database: Database name (string, required)
     collection: Collection name (string, required)
     index_name: Vector index name (string, required)
+    vector_search: Use Atlas $vectorSearch (bool, optional, default: auto-detected from index_name)
     vector_field: Vector field name (string, optional, default: "embedding")
     text_field: Text field name (string, optional, default: "text")
     source_field: Source field name (string, optional, default: "source")
     metadata_fields: List of metadata fields to extract (list, optional)
+    split_payload_fetch: Fetch $vectorSearch payloads in a second query (bool, optional, default: true with 3+ metadata_fields)
     embedding_model: Sentence-transformer model name (string, optional, default: "all-MiniLM-L6-v2")
+    use_onnx: Run the embedding model with ONNX Runtime on CPU (bool, optional, default: false)
+    embedding_cache_size: Max cached query embeddings, 0 disables (int, optional, default: 1024)
+    embedding_batch_size: Encoder batch size for search_batch (int, optional, default: 32)
+    semantic_cache_threshold: Reuse results of a cached query at least this similar (float, optional, default: disabled)
+    semantic_cache_size: Max queries kept in the semantic cache (int, optional, default: 256)
+    warmup: Run a dummy encode at startup to absorb model cold-start cost (bool, optional, default: true)
+    num_threads: CPU threads for torch inference (int, optional, default: torch default)
+    matrix_cache_dir: Directory to persist the document embedding matrix (string, optional)
+    matrix_cache_strict: Also revalidate the persisted matrix with dbHash, a full collection read (bool, optional, default: false)
+    matrix_cache_dtype: Stored matrix dtype: "float32", "float16" or "int8" (string, optional, default: "float32")
+    watch_changes: Keep the cached matrix in sync via a change stream; needs a replica set (bool, optional, default: false)
+    max_pool_size: Max connections in the shared client pool (int, optional, default: 50)
+    min_pool_size: Connections kept open in the shared pool (int, optional, default: 5)
+    compressors: Wire compressors in preference order (string, optional, default: installed of "zstd,snappy,zlib")
+    zlib_compression_level: zlib level when zlib is negotiated (int, optional, default: 6)
     timeout: Request timeout in seconds (int, optional, default: 60)
 
 Example:
@@ -24,9 +42,17 @@ Example:
     ...     "embedding_model": "all-MiniLM-L6-v2"
     ... })
     >>> chunks = system.search("What is Islamic law?", top_k=5)
+    >>> batches = system.search_batch(["What is zakat?", "What is hajj?"], top_k=5)
+    >>> system.bulk_embed_and_upsert([{"_id": "z1", "text": "Zakat is ..."}])
+    >>> system.close()
 """
 
-from typing import Any
+import importlib.util
+import threading
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
 
 from ..core.errors import ConfigError, RunError
 from ..core.logging import get_logger
@@ -35,12 +61,88 @@ from .abc import Provider
 
 logger = get_logger(__name__)
 
+# Rows scored per block when computing similarities against the matrix
+_SCORE_BLOCK_ROWS = 65536
+
+# Seconds to wait before reopening a change stream, doubled per failed attempt
+_WATCH_RETRY_SECONDS = 1.0
+_WATCH_RETRY_MAX_SECONDS = 60.0
+
+# Storage dtypes supported for the document embedding matrix
+_MATRIX_DTYPES = ("float32", "float16", "int8")
+
+# BSON binary subtype for packed vectors (MongoDB 7.0+), and the dtype
+# markers in the first byte of its payload
+_BSON_VECTOR_SUBTYPE = 9
+_BSON_VECTOR_FLOAT32 = 0x27
+_BSON_VECTOR_INT8 = 0x03
+
+# MongoClients shared across provider instances, keyed by URI and options.
+# Clients are thread-safe and pool their sockets, so providers reuse them
+# instead of paying the connection handshake on every instantiation.
+_CLIENTS: dict[tuple, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+# Wire compressors in preference order, with the module each one needs
+# (zlib ships with Python)
+_COMPRESSOR_MODULES = (("zstd", "zstandard"), ("snappy", "snappy"), ("zlib", "zlib"))
+
+
+def _available_compressors() -> str:
+    """Return the preferred wire compressors whose libraries are installed.
+
+    pymongo warns about, and then ignores, compressors it cannot load, so
+    only advertising installed ones keeps the default quiet.
+    """
+    return ",".join(
+        name
+        for name, module in _COMPRESSOR_MODULES
+        if importlib.util.find_spec(module) is not None
+    )
+
+
+def _to_cosine(score: Optional[float]) -> Optional[float]:
+    """Map a cosine-index ``vectorSearchScore`` back to cosine similarity."""
+    return None if score is None else 2 * score - 1
+
+
+def _get_client(mongo_client_cls: Any, uri: str, **options: Any) -> Any:
+    """Return a shared MongoClient for ``uri``, creating it on first use.
+
+    Args:
+        mongo_client_cls: The ``pymongo.MongoClient`` class
+        uri: MongoDB connection string
+        **options: Keyword arguments passed to the client constructor
+
+    Returns:
+        MongoClient instance shared by every caller with the same arguments
+    """
+    key = (uri, tuple(sorted(options.items())))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = mongo_client_cls(uri, **options)
+            _CLIENTS[key] = client
+        return client
+
 
 class MongoDBProvider(Provider):
     """MongoDB vector search system implementation.
 
     Uses sentence-transformers for local embedding generation and MongoDB
-    for vector similarity search.
+    for vector similarity search. Atlas (and Enterprise 7.0+) deployments
+    use server-side ``$vectorSearch``; Community Edition falls back to a
+    client-side scan over a cached embedding matrix.
+
+    Thread Safety:
+        ``search`` and ``search_batch`` are safe to call concurrently. The
+        encoder, the query cache and the pooled MongoClient are thread-safe,
+        the embedding matrix is built at most once behind a lock, and
+        searches read a (matrix, ids, norms) snapshot taken under a lock.
+        With ``watch_changes``, the change-stream thread writes changed rows
+        into that snapshot in place, so a concurrent search may score a row
+        just before or after its update, and skips rows deleted meanwhile.
 
     Requires: pymongo, sentence-transformers (install with: pip install pymongo sentence-transformers)
     """
@@ -54,11 +156,29 @@ class MongoDBProvider(Provider):
                 - database (str, required): Database name
                 - collection (str, required): Collection name
                 - index_name (str, required): Vector index name
+                - vector_search (bool, optional): Force $vectorSearch on/off
                 - vector_field (str, optional): Vector field name
                 - text_field (str, optional): Text field name
                 - source_field (str, optional): Source field name
                 - metadata_fields (list, optional): Metadata fields to extract
+                - split_payload_fetch (bool, optional): Separate $vectorSearch
+                  scoring from the payload fetch
                 - embedding_model (str, optional): Sentence-transformer model
+                - use_onnx (bool, optional): Use the ONNX Runtime backend
+                - embedding_cache_size (int, optional): Max cached query embeddings
+                - embedding_batch_size (int, optional): Encoder batch size
+                - semantic_cache_threshold (float, optional): Min cosine similarity
+                  for reusing a cached query's results
+                - semantic_cache_size (int, optional): Max semantic cache entries
+                - warmup (bool, optional): Pre-warm the model with a dummy encode
+                - num_threads (int, optional): CPU threads for torch inference
+                - matrix_cache_dir (str, optional): Directory for the persisted matrix
+                - matrix_cache_dtype (str, optional): Stored matrix dtype
+                - watch_changes (bool, optional): Apply collection changes to the matrix
+                - max_pool_size (int, optional): Max pooled connections
+                - min_pool_size (int, optional): Min pooled connections
+                - compressors (str, optional): Wire compressors, comma-separated
+                - zlib_compression_level (int, optional): zlib compression level
                 - timeout (int, optional): Timeout in seconds
 
         Raises:
@@ -69,15 +189,23 @@ class MongoDBProvider(Provider):
         # Lazy load dependencies
         try:
             import numpy as np
-            from pymongo import MongoClient
-            from pymongo.errors import PyMongoError
+            from bson import json_util
+            from bson.codec_options import CodecOptions
+            from bson.raw_bson import RawBSONDocument
+            from pymongo import MongoClient, UpdateOne
+            from pymongo.errors import OperationFailure, PyMongoError
 
             self.np = np
+            self.json_util = json_util
+            self.CodecOptions = CodecOptions
+            self.RawBSONDocument = RawBSONDocument
             self.MongoClient = MongoClient
+            self.UpdateOne = UpdateOne
+            self.OperationFailure = OperationFailure
             self.PyMongoError = PyMongoError
         except ImportError as e:
             raise ConfigError(
-                f"pymongo is required for MongoDB provider. Install with: pip install pymongo. Error: {e}"
+                f"pymongo is required for MongoDB provider. Install with: pip install 'pymongo[zstd]'. Error: {e}"
             ) from e
 
         try:
@@ -108,23 +236,97 @@ class MongoDBProvider(Provider):
         self.text_field = config.get("text_field", "text")
         self.source_field = config.get("source_field", "source")
         self.metadata_fields = config.get("metadata_fields", [])
+        # With wide payloads, rank by id first and fetch payloads once per batch
+        self.split_payload_fetch = config.get(
+            "split_payload_fetch", len(self.metadata_fields) >= 3
+        )
         self.embedding_model_name = config.get("embedding_model", "all-MiniLM-L6-v2")
+        self.use_onnx = config.get("use_onnx", False)
+        self.embedding_cache_size = config.get("embedding_cache_size", 1024)
+        self.embedding_batch_size = config.get("embedding_batch_size", 32)
+        self.semantic_cache_threshold = config.get("semantic_cache_threshold")
+        self.semantic_cache_size = config.get("semantic_cache_size", 256)
+        self.warmup = config.get("warmup", True)
+        self.num_threads = config.get("num_threads")
+        self.matrix_cache_dir = (
+            Path(config["matrix_cache_dir"]) if config.get("matrix_cache_dir") else None
+        )
+        self.matrix_cache_dtype = config.get("matrix_cache_dtype", "float32")
+        self.matrix_cache_strict = config.get("matrix_cache_strict", False)
+        if self.matrix_cache_dtype not in _MATRIX_DTYPES:
+            raise ConfigError(
+                f"MongoDB matrix_cache_dtype must be one of {', '.join(_MATRIX_DTYPES)}, "
+                f"got '{self.matrix_cache_dtype}'"
+            )
+        self.watch_changes = config.get("watch_changes", False)
+        self.max_pool_size = config.get("max_pool_size", 50)
+        self.min_pool_size = config.get("min_pool_size", 5)
+        # The server compresses responses with the first compressor both sides
+        # support, which shrinks the vector-heavy matrix scan several-fold
+        self.compressors = config.get("compressors") or _available_compressors()
+        self.zlib_compression_level = config.get("zlib_compression_level", 6)
         self.timeout = config.get("timeout", 60)
 
+        # Document embedding matrix, materialized on first search. The lock
+        # guards swapping (matrix, ids) so readers always see a matching pair.
+        self._matrix: Optional[Any] = None
+        self._doc_ids: list = []
+        self._norms: Optional[Any] = None  # Row norms, computed once per matrix
+        self._matrix_lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._mat_version = 0
+        # Change-stream bookkeeping: row buffers with spare capacity behind the
+        # published (matrix, norms) views, _id -> row (built on first change),
+        # deleted rows awaiting compaction, and changes seen during a build
+        self._matrix_buffer: Optional[Any] = None
+        self._norm_buffer: Optional[Any] = None
+        self._row_of: Optional[dict] = None
+        self._dead_rows = 0
+        self._pending_changes: Optional[list] = None
+        self._watch_stop = threading.Event()
+        self._watch_thread: Optional[threading.Thread] = None
+
+        # Recent (unit query vector, top_k, matrix version, chunks), oldest first
+        self._sem_cache: deque = deque(maxlen=self.semantic_cache_size)
+        self._sem_cache_lock = threading.Lock()
+
         # Initialize embedding model
         logger.info(f"Loading embedding model: {self.embedding_model_name}")
         try:
-            self.embedding_model = self.SentenceTransformer(self.embedding_model_name)
+            self.embedding_model = self._load_embedding_model()
             logger.info("Embedding model loaded successfully")
+        except ConfigError:
+            raise
         except Exception as e:
             raise ConfigError(
                 f"Failed to load embedding model '{self.embedding_model_name}': {e}"
             ) from e
 
-        # Initialize MongoDB client
+        if self.num_threads:
+            self._set_num_threads(self.num_threads)
+        if self.warmup:
+            self._warmup_model()
+
+        # Repeated queries (common in eval sweeps) skip the model forward pass.
+        # The cache is per instance, so keys are implicitly (model, text).
+        if self.embedding_cache_size:
+            self._encode = lru_cache(maxsize=self.embedding_cache_size)(
+                self._encode_uncached
+            )
+        else:
+            self._encode = self._encode_uncached
+
+        # Initialize MongoDB client (shared with other providers on this URI)
         try:
-            self.mongo_client = self.MongoClient(
-                config["connection_uri"], serverSelectionTimeoutMS=self.timeout * 1000
+            self.mongo_client = _get_client(
+                self.MongoClient,
+                config["connection_uri"],
+                serverSelectionTimeoutMS=self.timeout * 1000,
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                retryWrites=True,
+                compressors=self.compressors,
+                zlibCompressionLevel=self.zlib_compression_level,
             )
             self.database = self.mongo_client[self.database_name]
             self.collection = self.database[self.collection_name]
@@ -138,6 +340,19 @@ class MongoDBProvider(Provider):
         except Exception as e:
             raise ConfigError(f"Failed to connect to MongoDB: {e}") from e
 
+        # Use $vectorSearch when the index exists, unless explicitly configured
+        self.use_vector_search = config.get("vector_search")
+        if self.use_vector_search is None:
+            self.use_vector_search = self._detect_vector_search()
+        logger.info(
+            "MongoDB search mode: "
+            + ("$vectorSearch" if self.use_vector_search else "client-side scan")
+        )
+
+        # Only the client-side scan keeps a matrix that can go stale
+        if self.watch_changes and not self.use_vector_search:
+            self._start_watcher()
+
     def search(self, query: str, top_k: int = 5) -> list[RetrievedChunk]:
         """Search MongoDB using vector similarity.
 
@@ -157,78 +372,910 @@ class MongoDBProvider(Provider):
 
             logger.debug(f"MongoDB search: query='{query[:50]}...', top_k={top_k}")
 
-            # Fetch all documents with embeddings
-            # Note: For production with large collections, use MongoDB Atlas $vectorSearch
-            # This implementation works for smaller collections
-            all_docs = list(
-                self.collection.find(
-                    {self.vector_field: {"$exists": True}},
-                    limit=10000,  # Safety limit
-                )
+            # Paraphrases of a recent query reuse its results
+            if self.semantic_cache_threshold is not None:
+                cached = self._semantic_cache_lookup(query_vector, top_k)
+                if cached is not None:
+                    logger.debug(f"Semantic cache hit for query: '{query[:50]}...'")
+                    return cached
+
+            # Prefer server-side ANN; scan the cached matrix otherwise
+            if self.use_vector_search:
+                hits = self._vector_search_batch([query_vector], top_k)[0]
+            else:
+                hits = self._scan_search(query_vector, top_k)
+
+            chunks = self._to_chunks(hits)
+
+            if self.semantic_cache_threshold is not None:
+                self._semantic_cache_store(query_vector, top_k, chunks)
+
+            logger.info(
+                f"MongoDB returned {len(chunks)} chunks for query: '{query[:50]}...'"
             )
+            return chunks
 
-            if not all_docs:
-                logger.warning("No documents with embeddings found in collection")
-                return []
+        except self.PyMongoError as e:
+            logger.error(f"MongoDB query failed: {e}")
+            raise RunError(f"MongoDB query failed: {e}") from e
 
-            # Compute cosine similarity for each document
-            results_with_scores = []
-            for doc in all_docs:
-                doc_vector = self.np.array(doc.get(self.vector_field, []))
-                if len(doc_vector) == 0:
-                    continue
+        except Exception as e:
+            logger.error(f"Unexpected error in MongoDB search: {e}")
+            raise RunError(f"Unexpected error in MongoDB search: {e}") from e
 
-                # Cosine similarity
-                similarity = float(
-                    self.np.dot(query_vector, doc_vector)
-                    / (
-                        self.np.linalg.norm(query_vector)
-                        * self.np.linalg.norm(doc_vector)
-                    )
+    def search_batch(
+        self, queries: list[str], top_k: int = 5
+    ) -> list[list[RetrievedChunk]]:
+        """Search for several queries at once.
+
+        All queries are encoded in a single model forward pass and, on the
+        client-side scan path, scored with one matrix multiplication.
+
+        Args:
+            queries: Search query texts
+            top_k: Maximum number of results to return per query
+
+        Returns:
+            One list of RetrievedChunk objects per query, in input order
+
+        Raises:
+            RunError: If search fails
+        """
+        if not queries:
+            return []
+
+        try:
+            query_vectors = self.embedding_model.encode(
+                queries,
+                batch_size=self.embedding_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+
+            logger.debug(f"MongoDB batch search: {len(queries)} queries, top_k={top_k}")
+
+            if self.use_vector_search:
+                batch_hits = self._vector_search_batch(query_vectors, top_k)
+            else:
+                batch_hits = self._scan_search_batch(query_vectors, top_k)
+
+            return [self._to_chunks(hits) for hits in batch_hits]
+
+        except self.PyMongoError as e:
+            logger.error(f"MongoDB batch query failed: {e}")
+            raise RunError(f"MongoDB query failed: {e}") from e
+
+        except Exception as e:
+            logger.error(f"Unexpected error in MongoDB batch search: {e}")
+            raise RunError(f"Unexpected error in MongoDB search: {e}") from e
+
+    def bulk_embed_and_upsert(self, docs: list[dict], batch_size: int = 1000) -> int:
+        """Embed documents and upsert them into the collection in bulk.
+
+        Documents are ordered by text length so each encoder batch pads to a
+        similar length, embedded ``batch_size`` at a time, and written with
+        one unordered ``bulk_write`` per batch. The cached embedding matrix
+        is dropped afterwards so the next scan sees the new vectors.
+
+        Args:
+            docs: Documents with an ``_id`` and ``text_field``; all other
+                fields are stored as-is
+            batch_size: Documents embedded and written per round-trip
+
+        Returns:
+            Number of documents written
+
+        Raises:
+            RunError: If a document is missing ``_id`` or text, or the
+                embedding or write fails
+        """
+        for doc in docs:
+            if "_id" not in doc or not doc.get(self.text_field):
+                raise RunError(
+                    f"Documents need '_id' and '{self.text_field}' to be upserted: "
+                    f"{doc.get('_id')}"
                 )
 
-                results_with_scores.append((doc, similarity))
+        ordered = sorted(docs, key=lambda d: len(d[self.text_field]))
+        try:
+            for start in range(0, len(ordered), batch_size):
+                batch = ordered[start : start + batch_size]
+                vectors = self.embedding_model.encode(
+                    [doc[self.text_field] for doc in batch],
+                    batch_size=self.embedding_batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False,
+                )
+                operations = [
+                    self.UpdateOne(
+                        {"_id": doc["_id"]},
+                        {
+                            "$set": {
+                                **{k: v for k, v in doc.items() if k != "_id"},
+                                self.vector_field: vector.tolist(),
+                            }
+                        },
+                        upsert=True,
+                    )
+                    for doc, vector in zip(batch, vectors)
+                ]
+                self.collection.bulk_write(operations, ordered=False)
+                logger.debug(f"Upserted {len(batch)} documents into MongoDB")
+        except self.PyMongoError as e:
+            logger.error(f"MongoDB bulk upsert failed: {e}")
+            raise RunError(f"MongoDB bulk upsert failed: {e}") from e
+        except Exception as e:
+            logger.error(f"Unexpected error in MongoDB bulk upsert: {e}")
+            raise RunError(f"Unexpected error in MongoDB bulk upsert: {e}") from e
+        finally:
+            if docs:
+                self._invalidate_matrix()
 
-            # Sort by similarity (descending) and take top_k
-            results_with_scores.sort(key=lambda x: x[1], reverse=True)
-            top_results = results_with_scores[:top_k]
+        logger.info(f"Upserted {len(docs)} documents into {self.collection_name}")
+        return len(docs)
 
-            # Convert to RetrievedChunk objects
-            chunks = []
-            for doc, score in top_results:
-                # Extract text
-                text = doc.get(self.text_field, "")
-                if not text:
-                    logger.warning(f"Document missing text field: {doc.get('_id')}")
-                    continue
+    def close(self) -> None:
+        """Stop the change-stream watcher, if one is running."""
+        self._watch_stop.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout=self.timeout)
+            self._watch_thread = None
+
+    def _to_chunks(self, hits: list[tuple[dict, float]]) -> list[RetrievedChunk]:
+        """Convert (document, score) hits to RetrievedChunk objects.
+
+        Documents without text are skipped and reported in one warning.
+        """
+        text_field = self.text_field
+        source_field = self.source_field
+        metadata_fields = tuple(self.metadata_fields)
 
-                # Build metadata
-                metadata = {
+        chunks = [
+            RetrievedChunk(
+                content=text,
+                score=score,
+                metadata={
                     "_id": str(doc.get("_id", "")),
-                    "source": doc.get(self.source_field, "MongoDB"),
+                    "source": doc.get(source_field, "MongoDB"),
+                    **{field: doc[field] for field in metadata_fields if field in doc},
+                },
+            )
+            for doc, score in hits
+            if (text := doc.get(text_field))
+        ]
+
+        missing = len(hits) - len(chunks)
+        if missing:
+            logger.warning(f"Skipped {missing} documents missing text field")
+        return chunks
+
+    def _semantic_cache_lookup(
+        self, query_vector: Any, top_k: int
+    ) -> Optional[list[RetrievedChunk]]:
+        """Return cached results for a near-identical earlier query.
+
+        An entry matches when its cosine similarity to ``query_vector`` is at
+        least ``semantic_cache_threshold``, it was searched with at least
+        ``top_k`` results, and the embedding matrix has not changed since.
+
+        Returns:
+            The best-matching entry's chunks cut to ``top_k``, or None
+        """
+        np = self.np
+        with self._sem_cache_lock:
+            entries = [e for e in self._sem_cache if e[1] >= top_k]
+        entries = [e for e in entries if e[2] == self._mat_version]
+        if not entries:
+            return None
+
+        unit = self._unit(query_vector)
+        sims = np.stack([e[0] for e in entries]) @ unit
+        best = int(np.argmax(sims))
+        if sims[best] < self.semantic_cache_threshold:
+            return None
+        return entries[best][3][:top_k]
+
+    def _semantic_cache_store(
+        self, query_vector: Any, top_k: int, chunks: list[RetrievedChunk]
+    ) -> None:
+        """Remember a query's results, evicting the oldest entry when full."""
+        entry = (self._unit(query_vector), top_k, self._mat_version, chunks)
+        with self._sem_cache_lock:
+            self._sem_cache.append(entry)
+
+    def _unit(self, vector: Any) -> Any:
+        """Scale a vector to unit length (zero vectors are returned as-is)."""
+        vector = self.np.asarray(vector, dtype=self.np.float32)
+        norm = float(self.np.linalg.norm(vector))
+        return vector / norm if norm > 0 else vector
+
+    def _detect_vector_search(self) -> bool:
+        """Check whether ``index_name`` is a queryable Atlas vector search index.
+
+        Community Edition rejects ``listSearchIndexes``, which selects the
+        client-side scan path. Other errors (auth, network) are raised.
+        """
+        try:
+            indexes = list(self.collection.list_search_indexes(self.index_name))
+        except self.OperationFailure as e:
+            logger.info(f"Search indexes unavailable, using client-side scan: {e}")
+            return False
+        return any(index.get("queryable", True) for index in indexes)
+
+    def _vector_search_batch(
+        self, query_vectors: Any, top_k: int
+    ) -> list[list[tuple[dict, float]]]:
+        """Run one Atlas ``$vectorSearch`` aggregation per query.
+
+        With ``split_payload_fetch`` the aggregations return only ids and
+        scores, and payloads for all hits are fetched in one ``find``.
+        Otherwise each aggregation projects the payload directly.
+
+        ``vectorSearchScore`` for a cosine index is ``(1 + cosine) / 2``; it is
+        mapped back to cosine so scores match the client-side scan whichever
+        path a deployment uses.
+
+        Args:
+            query_vectors: Query embeddings
+            top_k: Maximum number of results per query
+
+        Returns:
+            One list of (document, score) tuples per query, best first
+        """
+        if not self.split_payload_fetch:
+            return [
+                [
+                    (doc, _to_cosine(doc.get("score")))
+                    for doc in self._vector_search(q, top_k, self._payload_projection())
+                ]
+                for q in query_vectors
+            ]
+
+        scored_ids = [
+            [
+                (doc["_id"], _to_cosine(doc.get("score")))
+                for doc in self._vector_search(q, top_k, {"_id": 1})
+            ]
+            for q in query_vectors
+        ]
+        return self._attach_payloads(scored_ids)
+
+    def _vector_search(
+        self, query_vector: Any, top_k: int, projection: dict[str, Any]
+    ) -> list[dict]:
+        """Run an Atlas ``$vectorSearch`` aggregation.
+
+        Args:
+            query_vector: Query embedding
+            top_k: Maximum number of results
+            projection: Fields to return; the score is always added
+
+        Returns:
+            Matching documents with a ``score`` field, best first
+        """
+        projection = {**projection, "score": {"$meta": "vectorSearchScore"}}
+
+        pipeline = [
+            {
+                "$vectorSearch": {
+                    "index": self.index_name,
+                    "path": self.vector_field,
+                    "queryVector": query_vector.tolist(),
+                    "numCandidates": max(top_k * 10, 150),
+                    "limit": top_k,
                 }
+            },
+            {"$project": projection},
+        ]
+        return list(self.collection.aggregate(pipeline))
+
+    def _scan_search(self, query_vector: Any, top_k: int) -> list[tuple[dict, float]]:
+        """Score the query against the cached matrix on the client.
+
+        Returns:
+            List of (document, score) tuples, best first
+        """
+        return self._scan_search_batch(query_vector[None, :], top_k)[0]
 
-                # Add configured metadata fields
-                for field in self.metadata_fields:
-                    if field in doc:
-                        metadata[field] = doc[field]
+    def _scan_search_batch(
+        self, query_vectors: Any, top_k: int
+    ) -> list[list[tuple[dict, float]]]:
+        """Score a batch of queries against the cached matrix on the client.
 
-                # Create chunk
-                chunk = RetrievedChunk(content=text, score=score, metadata=metadata)
-                chunks.append(chunk)
+        Args:
+            query_vectors: Query embeddings, shape (batch, dimensions)
+            top_k: Maximum number of results per query
 
-            logger.info(
-                f"MongoDB returned {len(chunks)} chunks for query: '{query[:50]}...'"
+        Returns:
+            One list of (document, score) tuples per query, best first
+        """
+        np = self.np
+        matrix, doc_ids, norms, dead_rows = self._get_matrix()
+
+        # The watcher may append ids past the rows of this snapshot
+        rows = len(matrix)
+        if not rows:
+            logger.warning("No documents with embeddings found in collection")
+            return [[] for _ in range(len(query_vectors))]
+
+        # Shape (documents, batch)
+        scores = self._cosine_scores(matrix, norms, query_vectors)
+
+        # Select top_k per query without sorting whole score columns. Deleted
+        # rows keep a None id until compaction, so select enough to skip them.
+        scored_ids = []
+        for column in scores.T:
+            k = min(top_k + dead_rows, rows)
+            while True:
+                top = np.argpartition(-column, k - 1)[:k]
+                live = [
+                    i for i in top[np.argsort(-column[top])] if doc_ids[i] is not None
+                ]
+                if len(live) >= top_k or k == rows:
+                    break
+                # Rows were deleted after the snapshot; widen the selection
+                k = min(2 * k, rows)
+            scored_ids.append([(doc_ids[i], float(column[i])) for i in live[:top_k]])
+
+        return self._attach_payloads(scored_ids)
+
+    def _attach_payloads(
+        self, scored_ids: list[list[tuple[Any, float]]]
+    ) -> list[list[tuple[dict, float]]]:
+        """Replace ids with their documents, fetching all payloads at once.
+
+        Args:
+            scored_ids: One list of (document id, score) per query
+
+        Returns:
+            One list of (document, score) per query; ids no longer in the
+            collection are dropped
+        """
+        winners = {doc_id for hits in scored_ids for doc_id, _ in hits}
+        docs_by_id = self._fetch_documents(list(winners))
+
+        batch_hits = []
+        for hits in scored_ids:
+            resolved = []
+            for doc_id, score in hits:
+                doc = docs_by_id.get(doc_id)
+                if doc is None:
+                    logger.warning(f"Document no longer in collection: {doc_id}")
+                    continue
+                resolved.append((doc, score))
+            batch_hits.append(resolved)
+        return batch_hits
+
+    def _get_matrix(self) -> tuple[Any, list, Any, int]:
+        """Return the document embedding matrix, its ids, norms and dead rows.
+
+        The matrix is materialized on first use and kept for the lifetime of
+        the provider. When ``matrix_cache_dir`` is configured it is also
+        persisted (quantized) to disk and memory-mapped on later startups.
+
+        Returns:
+            Tuple of (matrix with one row per document, list of document ids
+            with None for deleted rows, float32 array of row norms, number of
+            deleted rows)
+        """
+        if self._matrix is None:
+            # Concurrent first searches wait for a single build
+            with self._build_lock:
+                if self._matrix is None:
+                    self._materialize_matrix()
+        with self._matrix_lock:
+            return self._matrix, self._doc_ids, self._norms, self._dead_rows
+
+    def _materialize_matrix(self) -> None:
+        """Load the persisted matrix or build it from MongoDB, then publish it.
+
+        Change-stream events that arrive while the collection is being read
+        are queued and replayed onto the result, so a write that lands after
+        the scan passed its document is not lost.
+        """
+        with self._matrix_lock:
+            self._pending_changes = []
+        try:
+            loaded = None
+            if self.matrix_cache_dir:
+                # Taken before the scan, so writes during it make the cache stale
+                cache_key = self._matrix_cache_key()
+                loaded = self._load_matrix_cache(cache_key)
+            if loaded is None:
+                loaded = self._build_matrix()
+                if self.matrix_cache_dir:
+                    self._save_matrix_cache(*loaded, cache_key)
+            matrix, doc_ids = loaded
+            norms = self._row_norms(matrix)
+            with self._matrix_lock:
+                self._set_matrix(matrix, doc_ids, norms)
+                for change in self._pending_changes:
+                    self._apply_change_locked(change)
+                self._mat_version += 1
+        finally:
+            with self._matrix_lock:
+                self._pending_changes = None
+
+    def _set_matrix(self, matrix: Any, doc_ids: list, norms: Any) -> None:
+        """Publish a new (matrix, ids, norms) snapshot; caller holds the lock."""
+        self._matrix = self._matrix_buffer = matrix
+        self._norms = self._norm_buffer = norms
+        self._doc_ids = doc_ids
+        self._row_of = None
+        self._dead_rows = 0
+
+    def _drop_matrix(self) -> None:
+        """Drop the in-memory matrix so the next scan rebuilds it."""
+        with self._build_lock:
+            with self._matrix_lock:
+                self._set_matrix(None, [], None)
+                self._mat_version += 1
+
+    def _invalidate_matrix(self) -> None:
+        """Drop the in-memory and persisted matrix so the next scan rebuilds it.
+
+        The persisted cache is removed explicitly so the rebuild never has to
+        rely on its validity check to notice our own writes.
+        """
+        with self._build_lock:
+            with self._matrix_lock:
+                self._set_matrix(None, [], None)
+                self._mat_version += 1
+            if self.matrix_cache_dir:
+                for path in self._matrix_cache_paths():
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+
+    def _build_matrix(self) -> tuple[Any, list]:
+        """Fetch all document vectors from MongoDB into a single matrix.
+
+        Documents are read as ``RawBSONDocument`` so only the ``_id`` and
+        vector field are ever decoded, and packed BSON vectors go straight
+        into NumPy without a Python float per component.
+        """
+        raw_collection = self.collection.with_options(
+            codec_options=self.CodecOptions(document_class=self.RawBSONDocument)
+        )
+        vectors = []
+        doc_ids = []
+        for doc in raw_collection.find(
+            {self.vector_field: {"$exists": True}},
+            projection={self.vector_field: 1},  # _id is included by default
+            limit=10000,  # Safety limit
+        ):
+            vector = doc.get(self.vector_field)
+            if not vector:
+                continue
+            vectors.append(self._decode_vector(vector))
+            doc_ids.append(doc.get("_id"))
+
+        matrix = self.np.asarray(vectors, dtype=self.np.float32)
+        logger.info(f"Loaded embedding matrix with {len(doc_ids)} documents")
+        return self._quantize(matrix), doc_ids
+
+    def _decode_vector(self, value: Any) -> Any:
+        """Convert a stored vector to a float32 NumPy array.
+
+        BSON vectors (binary subtype 9) are reinterpreted in place with
+        ``np.frombuffer``; plain arrays of numbers go through ``np.asarray``.
+
+        Raises:
+            ValueError: If the BSON vector uses an unsupported dtype
+        """
+        np = self.np
+        if getattr(value, "subtype", None) == _BSON_VECTOR_SUBTYPE:
+            # Byte 0 is the element dtype, byte 1 the bit padding
+            if value[0] == _BSON_VECTOR_FLOAT32:
+                return np.frombuffer(value, dtype="<f4", offset=2)
+            if value[0] == _BSON_VECTOR_INT8:
+                return np.frombuffer(value, dtype=np.int8, offset=2).astype(np.float32)
+            raise ValueError(f"Unsupported BSON vector dtype: {value[0]:#04x}")
+        return np.asarray(value, dtype=np.float32)
+
+    def _start_watcher(self) -> None:
+        """Open the change stream, then consume it on a daemon thread.
+
+        The stream is opened before any matrix build, so every write after
+        the build's scan is delivered to the watcher.
+
+        Raises:
+            ConfigError: If the deployment does not support change streams
+                (e.g. a standalone server rather than a replica set)
+        """
+        try:
+            stream = self._open_change_stream()
+        except Exception as e:
+            raise ConfigError(
+                f"MongoDB watch_changes requires change streams (replica set or "
+                f"Atlas): {e}"
+            ) from e
+
+        self._watch_thread = threading.Thread(
+            target=self._watch_loop,
+            args=(stream,),
+            name=f"mongodb-watch-{self.collection_name}",
+            daemon=True,
+        )
+        self._watch_thread.start()
+        logger.info(f"Watching {self.collection_name} for embedding changes")
+
+    def _open_change_stream(self) -> Any:
+        """Watch the inserts, replacements, deletes and vector updates.
+
+        Updates that do not touch ``vector_field`` are filtered out on the
+        server.
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {"operationType": {"$in": ["insert", "replace", "delete"]}},
+                        {
+                            "operationType": "update",
+                            f"updateDescription.updatedFields.{self.vector_field}": {
+                                "$exists": True
+                            },
+                        },
+                        {
+                            "operationType": "update",
+                            "updateDescription.removedFields": self.vector_field,
+                        },
+                    ]
+                }
+            }
+        ]
+        return self.collection.watch(
+            pipeline, full_document="updateLookup", max_await_time_ms=1000
+        )
+
+    def _watch_loop(self, stream: Any) -> None:
+        """Apply change-stream events to the matrix until ``close()`` is called.
+
+        Whenever the stream ends, whether on an error or normally (e.g. after
+        an invalidate event), a new stream is opened first and the matrix is
+        dropped after, so the next search rebuilds it with nothing missed.
+        """
+        while True:
+            try:
+                with stream:
+                    while not self._watch_stop.is_set() and stream.alive:
+                        change = stream.try_next()
+                        if change is not None:
+                            self._apply_change(change)
+                reason = "stream closed"
+            except Exception as e:
+                reason = str(e)
+            if self._watch_stop.is_set():
+                return
+
+            logger.warning(
+                f"MongoDB change stream stopped ({reason}); reopening it and "
+                f"reloading the matrix"
             )
-            return chunks
+            delay = _WATCH_RETRY_SECONDS
+            stream = None
+            while stream is None:
+                if self._watch_stop.wait(delay):
+                    return
+                try:
+                    stream = self._open_change_stream()
+                except Exception as e:
+                    logger.warning(f"Failed to reopen MongoDB change stream: {e}")
+                    delay = min(delay * 2, _WATCH_RETRY_MAX_SECONDS)
+            self._drop_matrix()
 
-        except self.PyMongoError as e:
-            logger.error(f"MongoDB query failed: {e}")
-            raise RunError(f"MongoDB query failed: {e}") from e
+    def _apply_change(self, change: dict) -> None:
+        """Apply one change-stream event to the cached matrix.
+
+        Events arriving while the matrix is being built are queued for the
+        build to replay; with no matrix and no build, the next build reads
+        the current state anyway.
+        """
+        with self._matrix_lock:
+            if self._matrix is None:
+                if self._pending_changes is not None:
+                    self._pending_changes.append(change)
+                return
+            self._apply_change_locked(change)
+
+        logger.debug(
+            f"Applied {change['operationType']} for "
+            f"{change['documentKey']['_id']} to matrix"
+        )
+
+    def _apply_change_locked(self, change: dict) -> None:
+        """Apply a change to the published matrix; caller holds the lock.
+
+        Rows are written in place, so steady-state changes cost one row;
+        searches reading the same arrays may see a row before or after the
+        write. Deleted rows are marked with a None id and zero norm, and
+        compacted away once they make up a quarter of the matrix. Only growth
+        and compaction publish new arrays, so rows never shift under a search.
+        """
+        doc_id = change["documentKey"]["_id"]
+        document = change.get("fullDocument") or {}
+        vector = document.get(self.vector_field)
+
+        if self._row_of is None:
+            self._row_of = {
+                row_id: row
+                for row, row_id in enumerate(self._doc_ids)
+                if row_id is not None
+            }
+        row = self._row_of.get(doc_id)
+
+        if change["operationType"] != "delete" and vector:
+            new_row = self._quantize(self._decode_vector(vector)[None, :])
+            if row is None:
+                row = len(self._doc_ids)
+            self._reserve_rows(row + 1, new_row.shape[1])
+            self._matrix_buffer[row] = new_row[0]
+            self._norm_buffer[row] = self._row_norms(new_row)[0]
+            if row == len(self._doc_ids):
+                self._doc_ids.append(doc_id)
+                self._row_of[doc_id] = row
+                self._matrix = self._matrix_buffer[: row + 1]
+                self._norms = self._norm_buffer[: row + 1]
+        elif row is not None:
+            del self._row_of[doc_id]
+            self._doc_ids[row] = None
+            self._norm_buffer[row] = 0.0
+            self._dead_rows += 1
+            if self._dead_rows * 4 > len(self._doc_ids):
+                self._compact_rows()
+        else:
+            return
+
+        self._mat_version += 1
+
+    def _reserve_rows(self, rows: int, width: int) -> None:
+        """Make the row buffers writable with room for ``rows`` rows.
+
+        Capacity doubles when it runs out. A memory-mapped (read-only)
+        matrix is copied into a writable buffer on its first change.
+        """
+        np = self.np
+        buffer = self._matrix_buffer
+        if buffer.ndim == 2 and buffer.flags.writeable and len(buffer) >= rows:
+            return
+
+        used = len(self._doc_ids)
+        capacity = max(rows, 2 * len(buffer))
+        matrix = np.zeros((capacity, width), dtype=self.matrix_cache_dtype)
+        norms = np.zeros(capacity, dtype=np.float32)
+        if used:
+            matrix[:used] = buffer[:used]
+            norms[:used] = self._norm_buffer[:used]
+        self._matrix_buffer, self._norm_buffer = matrix, norms
+        self._matrix, self._norms = matrix[:used], norms[:used]
+
+    def _compact_rows(self) -> None:
+        """Drop deleted rows into new arrays, published as a new snapshot."""
+        live = [row for row, row_id in enumerate(self._doc_ids) if row_id is not None]
+        index = self.np.asarray(live, dtype=self.np.intp)
+        self._set_matrix(
+            self._matrix_buffer[index],
+            [self._doc_ids[row] for row in live],
+            self._norm_buffer[index],
+        )
+        logger.debug(f"Compacted embedding matrix to {len(live)} rows")
+
+    def _quantize(self, matrix: Any) -> Any:
+        """Convert a float32 matrix to the configured storage dtype.
+
+        int8 uses symmetric scalar quantization. The scale is dropped because
+        it cancels out of the cosine similarity.
+        """
+        if self.matrix_cache_dtype == "int8":
+            max_abs = float(self.np.abs(matrix).max()) if matrix.size else 0.0
+            scale = max_abs / 127.0 if max_abs > 0 else 1.0
+            return self.np.round(matrix / scale).astype(self.np.int8)
+        return matrix.astype(self.matrix_cache_dtype)
 
+    def _matrix_cache_paths(self) -> tuple[Path, Path]:
+        """Return the (matrix, sidecar) file paths for this collection."""
+        stem = f"{self.database_name}.{self.collection_name}.{self.vector_field}"
+        return (
+            self.matrix_cache_dir / f"{stem}.npy",
+            self.matrix_cache_dir / f"{stem}.json",
+        )
+
+    def _matrix_cache_key(self) -> dict[str, Any]:
+        """Describe the collection state a cached matrix is valid for.
+
+        The default key (document count and largest ``_id``) costs two index
+        lookups and catches inserts and deletes, but not in-place vector
+        updates: clear ``matrix_cache_dir`` after those, or enable
+        ``matrix_cache_strict`` to also compare the server's ``dbHash``.
+        """
+        latest = self.collection.find(
+            {}, projection={"_id": 1}, sort=[("_id", -1)], limit=1
+        )
+        key = {
+            "model": self.embedding_model_name,
+            "dtype": self.matrix_cache_dtype,
+            "count": self.collection.estimated_document_count(),
+            "max_id": next(iter(latest), {}).get("_id"),
+        }
+        if self.matrix_cache_strict:
+            key["hash"] = self._collection_hash()
+        return key
+
+    def _collection_hash(self) -> Optional[str]:
+        """Return the server's ``dbHash`` of the collection, if permitted.
+
+        dbHash reads every document and holds a shared lock while it runs,
+        which is why it is opt-in.
+        """
+        try:
+            result = self.database.command("dbHash", collections=[self.collection_name])
+            return result["collections"][self.collection_name]
+        except (self.PyMongoError, KeyError) as e:
+            logger.warning(
+                f"dbHash unavailable; matrix cache cannot detect in-place updates: {e}"
+            )
+            return None
+
+    def _load_matrix_cache(self, key: dict[str, Any]) -> Optional[tuple[Any, list]]:
+        """Memory-map a previously persisted matrix if it is still valid.
+
+        Args:
+            key: Current collection state, from ``_matrix_cache_key``
+
+        Returns:
+            (matrix, doc_ids) or None if no valid cache exists
+        """
+        matrix_path, sidecar_path = self._matrix_cache_paths()
+        if not matrix_path.exists() or not sidecar_path.exists():
+            return None
+
+        try:
+            with open(sidecar_path, encoding="utf-8") as f:
+                sidecar = self.json_util.loads(f.read())
+            if sidecar["key"] != key:
+                logger.info(f"Embedding matrix cache is stale: {matrix_path}")
+                return None
+            matrix = self.np.load(matrix_path, mmap_mode="r")
         except Exception as e:
-            logger.error(f"Unexpected error in MongoDB search: {e}")
-            raise RunError(f"Unexpected error in MongoDB search: {e}") from e
+            logger.warning(f"Ignoring unreadable embedding matrix cache: {e}")
+            return None
+
+        logger.info(f"Memory-mapped embedding matrix from {matrix_path}")
+        return matrix, sidecar["ids"]
+
+    def _save_matrix_cache(
+        self, matrix: Any, doc_ids: list, key: dict[str, Any]
+    ) -> None:
+        """Persist the matrix and a sidecar describing what it was built from."""
+        matrix_path, sidecar_path = self._matrix_cache_paths()
+        try:
+            self.matrix_cache_dir.mkdir(parents=True, exist_ok=True)
+            self.np.save(matrix_path, matrix)
+            with open(sidecar_path, "w", encoding="utf-8") as f:
+                f.write(self.json_util.dumps({"key": key, "ids": doc_ids}))
+            logger.info(f"Saved embedding matrix cache to {matrix_path}")
+        except Exception as e:
+            # A missing cache only costs a rebuild, so never fail the search
+            logger.warning(f"Failed to save embedding matrix cache: {e}")
+
+    def _row_norms(self, matrix: Any) -> Any:
+        """Compute the L2 norm of every matrix row, in float32 blocks."""
+        np = self.np
+        norms = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), _SCORE_BLOCK_ROWS):
+            block = np.asarray(
+                matrix[start : start + _SCORE_BLOCK_ROWS], dtype=np.float32
+            )
+            norms[start : start + len(block)] = np.linalg.norm(block, axis=1)
+        return norms
+
+    def _cosine_scores(self, matrix: Any, norms: Any, query_vectors: Any) -> Any:
+        """Compute cosine similarity of every matrix row against each query.
+
+        Rows are upcast to float32 in blocks so quantized or memory-mapped
+        matrices never need a full float32 copy. Row norms are precomputed
+        when the matrix is loaded, so each query only costs the dot products.
+
+        Args:
+            matrix: Document embeddings, shape (documents, dimensions)
+            norms: Row norms of ``matrix``, shape (documents,)
+            query_vectors: Query embeddings, shape (batch, dimensions)
+
+        Returns:
+            Similarity scores, shape (documents, batch)
+        """
+        np = self.np
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        query_norms = np.linalg.norm(queries, axis=1)
+        scores = np.zeros((len(matrix), len(queries)), dtype=np.float32)
+
+        for start in range(0, len(matrix), _SCORE_BLOCK_ROWS):
+            block = np.asarray(
+                matrix[start : start + _SCORE_BLOCK_ROWS], dtype=np.float32
+            )
+            dots = block @ queries.T
+            denom = np.outer(norms[start : start + len(block)], query_norms)
+            np.divide(
+                dots, denom, out=scores[start : start + len(block)], where=denom > 0
+            )
+
+        return scores
+
+    def _payload_projection(self) -> dict[str, Any]:
+        """Projection for the fields needed to build a RetrievedChunk.
+
+        Leaves out the (large) vector field and any unused document fields.
+        """
+        projection = {"_id": 1, self.text_field: 1, self.source_field: 1}
+        for field in self.metadata_fields:
+            projection[field] = 1
+        return projection
+
+    def _fetch_documents(self, doc_ids: list) -> dict[Any, dict]:
+        """Fetch result payloads for the given ids, keyed by ``_id``."""
+        return {
+            doc["_id"]: doc
+            for doc in self.collection.find(
+                {"_id": {"$in": doc_ids}}, projection=self._payload_projection()
+            )
+        }
+
+    def _load_embedding_model(self) -> Any:
+        """Instantiate the sentence-transformers model on the configured backend.
+
+        The ONNX Runtime backend exports the model on first load and runs it
+        on the CPU execution provider, cutting per-query encode latency.
+        Pooling and normalization stay identical to the PyTorch model.
+
+        Raises:
+            ConfigError: If the ONNX backend is requested but unavailable
+        """
+        if not self.use_onnx:
+            return self.SentenceTransformer(self.embedding_model_name)
+
+        try:
+            return self.SentenceTransformer(
+                self.embedding_model_name,
+                backend="onnx",
+                model_kwargs={"provider": "CPUExecutionProvider"},
+            )
+        except (ImportError, TypeError) as e:
+            raise ConfigError(
+                "use_onnx requires sentence-transformers>=3.2 with ONNX support. "
+                f"Install with: pip install 'sentence-transformers[onnx]'. Error: {e}"
+            ) from e
+
+    def _set_num_threads(self, num_threads: int) -> None:
+        """Pin the number of CPU threads torch uses for inference.
+
+        Args:
+            num_threads: Thread count passed to ``torch.set_num_threads``
+        """
+        try:
+            import torch
+
+            torch.set_num_threads(num_threads)
+            logger.debug(f"torch inference threads set to {num_threads}")
+        except ImportError:
+            logger.warning("torch not available, ignoring num_threads setting")
+
+    def _warmup_model(self) -> None:
+        """Run a throwaway encode so the first search avoids cold-start cost.
+
+        PyTorch allocates buffers and selects kernels lazily on the first
+        forward pass, which makes the first query much slower than the rest.
+        The warmup call bypasses the query cache so it never occupies a slot.
+        """
+        try:
+            self.embedding_model.encode(
+                "warmup", convert_to_numpy=True, show_progress_bar=False
+            )
+        except Exception as e:
+            logger.warning(f"Embedding model warmup failed: {e}")
 
     def _generate_embedding(self, text: str) -> Any:
         """Generate embedding vector for text.
@@ -243,12 +1290,23 @@ class MongoDBProvider(Provider):
             RunError: If embedding generation fails
         """
         try:
-            embedding = self.embedding_model.encode(text, convert_to_numpy=True)
-            return embedding
+            return self._encode(text)
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise RunError(f"Failed to generate embedding: {e}") from e
 
+    def _encode_uncached(self, text: str) -> Any:
+        """Run the embedding model for a single text.
+
+        The returned array is marked read-only because it may be shared
+        through the embedding cache.
+        """
+        embedding = self.embedding_model.encode(
+            text, convert_to_numpy=True, normalize_embeddings=True
+        )
+        embedding.flags.writeable = False
+        return embedding
+
     def __repr__(self) -> str:
         """String representation."""
         return f"MongoDBProvider(database='{self.database_name}', collection='{self.collection_name}')"
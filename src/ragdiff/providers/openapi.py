@@ -8,12 +8,20 @@ Configuration:
     endpoint: API endpoint path (string, required)
     method: HTTP method (string, optional, default: "POST")
     auth: Authentication config (dict, required)
-    request_body: Request body template (dict, optional)
+    request_body: Request body template, sent as JSON (dict, optional)
     request_params: Query parameters template (dict, optional)
     response_mapping: JMESPath mappings (dict, required)
     timeout: Request timeout seconds (int, optional, default: 30)
-    retry_count: Number of retries (int, optional, default: 3)
-    retry_delay: Delay between retries (int, optional, default: 1)
+    retry_count: Retries for connection errors and 429/5xx responses (int, optional, default: 3)
+    retry_delay: Backoff factor in seconds, doubled per retry (int, optional, default: 1)
+    pool_maxsize: Max pooled keep-alive connections, also the async client's
+        connection limit (int, optional, default: 10)
+    dedicated_session: Keep a private connection pool instead of sharing one
+        with providers using the same retry policy (bool, optional, default: False)
+    stream_response: Parse the results array incrementally with ijson
+        (bool, optional, default: False; needs a plain dotted results_array)
+    stream_threshold: Content-Length in bytes below which streamed responses
+        are parsed in one shot (int, optional, default: 64000)
 
 Example:
     >>> provider = OpenAPIProvider(config={
@@ -33,13 +41,19 @@ Example:
     ...     }
     ... })
     >>> chunks = provider.search("What is RAG?", top_k=5)
+    >>> batches = provider.search_batch(["What is RAG?", "What is BM25?"])
+    >>> provider.close()
 """
 
-import time
-from typing import Any
+import asyncio
+import heapq
+import threading
+from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 from ..core.errors import ConfigError, RunError
 from ..core.logging import get_logger
@@ -49,6 +63,23 @@ from .openapi_utils import ResponseMapper, TemplateEngine
 
 logger = get_logger(__name__)
 
+# Optional faster JSON parser; falls back to requests' stdlib-based decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Transient statuses worth retrying; other 4xx responses fail immediately
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Host pools kept per shared adapter, for providers pointing at many hosts
+SHARED_POOL_CONNECTIONS = 32
+
+# HTTP adapters (and so connection pools) shared across provider instances,
+# keyed by pool size and retry policy. Auth stays on each provider's session.
+_ADAPTERS: dict[tuple, HTTPAdapter] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
 
 class OpenAPIProvider(Provider):
     """Generic OpenAPI/REST API provider.
@@ -57,6 +88,8 @@ class OpenAPIProvider(Provider):
     No code needed - just YAML configuration.
     """
 
+    REQUIRED_FIELDS = ("base_url", "endpoint", "auth", "response_mapping")
+
     def __init__(self, config: dict):
         """Initialize OpenAPI provider.
 
@@ -68,11 +101,11 @@ class OpenAPIProvider(Provider):
         """
         super().__init__(config)
 
-        # Validate required fields
-        required = ["base_url", "endpoint", "auth", "response_mapping"]
-        for field in required:
-            if field not in config:
-                raise ConfigError(f"OpenAPI provider requires '{field}' in config")
+        # Validate required fields, reporting every missing one at once
+        missing = [field for field in self.REQUIRED_FIELDS if field not in config]
+        if missing:
+            fields = ", ".join(f"'{field}'" for field in missing)
+            raise ConfigError(f"OpenAPI provider requires {fields} in config")
 
         self.base_url = config["base_url"].rstrip("/")
         self.endpoint = config["endpoint"]
@@ -81,6 +114,7 @@ class OpenAPIProvider(Provider):
         self.timeout = config.get("timeout", 30)
         self.retry_count = config.get("retry_count", 3)
         self.retry_delay = config.get("retry_delay", 1)
+        self.pool_maxsize = config.get("pool_maxsize", 10)
 
         # Request templates
         self.request_body_template = config.get("request_body")
@@ -90,9 +124,69 @@ class OpenAPIProvider(Provider):
         self.response_mapper = ResponseMapper(config["response_mapping"])
         self.template_engine = TemplateEngine()
 
+        # Templates are static, so parse them once rather than on every search.
+        # The body is pre-serialized: only substituted values are encoded per
+        # request, and the JSON bytes are sent as-is.
+        self._render_body = (
+            self.template_engine.compile_json(self.request_body_template)
+            if self.request_body_template
+            else None
+        )
+        self._body_headers = (
+            {"Content-Type": "application/json"} if self._render_body else None
+        )
+        self._render_params = (
+            self.template_engine.compile(self.request_params_template)
+            if self.request_params_template
+            else None
+        )
+
+        # Large result arrays can be mapped while the body is still arriving,
+        # but only when results_array translates to an ijson prefix
+        self._stream_prefix = None
+        self.stream_threshold = config.get("stream_threshold", 64_000)
+        if config.get("stream_response", False):
+            self._stream_prefix = self.response_mapper.stream_prefix
+            if self._stream_prefix is None:
+                logger.warning(
+                    "stream_response needs a plain dotted results_array; "
+                    "parsing full responses instead"
+                )
+            else:
+                try:
+                    import ijson
+                except ImportError as e:
+                    raise ConfigError(
+                        "ijson not installed. Install with: pip install ijson"
+                    ) from e
+                self._ijson = ijson
+
         # Extract API key if needed
         self.api_key = config.get("api_key")
 
+        # Reuse keep-alive connections across searches instead of paying a
+        # TCP+TLS handshake per query. Retries and backoff happen inside the
+        # connection pool, which is shared with other providers using the same
+        # retry policy unless a dedicated one is requested.
+        self.dedicated_session = config.get("dedicated_session", False)
+        if self.dedicated_session:
+            adapter = _make_adapter(
+                1, self.pool_maxsize, self.retry_count, self.retry_delay, self.method
+            )
+        else:
+            adapter = _get_shared_adapter(
+                self.pool_maxsize, self.retry_count, self.retry_delay, self.method
+            )
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Auth never depends on the query, so attach it to the session once
+        self._configure_auth()
+
+        # HTTP/2 client for asearch/asearch_batch, created on first use
+        self._aclient = None
+
         logger.debug(
             f"Initialized OpenAPI provider: {self.method} {self.base_url}{self.endpoint}"
         )
@@ -110,36 +204,141 @@ class OpenAPIProvider(Provider):
         Raises:
             RunError: If API request fails
         """
+        url, request_body, request_params = self._build_request(query, top_k)
+
+        # Execute request (retried by the session adapter)
+        if self._stream_prefix is not None:
+            chunks = self._execute_streaming_request(url, request_body, request_params)
+        else:
+            response_json = self._execute_request(url, request_body, request_params)
+            chunks = self._map_response(response_json)
+
+        return self._select_chunks(chunks, top_k)
+
+    async def asearch(self, query: str, top_k: int = 5) -> list[RetrievedChunk]:
+        """Execute search via REST API without blocking the event loop.
+
+        Concurrent calls share one HTTP/2 connection, so a batch of queries
+        pays for a single TLS handshake and overlaps its round trips.
+
+        Args:
+            query: Search query text
+            top_k: Maximum results to return
+
+        Returns:
+            List of RetrievedChunk objects
+
+        Raises:
+            ConfigError: If httpx with HTTP/2 support is not installed
+            RunError: If API request fails
+        """
+        url, request_body, request_params = self._build_request(query, top_k)
+        response_json = await self._aexecute_request(url, request_body, request_params)
+        return self._select_chunks(self._map_response(response_json), top_k)
+
+    async def asearch_batch(
+        self, queries: list[str], top_k: int = 5
+    ) -> list[list[RetrievedChunk]]:
+        """Search many queries concurrently.
+
+        Args:
+            queries: Query texts
+            top_k: Maximum results per query
+
+        Returns:
+            One list of RetrievedChunk objects per query, in input order
+        """
+        return list(await asyncio.gather(*(self.asearch(q, top_k) for q in queries)))
+
+    def search_batch(
+        self, queries: list[str], top_k: int = 5
+    ) -> list[list[RetrievedChunk]]:
+        """Blocking wrapper around ``asearch_batch``.
+
+        Called from a running event loop, where ``asyncio.run`` is not
+        allowed, it falls back to sequential ``search`` calls; async callers
+        should await ``asearch_batch`` instead.
+
+        Args:
+            queries: Query texts
+            top_k: Maximum results per query
+
+        Returns:
+            One list of RetrievedChunk objects per query, in input order
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            logger.warning(
+                "search_batch called inside an event loop, searching sequentially; "
+                "await asearch_batch instead"
+            )
+            return [self.search(query, top_k) for query in queries]
+
+        async def run() -> list[list[RetrievedChunk]]:
+            # The async client is bound to this event loop, so close it here
+            try:
+                return await self.asearch_batch(queries, top_k)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    def _build_request(
+        self, query: str, top_k: int
+    ) -> tuple[str, Optional[bytes], Any]:
+        """Render the request URL, body and query params for a search.
+
+        Args:
+            query: Search query text
+            top_k: Maximum results to return
+
+        Returns:
+            Tuple of (url, JSON body bytes or None, query params or None)
+        """
         # Build request with variable substitution
         variables = {"query": query, "top_k": top_k}
 
-        # Build request body
-        request_body = None
-        if self.request_body_template:
-            request_body = self.template_engine.render(
-                self.request_body_template, variables
-            )
+        # Build request body and query params
+        request_body = self._render_body(variables) if self._render_body else None
+        request_params = self._render_params(variables) if self._render_params else None
 
-        # Build query params
-        request_params = None
-        if self.request_params_template:
-            request_params = self.template_engine.render(
-                self.request_params_template, variables
-            )
+        return f"{self.base_url}{self.endpoint}", request_body, request_params
 
-        # Execute request with retries
-        url = f"{self.base_url}{self.endpoint}"
-        response_json = self._execute_with_retry(
-            url, request_body, request_params, self.retry_count
-        )
+    def _map_response(self, response_json: Any) -> list[Any]:
+        """Map a parsed API response to chunks.
+
+        Raises:
+            RunError: If the response cannot be mapped
+        """
+        try:
+            return self.response_mapper.map_results(response_json)
+        except Exception as e:
+            raise RunError(f"Failed to map API response: {e}") from e
+
+    def _select_chunks(self, chunks: list[Any], top_k: int) -> list[RetrievedChunk]:
+        """Convert mapped chunks to RetrievedChunk and keep the top_k best.
+
+        Args:
+            chunks: Mapper output
+            top_k: Maximum results to return
 
-        # Map response to chunks
+        Returns:
+            List of RetrievedChunk objects, best first
+
+        Raises:
+            RunError: If the chunks cannot be converted
+        """
         try:
-            chunks = self.response_mapper.map_results(response_json)
             # Convert to RetrievedChunk if needed
             retrieved_chunks = []
             for chunk in chunks:
-                if hasattr(chunk, "content"):
+                if isinstance(chunk, RetrievedChunk):
+                    # ResponseMapper output is already final; don't rebuild it
+                    retrieved_chunks.append(chunk)
+                elif hasattr(chunk, "content"):
                     # Already a RetrievedChunk-like object
                     retrieved_chunks.append(
                         RetrievedChunk(
@@ -167,8 +366,13 @@ class OpenAPIProvider(Provider):
                         )
                     )
 
-            # Sort and limit
+            # Sort and limit. For result arrays much larger than top_k, a
+            # bounded heap (O(n log k)) beats a full sort; both are stable.
             if any(c.score is not None for c in retrieved_chunks):
+                if len(retrieved_chunks) > top_k * 4:
+                    return heapq.nlargest(
+                        top_k, retrieved_chunks, key=lambda x: x.score or 0
+                    )
                 retrieved_chunks.sort(key=lambda x: x.score or 0, reverse=True)
 
             return retrieved_chunks[:top_k]
@@ -176,85 +380,301 @@ class OpenAPIProvider(Provider):
         except Exception as e:
             raise RunError(f"Failed to map API response: {e}") from e
 
-    def _execute_with_retry(
-        self,
-        url: str,
-        request_body: Any,
-        request_params: Any,
-        retries_left: int,
+    def close(self) -> None:
+        """Release pooled HTTP connections.
+
+        Shared connection pools stay open for the other providers using them.
+        """
+        if self.dedicated_session:
+            self._session.close()
+
+    async def aclose(self) -> None:
+        """Release the async client's connections, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def _configure_auth(self) -> None:
+        """Apply the configured auth scheme to the session.
+
+        Header credentials become default session headers, query-string API
+        keys default session params, and basic auth the session's auth. The
+        same credentials are kept for the async client.
+
+        Raises:
+            ConfigError: If the auth scheme's credentials are missing
+        """
+        auth_type = self.auth_config.get("type")
+        self._auth_headers: dict[str, str] = {}
+        self._auth_params: dict[str, str] = {}
+        self._basic_auth: Optional[tuple[str, str]] = None
+
+        if auth_type == "bearer":
+            if not self.api_key:
+                raise ConfigError("Bearer auth requires api_key in config")
+            scheme = self.auth_config.get("scheme", "Bearer")
+            header_name = self.auth_config.get("header", "Authorization")
+            self._auth_headers[header_name] = f"{scheme} {self.api_key}"
+
+        elif auth_type == "apikey":
+            if not self.api_key:
+                raise ConfigError("API Key auth requires api_key in config")
+            location = self.auth_config.get("location", "header")
+            param_name = self.auth_config.get("parameter_name", "api_key")
+
+            if location == "header":
+                self._auth_headers[param_name] = self.api_key
+            elif location == "query":
+                self._auth_params[param_name] = self.api_key
+
+        elif auth_type == "basic":
+            username = self.config.get("username")
+            password = self.config.get("password")
+            if not username or not password:
+                raise ConfigError("Basic auth requires username and password in config")
+            self._basic_auth = (username, password)
+
+        self._session.headers.update(self._auth_headers)
+        self._session.params = dict(self._auth_params)
+        if self._basic_auth is not None:
+            self._session.auth = HTTPBasicAuth(*self._basic_auth)
+
+    def _get_async_client(self) -> tuple[Any, Any]:
+        """Return httpx and the HTTP/2 async client, creating it on first use.
+
+        Returns:
+            Tuple of (httpx module, httpx.AsyncClient)
+
+        Raises:
+            ConfigError: If httpx or its HTTP/2 support is not installed
+        """
+        try:
+            import httpx
+
+            if self._aclient is None:
+                # h2 is only imported (and checked) when the transport is built
+                transport = httpx.AsyncHTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=self.pool_maxsize),
+                )
+                self._aclient = httpx.AsyncClient(
+                    transport=transport,
+                    timeout=self.timeout,
+                    headers=self._auth_headers,
+                    params=self._auth_params,
+                    auth=self._basic_auth,
+                )
+        except ImportError as e:
+            raise ConfigError(
+                "httpx with HTTP/2 support not installed. "
+                "Install with: pip install 'httpx[http2]'"
+            ) from e
+        return httpx, self._aclient
+
+    def _execute_request(
+        self, url: str, request_body: Optional[bytes], request_params: Any
     ) -> dict:
-        """Execute HTTP request with exponential backoff retry.
+        """Execute HTTP request.
+
+        Connection errors and transient statuses are retried with exponential
+        backoff by the session's adapter; other errors fail immediately.
 
         Args:
             url: Request URL
-            request_body: Request body (or None)
+            request_body: JSON request body bytes (or None)
             request_params: Query parameters (or None)
-            retries_left: Number of retries remaining
 
         Returns:
-            Response JSON as dict
+            Response JSON as dict (parsed with orjson when installed)
 
         Raises:
-            RunError: If all retries exhausted
+            RunError: If the request fails, all retries are exhausted, or
+                the response body is not valid JSON
         """
         try:
-            # Build auth
-            headers = {}
-            auth = None
-
-            if self.auth_config.get("type") == "bearer":
-                if not self.api_key:
-                    raise ConfigError("Bearer auth requires api_key in config")
-                scheme = self.auth_config.get("scheme", "Bearer")
-                header_name = self.auth_config.get("header", "Authorization")
-                headers[header_name] = f"{scheme} {self.api_key}"
-
-            elif self.auth_config.get("type") == "apikey":
-                if not self.api_key:
-                    raise ConfigError("API Key auth requires api_key in config")
-                location = self.auth_config.get("location", "header")
-                param_name = self.auth_config.get("parameter_name", "api_key")
-
-                if location == "header":
-                    headers[param_name] = self.api_key
-                elif location == "query":
-                    if request_params is None:
-                        request_params = {}
-                    request_params[param_name] = self.api_key
-
-            elif self.auth_config.get("type") == "basic":
-                username = self.config.get("username")
-                password = self.config.get("password")
-                if not username or not password:
-                    raise ConfigError(
-                        "Basic auth requires username and password in config"
-                    )
-                auth = HTTPBasicAuth(username, password)
-
-            # Execute request
-            response = requests.request(
+            response = self._session.request(
                 method=self.method,
                 url=url,
-                json=request_body if request_body else None,
+                data=request_body,
+                headers=self._body_headers,
                 params=request_params if request_params else None,
-                headers=headers if headers else None,
-                auth=auth,
                 timeout=self.timeout,
             )
             response.raise_for_status()
-            return response.json()
+            return _decode_json(response)
 
         except requests.exceptions.RequestException as e:
-            if retries_left > 0:
-                logger.warning(
-                    f"API request failed, retrying... ({retries_left} retries left): {e}"
-                )
-                time.sleep(self.retry_delay * (self.retry_count - retries_left + 1))
-                return self._execute_with_retry(
-                    url, request_body, request_params, retries_left - 1
+            raise RunError(f"API request failed: {e}") from e
+        except ValueError as e:
+            raise RunError(f"API returned invalid JSON: {e}") from e
+
+    async def _aexecute_request(
+        self, url: str, request_body: Optional[bytes], request_params: Any
+    ) -> dict:
+        """Execute HTTP request on the async client.
+
+        Mirrors the session adapter's policy: connection errors and
+        transient statuses are retried with exponential backoff, other
+        errors fail immediately.
+
+        Args:
+            url: Request URL
+            request_body: JSON request body bytes (or None)
+            request_params: Query parameters (or None)
+
+        Returns:
+            Response JSON as dict
+
+        Raises:
+            RunError: If the request fails, all retries are exhausted, or
+                the response body is not valid JSON
+        """
+        httpx, client = self._get_async_client()
+        for attempt in range(self.retry_count + 1):
+            try:
+                response = await client.request(
+                    self.method,
+                    url,
+                    content=request_body,
+                    headers=self._body_headers,
+                    params=request_params if request_params else None,
                 )
+            except httpx.TransportError as e:
+                if attempt == self.retry_count:
+                    raise RunError(f"API request failed: {e}") from e
             else:
-                raise RunError(f"API request failed after all retries: {e}") from e
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or attempt == self.retry_count
+                ):
+                    break
+            await asyncio.sleep(self.retry_delay * 2**attempt)
+
+        try:
+            response.raise_for_status()
+            return _decode_json(response)
+        except httpx.HTTPStatusError as e:
+            raise RunError(f"API request failed: {e}") from e
+        except ValueError as e:
+            raise RunError(f"API returned invalid JSON: {e}") from e
+
+    def _execute_streaming_request(
+        self, url: str, request_body: Optional[bytes], request_params: Any
+    ) -> list[RetrievedChunk]:
+        """Execute HTTP request and map results while the body streams in.
+
+        Items under the results array are parsed one at a time from the
+        socket and handed to the response mapper, so the full response tree
+        is never materialized. Bodies whose Content-Length is below
+        ``stream_threshold`` are cheaper to parse in one shot and skip the
+        incremental parser.
+
+        Args:
+            url: Request URL
+            request_body: JSON request body bytes (or None)
+            request_params: Query parameters (or None)
+
+        Returns:
+            Mapped RetrievedChunk objects, in API order
+
+        Raises:
+            RunError: If the request fails or the body is not valid JSON
+        """
+        try:
+            with self._session.request(
+                method=self.method,
+                url=url,
+                data=request_body,
+                headers=self._body_headers,
+                params=request_params if request_params else None,
+                timeout=self.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                content_length = response.headers.get("Content-Length")
+                if (
+                    content_length is not None
+                    and int(content_length) < self.stream_threshold
+                ):
+                    try:
+                        response_json = _decode_json(response)
+                    except ValueError as e:
+                        raise RunError(f"API returned invalid JSON: {e}") from e
+                    return self._map_response(response_json)
+
+                # Undo gzip/deflate transfer encoding when reading the raw body
+                response.raw.decode_content = True
+                items = self._ijson.items(
+                    response.raw, self._stream_prefix, use_float=True
+                )
+                return self.response_mapper.map_stream(items)
+
+        except requests.exceptions.RequestException as e:
+            raise RunError(f"API request failed: {e}") from e
+        except (self._ijson.JSONError, self._ijson.IncompleteJSONError) as e:
+            raise RunError(f"API returned invalid JSON: {e}") from e
+
+
+def _make_adapter(
+    pool_connections: int,
+    pool_maxsize: int,
+    retry_count: int,
+    retry_delay: float,
+    method: str,
+) -> HTTPAdapter:
+    """Build an HTTP adapter that retries connection errors and RETRY_STATUSES.
+
+    Args:
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Max keep-alive connections per host
+        retry_count: Total retries
+        retry_delay: Backoff factor in seconds
+        method: HTTP method allowed to be retried
+
+    Returns:
+        Configured HTTPAdapter
+    """
+    retry = Retry(
+        total=retry_count,
+        backoff_factor=retry_delay,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset([method]),
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+
+
+def _get_shared_adapter(
+    pool_maxsize: int, retry_count: int, retry_delay: float, method: str
+) -> HTTPAdapter:
+    """Return the process-wide adapter for a pool size and retry policy.
+
+    Providers hitting the same hosts with the same policy then reuse each
+    other's keep-alive connections instead of each opening their own.
+
+    Returns:
+        HTTPAdapter shared by every caller with the same arguments
+    """
+    key = (pool_maxsize, retry_count, retry_delay, method)
+    with _ADAPTERS_LOCK:
+        adapter = _ADAPTERS.get(key)
+        if adapter is None:
+            adapter = _make_adapter(SHARED_POOL_CONNECTIONS, *key)
+            _ADAPTERS[key] = adapter
+        return adapter
+
+
+def _decode_json(response: Any) -> Any:
+    """Parse a requests or httpx response body, with orjson when installed.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 # Register the provider
@@ -1,8 +1,11 @@
 """Response mapping engine for OpenAPI provider using JMESPath."""
 
+import json
 import logging
 import re
-from typing import Any
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 import jmespath
 
@@ -11,6 +14,74 @@ from ..core.models import RetrievedChunk
 
 logger = logging.getLogger(__name__)
 
+# Optional faster JSON encoder for pre-serialized request bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Divisors for declared score scales (see ResponseMapper "score_scale")
+SCORE_SCALES = {"unit": 1.0, "percent": 100.0, "per_mille": 1000.0}
+
+# Pattern to match ${variable_name}
+_VARIABLE_PATTERN = re.compile(r"\$\{(\w+)\}")
+
+
+# Plain dotted identifiers such as "content.text", which need no JMESPath
+_FLAT_PATH_PATTERN = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*", re.ASCII)
+
+
+class _FlatPath:
+    """Dict-lookup stand-in for a compiled JMESPath of plain dotted keys.
+
+    Matches JMESPath semantics for such paths: a missing key or a non-object
+    along the way yields None.
+    """
+
+    __slots__ = ("expression", "keys")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.keys = tuple(expression.split("."))
+
+    def search(self, value: Any) -> Any:
+        for key in self.keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+
+@lru_cache(maxsize=512)
+def _compile_jmespath(expression: str) -> Any:
+    """Compile a JMESPath expression, shared across mappers in the process.
+
+    Mappers built from the same config (multiple providers, reloads) reuse
+    one parsed expression instead of re-parsing it.
+    """
+    return jmespath.compile(expression)
+
+
+def _compile_path(expression: str) -> Any:
+    """Compile a field expression, bypassing JMESPath for flat dotted paths.
+
+    Returns:
+        Object with a ``search(data)`` method
+    """
+    if _FLAT_PATH_PATTERN.fullmatch(expression):
+        return _FlatPath(expression)
+    return _compile_jmespath(expression)
+
+
+@lru_cache(maxsize=1024)
+def _split_template(template: str) -> tuple[str, ...]:
+    """Split a template string into alternating literals and variable names.
+
+    ``"a-${x}-b"`` becomes ``("a-", "x", "-b")``. Template strings come from
+    static config, so each one is scanned by the regex only once per process.
+    """
+    return tuple(_VARIABLE_PATTERN.split(template))
+
 
 class TemplateEngine:
     """Handle template variable substitution in requests.
@@ -26,10 +97,14 @@ class TemplateEngine:
         variables = {"query": "test", "top_k": 5}
         result = engine.render(template, variables)
         # result: {"query": "test", "limit": 5}
+
+        # Static templates can be parsed once and rendered many times
+        render_body = engine.compile(template)
+        result = render_body(variables)
     """
 
     # Pattern to match ${variable_name}
-    VARIABLE_PATTERN = re.compile(r"\$\{(\w+)\}")
+    VARIABLE_PATTERN = _VARIABLE_PATTERN
 
     def render(self, template: Any, variables: dict[str, Any]) -> Any:
         """Render template with variable substitution.
@@ -51,6 +126,138 @@ class TemplateEngine:
             # Primitive types (int, float, bool, None) pass through
             return template
 
+    def compile(self, template: Any) -> Callable[[dict[str, Any]], Any]:
+        """Parse a template once into a reusable render function.
+
+        Produces the same output as ``render`` but scans each string for
+        variables only here, so rendering is just lookups and joins. Every
+        call returns fresh dicts and lists, so callers may mutate the result.
+
+        Args:
+            template: Template data (dict, list, string, or primitive)
+
+        Returns:
+            Function mapping a variables dict to the rendered data
+
+        Example:
+            >>> render = TemplateEngine().compile({"q": "${query}"})
+            >>> render({"query": "test"})
+            {'q': 'test'}
+        """
+        if isinstance(template, str):
+            return self._compile_string(template)
+        elif isinstance(template, dict):
+            items = [(k, self.compile(v)) for k, v in template.items()]
+            return lambda variables: {k: render(variables) for k, render in items}
+        elif isinstance(template, list):
+            renders = [self.compile(item) for item in template]
+            return lambda variables: [render(variables) for render in renders]
+        else:
+            # Primitive types (int, float, bool, None) pass through
+            return lambda variables: template
+
+    def compile_json(self, template: Any) -> Callable[[dict[str, Any]], bytes]:
+        """Parse a template once into a function rendering JSON bytes.
+
+        The static parts of the template are serialized here; rendering only
+        serializes the substituted values and joins the byte segments, so no
+        intermediate dict is built and re-encoded per request. The result
+        decodes to the same data as ``render``.
+
+        Args:
+            template: Template data (dict, list, string, or primitive)
+
+        Returns:
+            Function mapping a variables dict to the rendered JSON body
+
+        Example:
+            >>> render = TemplateEngine().compile_json({"q": "${query}"})
+            >>> render({"query": "test"})
+            b'{"q":"test"}'
+        """
+        # Adjacent literal segments are merged so rendering joins few pieces
+        segments: list[Any] = []
+        for piece in self._json_pieces(template):
+            if (
+                isinstance(piece, bytes)
+                and segments
+                and isinstance(segments[-1], bytes)
+            ):
+                segments[-1] += piece
+            else:
+                segments.append(piece)
+
+        if len(segments) == 1 and isinstance(segments[0], bytes):
+            body = segments[0]
+            return lambda variables: body
+
+        def render_json(variables: dict[str, Any]) -> bytes:
+            return b"".join(
+                segment if segment.__class__ is bytes else segment(variables)
+                for segment in segments
+            )
+
+        return render_json
+
+    def _json_pieces(self, template: Any) -> list[Any]:
+        """Split a template into literal JSON bytes and value renderers."""
+        if isinstance(template, dict):
+            pieces: list[Any] = [b"{"]
+            for i, (key, value) in enumerate(template.items()):
+                pieces.append((b"," if i else b"") + _dumps(str(key)) + b":")
+                pieces.extend(self._json_pieces(value))
+            pieces.append(b"}")
+            return pieces
+        elif isinstance(template, list):
+            pieces = [b"["]
+            for i, item in enumerate(template):
+                if i:
+                    pieces.append(b",")
+                pieces.extend(self._json_pieces(item))
+            pieces.append(b"]")
+            return pieces
+        elif isinstance(template, str) and len(_split_template(template)) > 1:
+            render = self._compile_string(template)
+            return [lambda variables: _dumps(render(variables))]
+        else:
+            # Literal strings and primitives are serialized once
+            return [_dumps(template)]
+
+    def _compile_string(self, template: str) -> Callable[[dict[str, Any]], Any]:
+        """Compile a string template (see ``compile``)."""
+        # Alternating literals and variable names: (lit, var, lit, var, lit)
+        parts = _split_template(template)
+
+        if len(parts) == 1:
+            return lambda variables: template
+
+        # Exactly "${var}": return the value itself to preserve its type
+        if len(parts) == 3 and not parts[0] and not parts[2]:
+            var_name = parts[1]
+
+            def render_value(variables: dict[str, Any]) -> Any:
+                try:
+                    return variables[var_name]
+                except KeyError:
+                    raise ConfigError(
+                        f"Template variable '${{{var_name}}}' not provided"
+                    ) from None
+
+            return render_value
+
+        def render_string(variables: dict[str, Any]) -> str:
+            rendered = list(parts)
+            for i in range(1, len(parts), 2):
+                try:
+                    rendered[i] = str(variables[parts[i]])
+                except KeyError:
+                    raise ConfigError(
+                        f"Template variable '${{{parts[i]}}}' not provided"
+                    ) from None
+            return "".join(rendered)
+
+        return render_string
+
     def _render_string(self, template: str, variables: dict[str, Any]) -> Any:
         """Render a string template.
 
@@ -61,32 +268,31 @@ class TemplateEngine:
         Returns:
             Rendered value (string or original type if fully substituted)
         """
-        # Find all ${var} patterns
-        matches = list(self.VARIABLE_PATTERN.finditer(template))
+        parts = _split_template(template)
 
-        if not matches:
+        if len(parts) == 1:
             return template
 
         # If template is exactly "${var}", return the variable's value directly
         # This preserves type (e.g., ${top_k} returns int 5, not string "5")
-        if len(matches) == 1 and matches[0].group(0) == template:
-            var_name = matches[0].group(1)
+        if len(parts) == 3 and not parts[0] and not parts[2]:
+            var_name = parts[1]
             if var_name in variables:
                 return variables[var_name]
             else:
                 raise ConfigError(f"Template variable '${{{var_name}}}' not provided")
 
         # Otherwise, do string substitution
-        result = template
-        for match in matches:
-            var_name = match.group(1)
+        rendered = list(parts)
+        for i in range(1, len(parts), 2):
+            var_name = parts[i]
             if var_name in variables:
                 # Convert to string for substitution
-                result = result.replace(match.group(0), str(variables[var_name]))
+                rendered[i] = str(variables[var_name])
             else:
                 raise ConfigError(f"Template variable '${{{var_name}}}' not provided")
 
-        return result
+        return "".join(rendered)
 
 
 class ResponseMapper:
@@ -104,8 +310,13 @@ class ResponseMapper:
                 "score": "relevance_score",
                 "source": "source.name",
                 "metadata": "{author: metadata.author, date: published}"
-            }
+            },
+            "score_scale": "percent"
         }
+
+    ``score_scale`` is optional. When omitted, each score's range is guessed
+    individually; declaring it ("unit", "percent" or "per_mille") fixes the
+    normalization once so every score is divided and clamped the same way.
     """
 
     def __init__(self, mapping_config: dict[str, Any]):
@@ -115,6 +326,7 @@ class ResponseMapper:
             mapping_config: Mapping configuration dict with:
                 - results_array: JMESPath to array of results
                 - fields: Dict of field mappings (id, text, score, etc.)
+                - score_scale: Optional fixed score scale ("unit", "percent", "per_mille")
 
         Raises:
             ConfigError: If mapping config is invalid
@@ -127,18 +339,32 @@ class ResponseMapper:
         if "fields" not in mapping_config:
             raise ConfigError("Missing 'fields' in response_mapping")
 
-        # Compile JMESPath expressions for efficiency
-        self.results_array_expr = jmespath.compile(mapping_config["results_array"])
+        # A declared scale replaces the per-score range guessing
+        score_scale = mapping_config.get("score_scale")
+        if score_scale is not None:
+            if score_scale not in SCORE_SCALES:
+                raise ConfigError(
+                    f"Invalid score_scale '{score_scale}'. "
+                    f"Must be one of: {', '.join(SCORE_SCALES)}"
+                )
+            self._normalize_score = _scaled_normalizer(SCORE_SCALES[score_scale])
+
+        # Compile JMESPath expressions for efficiency. The results path and
+        # field paths that are plain dotted keys become direct dict lookups.
+        self.results_array_expr = _compile_path(mapping_config["results_array"])
 
         self.field_exprs = {}
         for field_name, jmespath_str in mapping_config["fields"].items():
             try:
-                self.field_exprs[field_name] = jmespath.compile(jmespath_str)
+                self.field_exprs[field_name] = _compile_path(jmespath_str)
             except Exception as e:
                 raise ConfigError(
                     f"Invalid JMESPath for field '{field_name}': {jmespath_str}. Error: {e}"
                 ) from e
 
+        # Field set is fixed per config, so build the per-item mapper once
+        self._map_item_fn = self._compile_item_mapper()
+
     def map_results(self, response: dict) -> list[RetrievedChunk]:
         """Extract RetrievedChunk objects from API response.
 
@@ -160,9 +386,10 @@ class ResponseMapper:
             ) from e
 
         if results_array is None:
-            logger.warning(
-                f"Results array not found using path '{self.mapping_config['results_array']}'"
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"Results array not found using path '{self.mapping_config['results_array']}'"
+                )
             return []
 
         if not isinstance(results_array, list):
@@ -170,18 +397,123 @@ class ResponseMapper:
                 f"Results array is not a list: got {type(results_array).__name__}"
             )
 
-        # Map each result item to RagResult
+        # Well-formed pages are the norm, so map them without per-item
+        # exception handling and only redo the page item by item when
+        # something fails
+        map_item = self._map_item_fn
+        try:
+            return [map_item(item, idx) for idx, item in enumerate(results_array)]
+        except Exception:
+            return self.map_stream(results_array)
+
+    @property
+    def stream_prefix(self) -> Optional[str]:
+        """Incremental-parser prefix for the results array items.
+
+        Only plain dotted ``results_array`` paths (``data.results``) translate
+        to an ijson prefix (``data.results.item``); paths using JMESPath
+        operators return None and need the full response.
+        """
+        path = self.mapping_config["results_array"]
+        if not _FLAT_PATH_PATTERN.fullmatch(path):
+            return None
+        return f"{path}.item"
+
+    def map_stream(self, items: Iterable[Any]) -> list[RetrievedChunk]:
+        """Map result items as they are produced.
+
+        Items that fail to map are logged and skipped, as in ``map_results``.
+        Errors raised by the iterable itself propagate to the caller.
+
+        Args:
+            items: Result items, e.g. from an incremental JSON parser
+
+        Returns:
+            List of RetrievedChunk objects
+        """
+        map_item = self._map_item_fn
+
+        if isinstance(items, list):
+            # Size is known: fill a preallocated list, then trim skipped slots
+            rag_results = [None] * len(items)
+            write = 0
+            for idx, item in enumerate(items):
+                try:
+                    rag_results[write] = map_item(item, idx)
+                    write += 1
+                except Exception as e:
+                    _log_skipped_item(idx, e)
+            del rag_results[write:]
+            return rag_results
+
         rag_results = []
-        for idx, item in enumerate(results_array):
+        for idx, item in enumerate(items):
             try:
-                rag_result = self._map_item(item, idx)
-                rag_results.append(rag_result)
+                rag_results.append(map_item(item, idx))
             except Exception as e:
-                logger.warning(f"Failed to map result item {idx}: {e}")
-                continue
+                _log_skipped_item(idx, e)
 
         return rag_results
 
+    def _compile_item_mapper(self) -> Callable[[dict, int], RetrievedChunk]:
+        """Build an item mapper specialized to the configured fields.
+
+        The returned function binds the compiled expressions and score
+        normalizer as locals and skips unconfigured optional fields
+        entirely, instead of looking each field up per item. It produces the
+        same chunks and errors as ``_map_item``, which remains the fallback
+        when a required field has no mapping.
+
+        Returns:
+            Function mapping (item, index) to a RetrievedChunk
+        """
+        fields = self.mapping_config["fields"]
+        if "text" not in self.field_exprs or "score" not in self.field_exprs:
+            return self._map_item
+
+        text_expr = self.field_exprs["text"]
+        score_expr = self.field_exprs["score"]
+        id_expr = self.field_exprs.get("id")
+        source_expr = self.field_exprs.get("source")
+        metadata_expr = self.field_exprs.get("metadata")
+        normalize = self._normalize_score
+
+        def map_item(item: dict, index: int) -> RetrievedChunk:
+            text_value = text_expr.search(item)
+            if text_value is None:
+                raise ConfigError(
+                    f"Required field 'text' is None in item {index}. "
+                    f"JMESPath: {fields['text']}"
+                )
+            score_value = score_expr.search(item)
+            if score_value is None:
+                raise ConfigError(
+                    f"Required field 'score' is None in item {index}. "
+                    f"JMESPath: {fields['score']}"
+                )
+
+            metadata = {}
+            if id_expr is not None:
+                id_value = id_expr.search(item)
+                if id_value is not None:
+                    metadata["id"] = str(id_value)
+            if source_expr is not None:
+                source_value = source_expr.search(item)
+                if source_value is not None:
+                    metadata["source"] = str(source_value)
+            if metadata_expr is not None:
+                metadata_value = metadata_expr.search(item)
+                if isinstance(metadata_value, dict):
+                    metadata.update(metadata_value)
+
+            return RetrievedChunk(
+                content=str(text_value),
+                score=normalize(score_value),
+                metadata=metadata if metadata else None,
+            )
+
+        return map_item
+
     def _map_item(self, item: dict, index: int) -> RetrievedChunk:
         """Map a single result item to RetrievedChunk.
 
@@ -195,15 +527,36 @@ class ResponseMapper:
         Raises:
             ConfigError: If required fields are missing
         """
+        fields = self.mapping_config["fields"]
+        exprs = self.field_exprs
+
         # Extract required fields (note: 'text' field in API becomes 'content' in RetrievedChunk)
-        text_value = self._extract_field(item, "text", required=True, index=index)
-        score_value = self._extract_field(item, "score", required=True, index=index)
+        for field_name in ("text", "score"):
+            if field_name not in exprs:
+                raise ConfigError(
+                    f"Required field '{field_name}' not in mapping configuration"
+                )
+        text_value = exprs["text"].search(item)
+        if text_value is None:
+            raise ConfigError(
+                f"Required field 'text' is None in item {index}. "
+                f"JMESPath: {fields['text']}"
+            )
+        score_value = exprs["score"].search(item)
+        if score_value is None:
+            raise ConfigError(
+                f"Required field 'score' is None in item {index}. "
+                f"JMESPath: {fields['score']}"
+            )
 
         # Extract optional fields
-        id_value = self._extract_field(item, "id", required=False, index=index)
-        source_value = self._extract_field(item, "source", required=False, index=index)
-        metadata_value = self._extract_field(
-            item, "metadata", required=False, index=index
+        id_expr = exprs.get("id")
+        source_expr = exprs.get("source")
+        metadata_expr = exprs.get("metadata")
+        id_value = id_expr.search(item) if id_expr is not None else None
+        source_value = source_expr.search(item) if source_expr is not None else None
+        metadata_value = (
+            metadata_expr.search(item) if metadata_expr is not None else None
         )
 
         # Normalize score to 0-1 range
@@ -224,45 +577,6 @@ class ResponseMapper:
             metadata=metadata if metadata else None,
         )
 
-    def _extract_field(
-        self, item: dict, field_name: str, required: bool, index: int
-    ) -> Any:
-        """Extract a field from result item using JMESPath.
-
-        Args:
-            item: Result item dict
-            field_name: Field name (id, text, score, source, metadata)
-            required: Whether field is required
-            index: Item index (for error messages)
-
-        Returns:
-            Extracted value or None
-
-        Raises:
-            ConfigError: If required field is missing or extraction fails
-        """
-        if field_name not in self.field_exprs:
-            if required:
-                raise ConfigError(
-                    f"Required field '{field_name}' not in mapping configuration"
-                )
-            return None
-
-        try:
-            value = self.field_exprs[field_name].search(item)
-        except Exception as e:
-            raise ConfigError(
-                f"Failed to extract field '{field_name}' from item {index}: {e}"
-            ) from e
-
-        if value is None and required:
-            raise ConfigError(
-                f"Required field '{field_name}' is None in item {index}. "
-                f"JMESPath: {self.mapping_config['fields'][field_name]}"
-            )
-
-        return value
-
     def _normalize_score(self, score: Any) -> float:
         """Normalize score to 0-1 range.
 
@@ -281,21 +595,58 @@ class ResponseMapper:
         Raises:
             ConfigError: If score is not numeric
         """
+        # Scores are usually floats already; skip the conversion for those
+        if score.__class__ is float:
+            score_float = score
+        else:
+            try:
+                score_float = float(score)
+            except (TypeError, ValueError) as e:
+                raise ConfigError(f"Score is not numeric: {score}") from e
+
+        # Normalize based on range, most common case first
+        if 0.0 <= score_float <= 1.0:
+            return score_float
+        if score_float > 1.0:
+            # Assume 0-1000 above 100, otherwise 0-100
+            scale = 1000.0 if score_float > 100.0 else 100.0
+            return score_float / scale if score_float < scale else 1.0
+
+        # Negative (or NaN) scores -> clamp to 0
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(f"Negative score {score_float} clamped to 0")
+        return 0.0
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to compact JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _log_skipped_item(index: int, error: Exception) -> None:
+    """Log a result item that failed to map and is being skipped."""
+    # Bad items can repeat across a large page; format only if emitted
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(f"Failed to map result item {index}: {error}")
+
+
+def _scaled_normalizer(divisor: float):
+    """Build a score normalizer for a known scale.
+
+    Args:
+        divisor: Value that maps to a score of 1.0
+
+    Returns:
+        Function dividing a score by ``divisor`` and clamping to 0-1
+    """
+
+    def normalize(score: Any) -> float:
         try:
             score_float = float(score)
         except (TypeError, ValueError) as e:
             raise ConfigError(f"Score is not numeric: {score}") from e
+        return min(max(score_float / divisor, 0.0), 1.0)
 
-        # Normalize based on range
-        if 0 <= score_float <= 1:
-            return score_float
-        elif score_float > 100:
-            # Assume 0-1000 scale
-            return min(score_float / 1000.0, 1.0)
-        elif score_float > 1:
-            # Assume 0-100 scale
-            return min(score_float / 100.0, 1.0)
-        else:
-            # Negative scores -> clamp to 0
-            logger.warning(f"Negative score {score_float} clamped to 0")
-            return 0.0
+    return normalize
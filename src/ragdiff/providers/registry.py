@@ -49,17 +49,18 @@ def register_tool(name: str, tool_class: type[Provider]) -> None:
             f"Tool name '{name}' must be alphanumeric with hyphens/underscores only"
         )
 
-    if name in TOOL_REGISTRY:
-        logger.warning(
-            f"Tool '{name}' already registered. Overwriting with {tool_class.__name__}"
-        )
-
     if not issubclass(tool_class, Provider):
         raise ConfigError(
             f"Tool class {tool_class.__name__} must inherit from Provider"
         )
 
-    TOOL_REGISTRY[name] = tool_class
+    # One lookup for the common first registration; only overwrites store twice
+    previous = TOOL_REGISTRY.setdefault(name, tool_class)
+    if previous is not tool_class:
+        logger.warning(
+            f"Tool '{name}' already registered. Overwriting with {tool_class.__name__}"
+        )
+        TOOL_REGISTRY[name] = tool_class
     logger.debug(f"Registered tool '{name}' -> {tool_class.__name__}")
 
 
@@ -79,13 +80,13 @@ def get_tool(name: str) -> type[Provider]:
         >>> tool_class = get_tool("vectara")
         >>> system = tool_class(config={"api_key": "..."})
     """
-    if name not in TOOL_REGISTRY:
-        available = ", ".join(sorted(TOOL_REGISTRY.keys()))
+    try:
+        return TOOL_REGISTRY[name]
+    except KeyError:
+        available = ", ".join(sorted(TOOL_REGISTRY))
         raise ConfigError(
             f"Unknown tool '{name}'. Available tools: {available or '(none)'}"
-        )
-
-    return TOOL_REGISTRY[name]
+        ) from None
 
 
 def list_tools() -> list[str]:
@@ -98,7 +99,7 @@ def list_tools() -> list[str]:
         >>> list_tools()
         ['agentset', 'mongodb', 'vectara']
     """
-    return sorted(TOOL_REGISTRY.keys())
+    return sorted(TOOL_REGISTRY)
 
 
 def is_tool_registered(name: str) -> bool:
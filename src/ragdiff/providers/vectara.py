@@ -16,8 +16,13 @@ Example:
     ...     "timeout": 30
     ... })
     >>> chunks = provider.search("What is Islamic law?", top_k=5)
+    >>> chunks = asyncio.run(provider.asearch("What is Islamic law?", top_k=5))
 """
 
+import asyncio
+import json
+import threading
+from itertools import islice
 from typing import Any, Optional
 
 from ..core.errors import ConfigError, RunError
@@ -28,6 +33,52 @@ from .abc import Provider
 
 logger = get_logger(__name__)
 
+# Optional faster JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Transient statuses retried by the pooled session
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Keep-alive session shared by all Vectara providers, created on first search.
+# Every query then reuses a pooled TLS connection instead of opening one.
+_SESSION: Optional[Any] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session(requests: Any) -> Any:
+    """Return the shared pooled session, creating it on first use.
+
+    Args:
+        requests: The ``requests`` module
+
+    Returns:
+        requests.Session with keep-alive pooling and retries on transient errors
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=4, pool_maxsize=16, max_retries=retry
+                ),
+            )
+            _SESSION = session
+        return _SESSION
+
 
 class VectaraProvider(Provider):
     """Vectara RAG provider implementation.
@@ -36,6 +87,12 @@ class VectaraProvider(Provider):
     Supports custom corpus configuration for different knowledge domains.
     """
 
+    # Headers shared by every request; only x-api-key varies per provider
+    STATIC_HEADERS = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
     def __init__(self, config: dict):
         """Initialize Vectara provider.
 
@@ -63,9 +120,18 @@ class VectaraProvider(Provider):
         self.base_url = config.get("base_url", "https://api.vectara.io")
         self.timeout = config.get("timeout", 60)
 
+        # Per-query request invariants, built once
+        self._url = f"{self.base_url}/v2/query"
+        self._headers = {**self.STATIC_HEADERS, "x-api-key": self.api_key}
+        self._corpora = [{"corpus_key": self.corpus_id}]
+
         # Lazy load requests
         self.requests: Optional[Any] = None
 
+        # Async client for asearch, bound to the event loop that created it
+        self._aclient: Optional[Any] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
         logger.debug(f"Initialized VectaraProvider with corpus_id={self.corpus_id}")
 
     def search(self, query: str, top_k: int = 5) -> SearchResult:
@@ -95,104 +161,226 @@ class VectaraProvider(Provider):
 
         try:
             # Prepare Vectara v2 API request
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "x-api-key": self.api_key,
-            }
-
             request_body = {
                 "query": query,
-                "search": {"corpora": [{"corpus_key": self.corpus_id}], "limit": top_k},
+                "search": {"corpora": self._corpora, "limit": top_k},
             }
 
             logger.debug(f"Vectara API request: query='{query[:50]}...', top_k={top_k}")
 
-            # Make API request
-            response = self.requests.post(
-                f"{self.base_url}/v2/query",
-                headers=headers,
-                json=request_body,
+            # Make API request over the pooled keep-alive session
+            response = _get_session(self.requests).post(
+                self._url,
+                headers=self._headers,
+                data=_encode_json(request_body),
                 timeout=self.timeout,
             )
 
             response.raise_for_status()
-            data = response.json()
-
-            # Parse response into RetrievedChunk objects
-            chunks = []
-            total_tokens_returned = 0
-            for doc in data.get("search_results", [])[:top_k]:
-                # Extract text and score
-                text = doc.get("text", "")
-                score = doc.get("score", 0.0)
-
-                # Calculate token count for the chunk
-                chunk_token_count = count_tokens(
-                    "gpt-4o-mini", text
-                )  # Using gpt-4o-mini as a proxy tokenizer
-                total_tokens_returned += chunk_token_count
-
-                # Combine part and document metadata
-                metadata = {}
-                if doc.get("part_metadata"):
-                    metadata.update(doc["part_metadata"])
-                if doc.get("document_metadata"):
-                    metadata.update(doc["document_metadata"])
-
-                # Add document ID to metadata
-                if doc.get("document_id"):
-                    metadata["document_id"] = doc["document_id"]
-
-                # Create chunk
-                chunk = RetrievedChunk(
-                    content=text,
-                    score=score,
-                    token_count=chunk_token_count,
-                    metadata=metadata,
-                )
-                chunks.append(chunk)
-
-            logger.info(
-                f"Vectara returned {len(chunks)} chunks for query: '{query[:50]}...'"
-            )
-            return SearchResult(
-                chunks=chunks,
-                total_tokens_returned=total_tokens_returned,
-                cost=None,
-                metadata={},
-            )
+            data = _decode_json(response)
 
         except self.requests.exceptions.Timeout as e:
             logger.error(f"Vectara API timeout: {e}")
             raise RunError(f"Vectara API timeout after {self.timeout}s: {e}") from e
 
         except self.requests.exceptions.HTTPError as e:
-            logger.error(f"Vectara API HTTP error: {e}")
-            if e.response.status_code == 401:
-                raise RunError(
-                    "Vectara authentication failed. Check your API key."
-                ) from e
-            elif e.response.status_code == 404:
-                raise RunError(f"Vectara corpus not found: {self.corpus_id}") from e
-            else:
-                raise RunError(
-                    f"Vectara API error ({e.response.status_code}): {e}"
-                ) from e
+            raise self._http_error(e.response.status_code, e) from e
 
         except self.requests.exceptions.RequestException as e:
             logger.error(f"Vectara API request failed: {e}")
             raise RunError(f"Vectara API request failed: {e}") from e
 
-        except Exception as e:
-            logger.error(f"Unexpected error in Vectara search: {e}")
-            raise RunError(f"Unexpected error in Vectara search: {e}") from e
+        except ValueError as e:
+            raise self._invalid_json_error(e) from e
+
+        # Parsing runs outside the handler so bugs keep their own traceback
+        return self._to_search_result(data, query, top_k)
+
+    async def asearch(self, query: str, top_k: int = 5) -> SearchResult:
+        """Search Vectara without blocking the event loop.
+
+        Requests from the same event loop share one pooled HTTP/2 client, so
+        queries to Vectara and other providers can be awaited together. Await
+        ``aclose`` before the loop closes to release its connections.
+
+        Args:
+            query: Search query text
+            top_k: Maximum number of results to return
+
+        Returns:
+            SearchResult object, as from ``search``
+
+        Raises:
+            RunError: If httpx is unavailable or the API request fails
+        """
+        httpx, client = self._get_async_client()
+        request_body = {
+            "query": query,
+            "search": {"corpora": self._corpora, "limit": top_k},
+        }
+
+        try:
+            response = await client.post(
+                self._url,
+                headers=self._headers,
+                content=_encode_json(request_body),
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = _decode_json(response)
+
+        except httpx.TimeoutException as e:
+            logger.error(f"Vectara API timeout: {e}")
+            raise RunError(f"Vectara API timeout after {self.timeout}s: {e}") from e
+
+        except httpx.HTTPStatusError as e:
+            raise self._http_error(e.response.status_code, e) from e
+
+        except httpx.HTTPError as e:
+            logger.error(f"Vectara API request failed: {e}")
+            raise RunError(f"Vectara API request failed: {e}") from e
+
+        except ValueError as e:
+            raise self._invalid_json_error(e) from e
+
+        return self._to_search_result(data, query, top_k)
+
+    async def aclose(self) -> None:
+        """Release the async client's connections, if one was created."""
+        client, loop = self._aclient, self._aclient_loop
+        self._aclient = self._aclient_loop = None
+        # A client from an earlier, closed loop can only be dropped
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+
+    def _get_async_client(self) -> tuple[Any, Any]:
+        """Return httpx and the pooled async client for the running event loop.
+
+        httpx connections belong to the loop that opened them, so a client
+        left over from an earlier loop is replaced rather than reused.
+
+        Returns:
+            Tuple of (httpx module, httpx.AsyncClient)
+
+        Raises:
+            RunError: If httpx with HTTP/2 support is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise RunError(
+                "httpx with HTTP/2 support is required for Vectara asearch. "
+                f"Install with: pip install 'httpx[http2]'. Error: {e}"
+            ) from e
+
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_keepalive_connections=32),
+                )
+            )
+            self._aclient_loop = loop
+        return httpx, self._aclient
+
+    def _to_search_result(self, data: dict, query: str, top_k: int) -> SearchResult:
+        """Convert a Vectara v2 query response to a SearchResult.
+
+        Args:
+            data: Parsed JSON response
+            query: Search query text (for logging)
+            top_k: Maximum number of results to return
+
+        Returns:
+            SearchResult with chunks and total_tokens_returned
+        """
+        # Parse response into RetrievedChunk objects
+        chunks = []
+        total_tokens_returned = 0
+        # The API already honors the limit; islice keeps the bound without
+        # copying the result list
+        for doc in islice(data.get("search_results", []), top_k):
+            # Extract text and score
+            text = doc.get("text", "")
+            score = doc.get("score", 0.0)
+
+            # Calculate token count for the chunk
+            chunk_token_count = count_tokens(
+                "gpt-4o-mini", text
+            )  # Using gpt-4o-mini as a proxy tokenizer
+            total_tokens_returned += chunk_token_count
+
+            # Combine part and document metadata (document wins) in one copy
+            part_metadata = doc.get("part_metadata")
+            document_metadata = doc.get("document_metadata")
+            if part_metadata and document_metadata:
+                metadata = {**part_metadata, **document_metadata}
+            elif part_metadata:
+                metadata = dict(part_metadata)
+            elif document_metadata:
+                metadata = dict(document_metadata)
+            else:
+                metadata = {}
+
+            # Add document ID to metadata
+            if doc.get("document_id"):
+                metadata["document_id"] = doc["document_id"]
+
+            # Create chunk
+            chunk = RetrievedChunk(
+                content=text,
+                score=score,
+                token_count=chunk_token_count,
+                metadata=metadata,
+            )
+            chunks.append(chunk)
+
+        logger.info(
+            f"Vectara returned {len(chunks)} chunks for query: '{query[:50]}...'"
+        )
+        return SearchResult(
+            chunks=chunks,
+            total_tokens_returned=total_tokens_returned,
+            cost=None,
+            metadata={},
+        )
+
+    def _http_error(self, status_code: int, error: Exception) -> RunError:
+        """Build the RunError for a failed Vectara HTTP response."""
+        logger.error(f"Vectara API HTTP error: {error}")
+        if status_code == 401:
+            return RunError("Vectara authentication failed. Check your API key.")
+        elif status_code == 404:
+            return RunError(f"Vectara corpus not found: {self.corpus_id}")
+        else:
+            return RunError(f"Vectara API error ({status_code}): {error}")
+
+    def _invalid_json_error(self, error: Exception) -> RunError:
+        """Build the RunError for a response body that is not valid JSON."""
+        logger.error(f"Vectara API returned invalid JSON: {error}")
+        return RunError(f"Vectara API returned invalid JSON: {error}")
 
     def __repr__(self) -> str:
         """String representation."""
         return f"VectaraProvider(corpus_id='{self.corpus_id}')"
 
 
+def _encode_json(value: Any) -> bytes:
+    """Serialize a request body to JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _decode_json(response: Any) -> Any:
+    """Parse a requests or httpx response body, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 # Register the tool
 from .registry import register_tool
 
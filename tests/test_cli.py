@@ -18,6 +18,9 @@ from typer.testing import CliRunner
 
 from ragdiff.cli import app
 from ragdiff.core.models import (
+    Comparison,
+    EvaluationResult,
+    EvaluatorConfig,
     ProviderConfig,
     Query,
     QueryResult,
@@ -143,6 +146,28 @@ class TestCLIRunCommand:
         assert "Successes" in result.stdout
         assert "3" in result.stdout  # 3 queries
 
+    def test_run_command_with_progress(self, test_domain_for_cli):
+        """Test run command with the progress bar enabled."""
+        domains_dir, domain_name = test_domain_for_cli
+        domain_dir = domains_dir / domain_name
+
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                "--domain-dir",
+                str(domain_dir),
+                "--provider",
+                "mock-cli-system",
+                "--query-set",
+                "test-queries",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "(3 ok, 0 failed)" in result.stdout
+        assert "Run completed" in result.stdout
+
     def test_run_command_missing_domain(self, test_domain_for_cli):
         """Test run command with missing domain."""
         domains_dir, _ = test_domain_for_cli
@@ -525,3 +550,30 @@ class TestOutputFormats:
         assert "# Comparison" in content
         assert "## Summary" in content
         assert "## Evaluations" in content
+
+    def test_markdown_maps_winner_without_stats(self):
+        """Markdown maps a/b to provider names, and works without stats."""
+        from ragdiff.display.formatting import format_comparison_markdown
+
+        comparison = Comparison(
+            label="c",
+            domain="d",
+            runs=[uuid4(), uuid4()],
+            evaluations=[
+                EvaluationResult(
+                    query="Query 1",
+                    reference=None,
+                    run_results={},
+                    evaluation={"winner": "b", "score_a": 4, "score_b": 9},
+                )
+            ],
+            evaluator_config=EvaluatorConfig(prompt_template="{query}"),
+            created_at=datetime.now(timezone.utc),
+        )
+
+        assert "**Winner:** b" in format_comparison_markdown(comparison)
+
+        stats = {"system-a": {}, "system-b": {}}
+        markdown = format_comparison_markdown(comparison, provider_stats=stats)
+        assert "**Winner:** system-b" in markdown
+        assert "**Score system-a:** 4" in markdown
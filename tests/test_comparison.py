@@ -12,14 +12,17 @@ Tests cover:
 import json
 import os
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
 import yaml
 
 from ragdiff.comparison import compare_runs
+from ragdiff.comparison.rate_limit import RateLimiter
 from ragdiff.core.errors import ComparisonError
 from ragdiff.core.models import (
+    EvaluatorConfig,
     ProviderConfig,
     Query,
     QueryResult,
@@ -371,6 +374,111 @@ class TestMockLLM:
         assert eval_result.evaluation["winner"] == "system-a"
         assert eval_result.evaluation["_metadata"]["cost"] == 0.001
 
+    def test_gather_run_results(self):
+        """Test per-query lookup of each run's chunks via the run index."""
+        from ragdiff.comparison import evaluator
+
+        def make_run(label, results):
+            return SimpleNamespace(id=uuid4(), label=label, results=results)
+
+        first = [RetrievedChunk(content="first")]
+        second = [RetrievedChunk(content="second")]
+        runs = [
+            make_run(
+                "run-a",
+                [
+                    QueryResult(query="Q1", retrieved=first, duration_ms=1.0),
+                    QueryResult(query="Q1", retrieved=second, duration_ms=1.0),
+                ],
+            ),
+            make_run("run-b", [QueryResult(query="Q2", retrieved=[], duration_ms=1.0)]),
+        ]
+
+        run_indexes = evaluator._index_run_results(runs)
+
+        # First result wins for duplicate query text; runs without it are omitted
+        assert evaluator._gather_run_results(run_indexes, Query(text="Q1")) == {
+            "run-a": first
+        }
+        assert evaluator._gather_run_results(run_indexes, Query(text="Q2")) == {
+            "run-b": []
+        }
+
+    @pytest.mark.parametrize("temperature,calls", [(0.0, 2), (0.7, 3)])
+    def test_duplicate_queries_evaluated_once(self, monkeypatch, temperature, calls):
+        """At temperature 0, repeated queries reuse one evaluation."""
+        from ragdiff.comparison import evaluator
+
+        evaluated = []
+
+        def fake_evaluate(query, reference, run_results, *args, **kwargs):
+            evaluated.append(query)
+            return evaluator.EvaluationResult(
+                query=query,
+                reference=reference,
+                run_results=run_results,
+                evaluation={"winner": "tie"},
+            )
+
+        monkeypatch.setattr(evaluator, "_evaluate_single_query", fake_evaluate)
+        queries = [Query(text="Q1"), Query(text="Q2"), Query(text="Q1")]
+        run = SimpleNamespace(
+            id=uuid4(),
+            label="run-a",
+            results=[],
+            query_set_snapshot=SimpleNamespace(queries=queries),
+        )
+
+        results = evaluator._evaluate_all_queries(
+            runs=[run],
+            evaluator_config=EvaluatorConfig(
+                temperature=temperature, prompt_template="{query}"
+            ),
+            max_retries=0,
+            concurrency=1,
+            progress_callback=None,
+        )
+
+        assert len(evaluated) == calls
+        assert [r.query for r in results] == ["Q1", "Q2", "Q1"]
+        assert results[2] is not results[0]
+
+    def test_iter_evaluations_streams_every_query(self, monkeypatch):
+        """iter_evaluations yields one evaluation per query with its index."""
+        from ragdiff.comparison import evaluator, iter_evaluations
+
+        evaluated = []
+
+        def fake_evaluate(query, reference, run_results, *args, **kwargs):
+            evaluated.append(query)
+            return evaluator.EvaluationResult(
+                query=query,
+                reference=reference,
+                run_results=run_results,
+                evaluation={"winner": "tie"},
+            )
+
+        monkeypatch.setattr(evaluator, "_evaluate_single_query", fake_evaluate)
+        queries = [Query(text=f"Q{i}") for i in range(20)]
+        run = SimpleNamespace(
+            id=uuid4(),
+            label="run-a",
+            results=[],
+            query_set_snapshot=SimpleNamespace(queries=queries),
+        )
+        config = EvaluatorConfig(prompt_template="{query}")
+
+        results = dict(iter_evaluations([run], config, concurrency=3))
+        assert sorted(results) == list(range(20))
+        assert results[7].query == "Q7"
+
+        # Stopping early cancels evaluations that have not started
+        evaluated.clear()
+        stream = iter_evaluations([run], config, concurrency=1)
+        next(stream)
+        stream.close()
+        assert len(evaluated) < len(queries)
+
 
 # ============================================================================
 # Parallel Evaluation Tests
@@ -506,3 +614,489 @@ class TestParallelEvaluation:
         # Verify query order is maintained
         assert comparison.evaluations[0].query == "Query 1"
         assert comparison.evaluations[1].query == "Query 2"
+
+
+# ============================================================================
+# Rate Limiting Tests
+# ============================================================================
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Tests for the client-side LLM rate limiter."""
+
+    def test_requests_are_spaced_by_rate(self):
+        """At 60 requests/min the second request waits one second."""
+        clock = FakeClock()
+        limiter = RateLimiter(60, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        assert clock.sleeps == [1.0, 1.0]
+
+    def test_token_budget_limits_large_prompts(self):
+        """Requests wait for the token bucket as well as the request bucket."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            600, tokens_per_minute=6000, clock=clock, sleep=clock.sleep
+        )
+
+        limiter.acquire(tokens=6000)
+        limiter.acquire(tokens=3000)
+
+        # 3000 tokens at 100 tokens/s
+        assert clock.now == pytest.approx(30.0)
+
+    def test_aimd_rate_adjustment(self):
+        """Rate halves on 429s and recovers additively up to the cap."""
+        limiter = RateLimiter(10)
+
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+        assert limiter.requests_per_minute == 2.5
+
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter.requests_per_minute == 10
+
+    def test_rate_limited_call_backs_off(self, monkeypatch):
+        """A 429 slows the limiter and waits on the rate-limit schedule."""
+        litellm = pytest.importorskip("litellm")
+        from ragdiff.comparison import evaluator
+
+        calls = []
+
+        def completion(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise litellm.RateLimitError(
+                    message="slow down", llm_provider="anthropic", model="claude"
+                )
+            return litellm.ModelResponse(
+                choices=[{"message": {"content": '{"winner": "tie"}'}}],
+                usage={"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            )
+
+        sleeps = []
+        monkeypatch.setattr(litellm, "completion", completion)
+        monkeypatch.setattr(litellm, "completion_cost", lambda **kw: 0.0)
+        monkeypatch.setattr(evaluator.time, "sleep", sleeps.append)
+        limiter = RateLimiter(60, sleep=lambda s: None)
+
+        result = evaluator._call_llm_with_retry(
+            prompt="p",
+            model="claude-3-haiku-20240307",
+            temperature=0.0,
+            max_retries=2,
+            rate_limiter=limiter,
+        )
+
+        assert result["winner"] == "tie"
+        assert sleeps == [evaluator.RATE_LIMIT_BACKOFF[0]]
+        assert limiter.requests_per_minute == 31
+
+
+# ============================================================================
+# Batch Evaluation Tests
+# ============================================================================
+
+
+class FakeBatches:
+    """Stand-in for anthropic's client.messages.batches."""
+
+    def __init__(self, status="ended"):
+        self.requests = None
+        self.retrieved = 0
+        self.cancelled = []
+        self.status = status
+
+    def create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        self.retrieved += 1
+        return SimpleNamespace(id=batch_id, processing_status=self.status)
+
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+    def results(self, batch_id):
+        message = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text='{"winner": "tie"}')],
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=100),
+        )
+        return [
+            # Out of order, as the API does not guarantee ordering
+            SimpleNamespace(custom_id="q1", result=SimpleNamespace(type="errored")),
+            SimpleNamespace(
+                custom_id="q0",
+                result=SimpleNamespace(type="succeeded", message=message),
+            ),
+        ]
+
+
+class TestBatchEvaluation:
+    """Tests for use_batch evaluation via Anthropic Message Batches."""
+
+    def test_compare_runs_with_batch(self, test_domain_with_runs, monkeypatch):
+        """All queries go out in one batch and results map back by custom_id."""
+        pytest.importorskip("litellm")
+        anthropic = pytest.importorskip("anthropic")
+        from ragdiff.comparison import evaluator
+
+        batches = FakeBatches()
+        client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        monkeypatch.setattr(anthropic, "Anthropic", lambda: client)
+        monkeypatch.setattr(evaluator.time, "sleep", lambda s: None)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+        domains_dir, domain_name, run1_id, run2_id = test_domain_with_runs
+
+        comparison = compare_runs(
+            domain=domain_name,
+            run_ids=[str(run1_id), str(run2_id)],
+            model="claude-3-haiku-20240307",
+            domains_dir=domains_dir,
+            use_batch=True,
+        )
+
+        assert [r["custom_id"] for r in batches.requests] == ["q0", "q1"]
+        assert "Query 2" in batches.requests[1]["params"]["messages"][0]["content"]
+        assert batches.retrieved == 1
+
+        first, second = comparison.evaluations
+        assert first.evaluation["winner"] == "tie"
+        assert first.evaluation["_metadata"]["batch_id"] == "batch_1"
+        # Half of (1000 * $0.25 + 100 * $1.25) per million tokens
+        assert first.evaluation["_metadata"]["cost"] == pytest.approx(0.0001875)
+        assert second.evaluation["error"] == "Batch request errored"
+        assert comparison.metadata["failed_evaluations"] == 1
+
+    def test_batch_timeout_cancels(self, test_domain_with_runs, monkeypatch):
+        """A batch still running at the deadline is cancelled, not awaited."""
+        pytest.importorskip("litellm")
+        anthropic = pytest.importorskip("anthropic")
+        from ragdiff.comparison import evaluator
+
+        batches = FakeBatches(status="in_progress")
+        client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+        clock = [0.0]
+        monkeypatch.setattr(anthropic, "Anthropic", lambda: client)
+        monkeypatch.setattr(evaluator.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(
+            evaluator.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s)
+        )
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+        domains_dir, domain_name, run1_id, run2_id = test_domain_with_runs
+
+        with pytest.raises(ComparisonError, match="did not finish within 60s"):
+            compare_runs(
+                domain=domain_name,
+                run_ids=[str(run1_id), str(run2_id)],
+                model="claude-3-haiku-20240307",
+                domains_dir=domains_dir,
+                use_batch=True,
+                batch_timeout=60,
+            )
+
+        assert batches.cancelled == ["batch_1"]
+        assert batches.retrieved == 6
+
+    def test_batch_requires_claude(self, test_domain_with_runs, monkeypatch):
+        """Non-Claude models are rejected before anything is submitted."""
+        pytest.importorskip("litellm")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        domains_dir, domain_name, run1_id, run2_id = test_domain_with_runs
+
+        with pytest.raises(ComparisonError, match="requires a Claude model"):
+            compare_runs(
+                domain=domain_name,
+                run_ids=[str(run1_id), str(run2_id)],
+                model="gpt-4o",
+                domains_dir=domains_dir,
+                use_batch=True,
+            )
+
+
+# ============================================================================
+# Packed Evaluation Tests
+# ============================================================================
+
+
+class TestPackedEvaluation:
+    """Tests for evaluating several queries per LLM call (queries_per_call)."""
+
+    def test_queries_share_one_call(self, test_domain_with_runs, monkeypatch):
+        """Both queries go out in one prompt and results map back by id."""
+        litellm = pytest.importorskip("litellm")
+
+        prompts = []
+
+        def completion(**kwargs):
+            prompts.append(kwargs["messages"][0]["content"])
+            # Out of order, ids tie each object back to its task
+            content = json.dumps(
+                [
+                    {"id": 1, "winner": "b", "reasoning": "second"},
+                    {"id": 0, "winner": "tie", "reasoning": "first"},
+                ]
+            )
+            return litellm.ModelResponse(
+                choices=[{"message": {"content": f"```json\n{content}\n```"}}],
+                usage={
+                    "prompt_tokens": 100,
+                    "completion_tokens": 20,
+                    "total_tokens": 120,
+                },
+            )
+
+        monkeypatch.setattr(litellm, "completion", completion)
+        monkeypatch.setattr(litellm, "completion_cost", lambda **kw: 0.5)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        domains_dir, domain_name, run1_id, run2_id = test_domain_with_runs
+
+        comparison = compare_runs(
+            domain=domain_name,
+            run_ids=[str(run1_id), str(run2_id)],
+            model="gpt-3.5-turbo",
+            domains_dir=domains_dir,
+            queries_per_call=2,
+        )
+
+        assert len(prompts) == 1
+        assert '<task id="0">' in prompts[0] and '<task id="1">' in prompts[0]
+
+        first, second = comparison.evaluations
+        assert first.query == "Query 1"
+        assert first.evaluation["winner"] == "tie"
+        assert second.evaluation["reasoning"] == "second"
+        metadata = first.evaluation["_metadata"]
+        assert metadata["queries_per_call"] == 2
+        assert metadata["cost"] == pytest.approx(0.25)
+        assert metadata["total_tokens"] == 60
+        assert comparison.metadata["failed_evaluations"] == 0
+
+    def test_missing_task_is_marked_failed(self, monkeypatch):
+        """A task the model skipped fails alone; the others keep their result."""
+        pytest.importorskip("litellm")
+        from ragdiff.comparison import evaluator
+
+        monkeypatch.setattr(
+            evaluator,
+            "_call_llm_with_retry",
+            lambda **kw: {"evaluations": {0: {"winner": "a"}}},
+        )
+        queries = [Query(text="q1"), Query(text="q2")]
+
+        results = evaluator._evaluate_query_group(
+            queries,
+            [],
+            EvaluatorConfig(model="gpt-4o", prompt_template="{query}"),
+            max_retries=0,
+        )
+
+        assert results[0].evaluation["winner"] == "a"
+        assert results[1].evaluation["error"] == "Missing from packed response"
+
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"queries_per_call": 0}, "at least 1"),
+            ({"queries_per_call": 2, "use_batch": True}, "not supported"),
+        ],
+    )
+    def test_invalid_queries_per_call(self, test_domain_with_runs, kwargs, match):
+        """Bad queries_per_call values are rejected up front."""
+        pytest.importorskip("litellm")
+        domains_dir, domain_name, run1_id, run2_id = test_domain_with_runs
+
+        with pytest.raises(ComparisonError, match=match):
+            compare_runs(
+                domain=domain_name,
+                run_ids=[str(run1_id), str(run2_id)],
+                domains_dir=domains_dir,
+                **kwargs,
+            )
+
+
+# ============================================================================
+# Evaluation Cache Tests
+# ============================================================================
+
+
+class TestEvaluationCache:
+    """Tests for the on-disk LLM response cache."""
+
+    def test_entries_expire_after_ttl(self, tmp_path, monkeypatch):
+        """Entries are returned until their ttl_days have passed."""
+        from ragdiff.core import cache as cache_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        cache = cache_module.SqliteCache(tmp_path / "c.sqlite", ttl_days=1)
+        key = cache_module.prompt_hash("gpt-4o", 0.0, "prompt")
+
+        assert cache.get(key) is None
+        cache.put(key, "gpt-4o", '{"winner": "a"}')
+        assert cache.get(key) == '{"winner": "a"}'
+        assert cache_module.prompt_hash("gpt-4o", 0.5, "prompt") != key
+
+        now[0] += 86401
+        assert cache.get(key) is None
+        cache.close()
+
+    def test_fingerprint_matches_without_orjson(self, monkeypatch):
+        """The stdlib fallback matches orjson for typical prompt keys."""
+        from ragdiff.core import cache as cache_module
+
+        if cache_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        value = {"prompt": "Qu'est-ce que la zakât?", "temperature": 0.7, "n": [1]}
+        fast = cache_module.fingerprint(value)
+        monkeypatch.setattr(cache_module, "orjson", None)
+
+        assert cache_module.fingerprint(value) == fast
+        assert len(fast) == 32
+
+    def test_repeat_comparison_uses_cache(self, test_domain_with_runs, monkeypatch):
+        """A second identical comparison makes no LLM calls."""
+        litellm = pytest.importorskip("litellm")
+
+        calls = []
+
+        def completion(**kwargs):
+            calls.append(kwargs)
+            return litellm.ModelResponse(
+                choices=[{"message": {"content": '{"winner": "system-b"}'}}],
+                usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            )
+
+        monkeypatch.setattr(litellm, "completion", completion)
+        monkeypatch.setattr(litellm, "completion_cost", lambda **kw: 0.01)
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        domains_dir, domain_name, run1_id, run2_id = test_domain_with_runs
+
+        domain_path = domains_dir / domain_name / "domain.yaml"
+        config = yaml.safe_load(domain_path.read_text())
+        config["cache"] = {"enabled": True}
+        domain_path.write_text(yaml.dump(config))
+
+        def compare():
+            return compare_runs(
+                domain=domain_name,
+                run_ids=[str(run1_id), str(run2_id)],
+                domains_dir=domains_dir,
+                concurrency=2,
+            )
+
+        first = compare()
+        second = compare()
+
+        assert len(calls) == 2
+        assert (domains_dir / domain_name / ".cache" / "evaluations.sqlite").exists()
+        for cached, fresh in zip(second.evaluations, first.evaluations):
+            assert cached.evaluation["winner"] == fresh.evaluation["winner"]
+            assert cached.evaluation["_metadata"]["cached"] is True
+            assert cached.evaluation["_metadata"]["cost"] == 0.0
+        assert "cached" not in first.evaluations[0].evaluation["_metadata"]
+
+
+# ============================================================================
+# Reference Evaluation Tests
+# ============================================================================
+
+
+class TestReferenceEvaluation:
+    """Tests for threaded evaluation against reference answers."""
+
+    def test_evaluations_keep_query_order(self, monkeypatch):
+        """Results follow query order even when they complete out of order."""
+        import time
+
+        from ragdiff.comparison import reference_evaluator
+
+        def fake_evaluate(query, reference, result, evaluator_config):
+            # Earlier queries finish last
+            time.sleep(0.01 * (4 - int(query[1:])))
+            if query == "Q2":
+                raise ValueError("bad response")
+            return {"correctness": 80}
+
+        monkeypatch.setattr(
+            reference_evaluator, "evaluate_result_against_reference", fake_evaluate
+        )
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+        run = SimpleNamespace(
+            id=uuid4(),
+            label="run-a",
+            provider="system-a",
+            query_set="test-queries",
+            results=[
+                QueryResult(query=f"Q{i}", retrieved=[], reference="A", duration_ms=1.0)
+                for i in range(4)
+            ],
+        )
+        progress = []
+
+        result = reference_evaluator.evaluate_run_threaded(
+            run,
+            EvaluatorConfig(prompt_template="unused"),
+            concurrency=4,
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        assert [e["query"] for e in result["evaluations"]] == ["Q0", "Q1", "Q2", "Q3"]
+        assert result["evaluations"][2]["status"] == "failed"
+        assert result["summary"]["successful_evaluations"] == 3
+        assert result["summary"]["failed_evaluations"] == 1
+        assert [p[0] for p in progress] == [1, 2, 3, 4]
+        assert progress[-1] == (4, 4, 3, 1)
+
+    def test_missing_api_key_fails_before_evaluating(self, monkeypatch):
+        """A missing API key raises once instead of failing every query."""
+        from ragdiff.comparison import reference_evaluator
+
+        calls = []
+        monkeypatch.setattr(
+            reference_evaluator,
+            "evaluate_result_against_reference",
+            lambda *args: calls.append(args),
+        )
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        run = SimpleNamespace(
+            results=[QueryResult(query="Q", retrieved=[], reference="A", duration_ms=1)]
+        )
+
+        with pytest.raises(ComparisonError, match="OPENAI_API_KEY"):
+            reference_evaluator.evaluate_run_threaded(
+                run, EvaluatorConfig(model="gpt-4o", prompt_template="unused")
+            )
+        assert calls == []
+
+    def test_api_key_set_after_first_check_is_picked_up(self, monkeypatch):
+        """Only the model->variable lookup is cached, not the key itself."""
+        from ragdiff.comparison.evaluator import _validate_api_key
+
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        with pytest.raises(ComparisonError, match="GEMINI_API_KEY"):
+            _validate_api_key("gemini-1.5-pro")
+
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        _validate_api_key("gemini-1.5-pro")
@@ -16,8 +16,10 @@ from uuid import UUID, uuid4
 import pytest
 import yaml
 
+from ragdiff.core import loaders
 from ragdiff.core.env_vars import (
     check_required_vars,
+    resolve_env_vars,
     substitute_env_vars,
     validate_env_vars,
 )
@@ -27,6 +29,8 @@ from ragdiff.core.loaders import (
     load_provider,
     load_provider_for_snapshot,
     load_query_set,
+    load_yaml,
+    resolve_provider_secrets,
 )
 from ragdiff.core.models import (
     Comparison,
@@ -340,6 +344,33 @@ class TestEnvVars:
         ):
             substitute_env_vars(config, resolve_secrets=True)
 
+    def test_resolve_env_vars(self, monkeypatch):
+        """Test single-pass validation and substitution."""
+        monkeypatch.setenv("TEST_API_KEY", "secret123")
+        config = {
+            "api_key": "${TEST_API_KEY}",
+            "urls": ["${TEST_API_KEY}/v1", "plain"],
+            "count": 42,
+        }
+
+        assert resolve_env_vars(config) == {
+            "api_key": "secret123",
+            "urls": ["secret123/v1", "plain"],
+            "count": 42,
+        }
+
+    def test_resolve_env_vars_reports_all_missing(self, monkeypatch):
+        """Test that every unset variable is listed in one error."""
+        monkeypatch.delenv("MISSING_A", raising=False)
+        monkeypatch.delenv("MISSING_B", raising=False)
+        config = {"a": "${MISSING_A}", "nested": {"b": "${MISSING_B}"}}
+
+        with pytest.raises(
+            ConfigError,
+            match="Missing required environment variables: MISSING_A, MISSING_B",
+        ):
+            resolve_env_vars(config)
+
     def test_check_required_vars(self):
         """Test checking for missing environment variables."""
         os.environ["TEST_KEY"] = "value"
@@ -368,6 +399,36 @@ class TestEnvVars:
 class TestLoaders:
     """Tests for file loaders."""
 
+    def test_load_yaml_cache(self, tmp_path, monkeypatch):
+        """Unchanged files are parsed once and each caller gets its own copy."""
+        path = tmp_path / "config.yaml"
+        path.write_text("name: a\nconfig: {top_k: 5}\n")
+        calls = []
+        real_safe_load = loaders.safe_load_yaml
+        monkeypatch.setattr(
+            loaders, "safe_load_yaml", lambda f: calls.append(f) or real_safe_load(f)
+        )
+
+        first = load_yaml(path)
+        first["config"]["top_k"] = 10
+        second = load_yaml(path)
+
+        assert second == {"name": "a", "config": {"top_k": 5}}
+        assert len(calls) == 1
+
+        # Editing the file (new size) invalidates the entry
+        path.write_text("name: bb\nconfig: {top_k: 5}\n")
+        assert load_yaml(path)["name"] == "bb"
+        assert len(calls) == 2
+
+    def test_safe_load_yaml(self):
+        """safe_load_yaml matches yaml.safe_load and refuses arbitrary tags."""
+        text = "a: 1\nb: [x, {c: null}]\n"
+        assert loaders.safe_load_yaml(text) == yaml.safe_load(text)
+
+        with pytest.raises(yaml.YAMLError):
+            loaders.safe_load_yaml("!!python/object/apply:os.getcwd []")
+
     def test_load_domain(self, tmp_path):
         """Test loading domain configuration."""
         # Create domain directory
@@ -467,6 +528,34 @@ class TestLoaders:
         assert provider.name == "vectara-test"
         assert provider.config["api_key"] == "${VECTARA_API_KEY}"  # Preserved!
 
+    def test_resolve_provider_secrets(self, monkeypatch):
+        """Test resolving secrets from a snapshot without reloading the file."""
+        monkeypatch.setenv("TEST_VECTARA_KEY", "test_key_123")
+        snapshot = ProviderConfig(
+            name="vectara-test",
+            tool="vectara",
+            config={"api_key": "${TEST_VECTARA_KEY}", "corpus_id": 123},
+        )
+
+        provider = resolve_provider_secrets(snapshot)
+
+        assert provider.name == "vectara-test"
+        assert provider.config == {"api_key": "test_key_123", "corpus_id": 123}
+        # Snapshot keeps its placeholder
+        assert snapshot.config["api_key"] == "${TEST_VECTARA_KEY}"
+
+    def test_resolve_provider_secrets_missing_var(self, monkeypatch):
+        """Test that unset variables raise ConfigError."""
+        monkeypatch.delenv("TEST_VECTARA_KEY", raising=False)
+        snapshot = ProviderConfig(
+            name="vectara-test",
+            tool="vectara",
+            config={"api_key": "${TEST_VECTARA_KEY}"},
+        )
+
+        with pytest.raises(ConfigError, match="TEST_VECTARA_KEY"):
+            resolve_provider_secrets(snapshot)
+
     def test_load_query_set_txt(self, tmp_path):
         """Test loading query set from .txt file."""
         # Create query-sets directory
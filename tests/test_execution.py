@@ -10,6 +10,7 @@ Tests cover:
 - File storage
 """
 
+import asyncio
 import os
 import time
 
@@ -17,8 +18,8 @@ import pytest
 import yaml
 
 from ragdiff.core.errors import RunError
-from ragdiff.core.models import RetrievedChunk, RunStatus
-from ragdiff.execution import execute_run
+from ragdiff.core.models import Query, RetrievedChunk, RunStatus
+from ragdiff.execution import execute_run, iter_query_results
 from ragdiff.providers import Provider, register_tool
 
 # ============================================================================
@@ -66,6 +67,33 @@ class MockPartialProvider(Provider):
         return [RetrievedChunk(content=f"Result for: {query}", score=0.95, metadata={})]
 
 
+class MockAsyncProvider(Provider):
+    """Mock system with an asearch coroutine that tracks concurrency."""
+
+    in_flight = 0
+    max_in_flight = 0
+    closed = False
+
+    def search(self, query: str, top_k: int = 5) -> list[RetrievedChunk]:
+        """Blocking search is not used on the async path."""
+        raise AssertionError("search should not be called when use_async=True")
+
+    async def asearch(self, query: str, top_k: int = 5) -> list[RetrievedChunk]:
+        """Return one result, sleeping far longer for 'slow' queries."""
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(1.0 if "slow" in query.lower() else 0.01)
+        finally:
+            cls.in_flight -= 1
+        return [RetrievedChunk(content=f"Result for: {query}", score=0.9, metadata={})]
+
+    async def aclose(self) -> None:
+        """Record that the executor closed the provider's async resources."""
+        type(self).closed = True
+
+
 @pytest.fixture
 def test_domain(tmp_path):
     """Create a test domain with system and query set."""
@@ -137,6 +165,7 @@ def register_mock_tools():
     register_tool("mock-success", MockSuccessProvider)
     register_tool("mock-failure", MockFailureProvider)
     register_tool("mock-partial", MockPartialProvider)
+    register_tool("mock-async", MockAsyncProvider)
 
     yield
 
@@ -202,6 +231,62 @@ class TestExecuteRun:
         assert run.results[0].reference == "Answer A"
         assert run.results[1].reference == "Answer B"
 
+    def test_execute_run_reuse_provider(self, test_domain, register_mock_tools):
+        """reuse_provider builds the provider once for repeated runs."""
+        from ragdiff.providers import clear_provider_cache
+
+        class CountingProvider(MockSuccessProvider):
+            instances = 0
+
+            def __init__(self, config: dict):
+                super().__init__(config)
+                CountingProvider.instances += 1
+
+        register_tool("mock-success", CountingProvider)
+        domains_dir, domain_name = test_domain
+        clear_provider_cache()
+
+        for _ in range(2):
+            run = execute_run(
+                domain=domain_name,
+                provider="mock-system",
+                query_set="test-queries",
+                domains_dir=domains_dir,
+                reuse_provider=True,
+            )
+            assert run.status == RunStatus.COMPLETED
+
+        assert CountingProvider.instances == 1
+        clear_provider_cache()
+
+    @pytest.mark.parametrize("reuse_provider,closed", [(False, 1), (True, 0)])
+    def test_execute_run_closes_provider(
+        self, test_domain, register_mock_tools, reuse_provider, closed
+    ):
+        """Providers built for one run are closed; shared ones stay open."""
+        from ragdiff.providers import clear_provider_cache
+
+        class ClosingProvider(MockSuccessProvider):
+            closed = 0
+
+            def close(self) -> None:
+                ClosingProvider.closed += 1
+
+        register_tool("mock-success", ClosingProvider)
+        domains_dir, domain_name = test_domain
+        clear_provider_cache()
+
+        execute_run(
+            domain=domain_name,
+            provider="mock-system",
+            query_set="test-queries",
+            domains_dir=domains_dir,
+            reuse_provider=reuse_provider,
+        )
+
+        assert ClosingProvider.closed == closed
+        clear_provider_cache()
+
     def test_execute_run_all_failures(self, test_domain, register_mock_tools, tmp_path):
         """Test run where all queries fail."""
         domains_dir, domain_name = test_domain
@@ -400,6 +485,99 @@ class TestParallelExecution:
             assert run.status == RunStatus.COMPLETED
             assert len(run.results) == 3
 
+    def test_iter_query_results_streams_every_query(self):
+        """Test iter_query_results yields one result per query with its index."""
+        queries = [Query(text=f"Query {i}") for i in range(5)] + [
+            Query(text="please fail")
+        ]
+        provider = MockPartialProvider(config={})
+
+        results = dict(iter_query_results(provider, queries, concurrency=3))
+
+        assert sorted(results) == list(range(6))
+        assert results[2].query == "Query 2"
+        assert results[2].error is None
+        assert "Query contains 'fail'" in results[5].error
+
+    def test_iter_query_results_cancels_queued_queries(self):
+        """Test stopping iteration early skips queries that have not started."""
+        searched = []
+
+        class RecordingProvider(MockSuccessProvider):
+            def search(self, query: str, top_k: int = 5) -> list[RetrievedChunk]:
+                searched.append(query)
+                return super().search(query, top_k)
+
+        queries = [Query(text=f"Query {i}") for i in range(20)]
+        stream = iter_query_results(
+            RecordingProvider(config={}), queries, concurrency=1
+        )
+
+        next(stream)
+        stream.close()
+
+        assert len(searched) < len(queries)
+
+
+class TestAsyncExecution:
+    """Tests for use_async query execution."""
+
+    @pytest.fixture
+    def async_domain(self, test_domain):
+        """Test domain with a provider backed by MockAsyncProvider."""
+        domains_dir, domain_name = test_domain
+        provider_config = {"name": "mock-async", "tool": "mock-async", "config": {}}
+        with open(
+            domains_dir / domain_name / "providers" / "mock-async.yaml", "w"
+        ) as f:
+            yaml.dump(provider_config, f)
+
+        MockAsyncProvider.in_flight = 0
+        MockAsyncProvider.max_in_flight = 0
+        MockAsyncProvider.closed = False
+        return domains_dir, domain_name
+
+    def test_async_run_respects_concurrency(self, async_domain, register_mock_tools):
+        """Queries run through asearch, bounded by concurrency, in input order."""
+        domains_dir, domain_name = async_domain
+        query_set_path = domains_dir / domain_name / "query-sets" / "many-queries.txt"
+        query_set_path.write_text("".join(f"Query {i}\n" for i in range(8)))
+
+        run = execute_run(
+            domain=domain_name,
+            provider="mock-async",
+            query_set="many-queries",
+            concurrency=2,
+            domains_dir=domains_dir,
+            use_async=True,
+        )
+
+        assert run.status == RunStatus.COMPLETED
+        assert [r.query for r in run.results] == [f"Query {i}" for i in range(8)]
+        assert MockAsyncProvider.max_in_flight == 2
+        assert MockAsyncProvider.closed
+
+    def test_async_run_enforces_timeout(self, async_domain, register_mock_tools):
+        """A query slower than per_query_timeout fails without stalling the run."""
+        domains_dir, domain_name = async_domain
+        query_set_path = domains_dir / domain_name / "query-sets" / "slow.txt"
+        query_set_path.write_text("fast query\nslow query\n")
+
+        start_time = time.perf_counter()
+        run = execute_run(
+            domain=domain_name,
+            provider="mock-async",
+            query_set="slow",
+            per_query_timeout=0.1,
+            domains_dir=domains_dir,
+            use_async=True,
+        )
+
+        assert time.perf_counter() - start_time < 1.0
+        assert run.status == RunStatus.PARTIAL
+        assert run.results[0].error is None
+        assert "timed out" in run.results[1].error
+
 
 # ============================================================================
 # File Storage Tests
@@ -480,3 +658,24 @@ class TestErrorHandling:
                 query_set="missing-queries",
                 domains_dir=domains_dir,
             )
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"concurrency": 0}, "concurrency must be at least 1"),
+            ({"per_query_timeout": 0}, "per_query_timeout must be positive"),
+        ],
+    )
+    def test_invalid_arguments(self, tmp_path, kwargs, message):
+        """Test bad arguments are rejected before anything is loaded."""
+        with pytest.raises(RunError, match=message):
+            execute_run(
+                domain="missing-domain",
+                provider="missing-system",
+                query_set="missing-queries",
+                domains_dir=tmp_path,
+                **kwargs,
+            )
+
+        # No run label was generated, so the domain directory was never touched
+        assert list(tmp_path.iterdir()) == []
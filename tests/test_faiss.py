@@ -0,0 +1,129 @@
+"""Tests for FAISSProvider async batch search.
+
+The faiss index and OpenAI client are replaced with fakes so these tests run
+without faiss or network access.
+"""
+
+import asyncio
+import json
+import sys
+import types
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from ragdiff.providers.faiss import FAISSProvider
+
+
+class FakeIndex:
+    """Exact squared-L2 index over a small fixed matrix."""
+
+    def __init__(self, vectors: np.ndarray):
+        self.vectors = vectors
+        self.ntotal, self.d = vectors.shape
+        self.search_calls = []
+
+    def search(self, queries, k):
+        self.search_calls.append(queries.shape)
+        distances = ((queries[:, None, :] - self.vectors[None, :, :]) ** 2).sum(-1)
+        indices = np.argsort(distances, axis=1)[:, :k]
+        return np.take_along_axis(distances, indices, axis=1), indices
+
+
+class FakeAsyncEmbeddings:
+    """Records embedding requests and embeds text by character counts."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def create(self, input, model):
+        self.requests.append(list(input))
+        data = [
+            types.SimpleNamespace(embedding=[t.count("a"), t.count("b")]) for t in input
+        ]
+        return types.SimpleNamespace(data=data)
+
+
+@pytest.fixture
+def openai_provider(tmp_path, monkeypatch):
+    """FAISSProvider using the OpenAI embedding service with fakes."""
+    index_path = tmp_path / "index.faiss"
+    index_path.touch()
+    documents_path = tmp_path / "docs.jsonl"
+    documents_path.write_text(
+        "\n".join(
+            json.dumps({"id": i, "text": text})
+            for i, text in enumerate(["about a", "about b"])
+        )
+    )
+
+    fake_faiss = types.ModuleType("faiss")
+    fake_faiss.read_index = lambda path: FakeIndex(
+        np.array([[1.0, 0.0], [0.0, 1.0]], dtype="float32")
+    )
+    monkeypatch.setitem(sys.modules, "faiss", fake_faiss)
+
+    embeddings = FakeAsyncEmbeddings()
+    fake_openai = types.ModuleType("openai")
+    fake_openai.OpenAI = MagicMock()
+    fake_openai.AsyncOpenAI = lambda api_key: types.SimpleNamespace(
+        embeddings=embeddings
+    )
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+
+    return FAISSProvider(
+        config={
+            "index_path": str(index_path),
+            "documents_path": str(documents_path),
+            "embedding_service": "openai",
+            "embedding_model": "text-embedding-3-small",
+            "api_key": "sk-test",
+            "embedding_chunk_size": 2,
+        }
+    )
+
+
+class TestAsyncSearch:
+    """Tests for asearch / asearch_batch."""
+
+    def test_asearch_batch_preserves_query_order(self, openai_provider):
+        """Results line up with input queries despite length sorting."""
+        results = asyncio.run(
+            openai_provider.asearch_batch(["bbbb", "a", "aaa"], top_k=1)
+        )
+
+        assert [r[0].content for r in results] == ["about b", "about a", "about a"]
+        # One FAISS call for the whole batch
+        assert openai_provider.index.search_calls == [(3, 2)]
+
+    def test_asearch_batch_shards_embedding_requests(self, openai_provider):
+        """Texts are sorted by length and split into chunk-sized requests."""
+        embeddings = openai_provider.async_openai_client.embeddings
+
+        asyncio.run(openai_provider.asearch_batch(["bbbb", "a", "aaa"], top_k=1))
+
+        assert embeddings.requests == [["a", "aaa"], ["bbbb"]]
+
+    def test_asearch_single_query(self, openai_provider):
+        """asearch returns the same chunks as a batch of one."""
+        chunks = asyncio.run(openai_provider.asearch("bb", top_k=2))
+
+        assert [c.content for c in chunks] == ["about b", "about a"]
+
+    def test_aclose_replaces_async_client(self, openai_provider):
+        """aclose closes the loop-bound client and leaves a fresh one."""
+        closed = []
+
+        async def close():
+            closed.append(True)
+
+        client = openai_provider.async_openai_client
+        client.close = close
+
+        asyncio.run(openai_provider.aclose())
+
+        assert closed == [True]
+        assert openai_provider.async_openai_client is not client
+        chunks = asyncio.run(openai_provider.asearch("bb", top_k=1))
+        assert [c.content for c in chunks] == ["about b"]
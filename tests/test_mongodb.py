@@ -0,0 +1,907 @@
+"""Tests for MongoDBProvider.
+
+The MongoDB client and sentence-transformers model are replaced with
+in-memory fakes so these tests run without a database or model download.
+"""
+
+import hashlib
+import queue
+import sys
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from bson.binary import Binary
+from bson.raw_bson import RawBSONDocument
+from pymongo.errors import OperationFailure, ServerSelectionTimeoutError
+
+from ragdiff.core.errors import ConfigError, RunError
+from ragdiff.core.models import ProviderConfig
+from ragdiff.providers import create_provider, mongodb
+
+# ============================================================================
+# Fakes
+# ============================================================================
+
+
+class FakeEncoder:
+    """Deterministic stand-in for a SentenceTransformer model."""
+
+    def __init__(self, model_name: str, **kwargs):
+        self.model_name = model_name
+        self.kwargs = kwargs
+        self.calls = []
+
+    def encode(self, text, convert_to_numpy=True, **kwargs):
+        self.calls.append(text)
+        if isinstance(text, list):
+            return np.stack([self._vector(t) for t in text])
+        return self._vector(text)
+
+    @staticmethod
+    def _vector(text: str) -> np.ndarray:
+        # Map text onto a fixed 3-d direction so results are predictable
+        return np.array(
+            [text.count("a") + 1.0, text.count("b"), text.count("c")],
+            dtype=np.float32,
+        )
+
+
+class FakeCollection:
+    """Minimal in-memory collection supporting the calls the provider makes."""
+
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+        self.find_calls = []
+        self.pipelines = []
+        self.search_indexes = None  # None emulates Community Edition
+        self.changes = queue.Queue()
+        self.watch_pipelines = []
+        self.bulk_writes = []
+
+    def find(self, filter=None, projection=None, limit=0, sort=None, **kwargs):
+        self.find_calls.append({"filter": filter, "projection": projection})
+        docs = [doc for doc in self.docs if _matches(doc, filter or {})]
+        for field, direction in reversed(sort or []):
+            docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return [_project(doc, projection) for doc in docs[: limit or None]]
+
+    def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append((operations, ordered))
+        by_id = {doc["_id"]: doc for doc in self.docs}
+        for op in operations:
+            doc_id = op._filter["_id"]
+            by_id[doc_id] = {**by_id.get(doc_id, {"_id": doc_id}), **op._doc["$set"]}
+        self.docs = list(by_id.values())
+
+    def with_options(self, codec_options=None, **kwargs):
+        self.codec_options = codec_options
+        return self
+
+    def estimated_document_count(self):
+        return len(self.docs)
+
+    def db_hash(self, command, collections=()):
+        """Emulate the dbHash command: a digest of each collection's contents."""
+        digest = hashlib.md5(repr(self.docs).encode()).hexdigest()
+        return {"collections": dict.fromkeys(collections, digest)}
+
+    def list_search_indexes(self, name=None):
+        if self.search_indexes is None:
+            raise OperationFailure("$listSearchIndexes is not allowed")
+        return [i for i in self.search_indexes if name in (None, i["name"])]
+
+    def watch(self, pipeline, **kwargs):
+        self.watch_pipelines.append(pipeline)
+        return FakeChangeStream(self.changes)
+
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        stage = pipeline[0]["$vectorSearch"]
+        projection = {k: v for k, v in pipeline[1]["$project"].items() if k != "score"}
+        query = np.asarray(stage["queryVector"])
+        scored = []
+        for doc in self.docs:
+            vector = np.asarray(doc[stage["path"]])
+            cosine = vector @ query / (np.linalg.norm(vector) * np.linalg.norm(query))
+            scored.append({**_project(doc, projection), "score": (1 + cosine) / 2})
+        scored.sort(key=lambda d: d["score"], reverse=True)
+        return scored[: stage["limit"]]
+
+
+class FakeChangeStream:
+    """Change stream fed from a queue; try_next waits briefly like the driver.
+
+    Queued exceptions are raised, and ``END_OF_STREAM`` ends the stream the
+    way an invalidate event does.
+    """
+
+    def __init__(self, changes: queue.Queue):
+        self.changes = changes
+        self.alive = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def try_next(self):
+        try:
+            change = self.changes.get(timeout=0.01)
+        except queue.Empty:
+            return None
+        if isinstance(change, Exception):
+            raise change
+        if change is END_OF_STREAM:
+            self.alive = False
+            return None
+        return change
+
+
+END_OF_STREAM = object()
+
+
+def _project(doc: dict, projection) -> dict:
+    if not projection:
+        return dict(doc)
+    return {k: v for k, v in doc.items() if k == "_id" or projection.get(k)}
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    for field, condition in query.items():
+        if isinstance(condition, dict) and "$exists" in condition:
+            if (field in doc) != condition["$exists"]:
+                return False
+        elif isinstance(condition, dict) and "$in" in condition:
+            if doc.get(field) not in condition["$in"]:
+                return False
+        elif doc.get(field) != condition:
+            return False
+    return True
+
+
+DOCS = [
+    {"_id": 1, "text": "alpha", "source": "s1", "embedding": [1.0, 0.0, 0.0]},
+    {"_id": 2, "text": "beta", "source": "s2", "embedding": [0.0, 1.0, 0.0]},
+    {"_id": 3, "text": "gamma", "source": "s3", "embedding": [0.7, 0.7, 0.0]},
+]
+
+
+@pytest.fixture
+def fake_mongo(monkeypatch):
+    """Patch pymongo and sentence-transformers with in-memory fakes."""
+    collection = FakeCollection(DOCS)
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = collection
+    client.__getitem__.return_value.command.side_effect = collection.db_hash
+
+    st_module = types.ModuleType("sentence_transformers")
+    st_module.SentenceTransformer = FakeEncoder
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", st_module)
+    monkeypatch.setattr(mongodb, "_CLIENTS", {})
+    with patch("pymongo.MongoClient", return_value=client) as mongo_client_cls:
+        collection.client_cls = mongo_client_cls
+        yield collection
+
+
+def make_provider(**overrides):
+    config = {
+        "connection_uri": "mongodb://localhost:27017",
+        "database": "db",
+        "collection": "docs",
+        "index_name": "vector_index",
+        # Keep encoder call assertions free of the warmup encode
+        "warmup": False,
+    }
+    config.update(overrides)
+    return create_provider(
+        ProviderConfig(name="mongodb-test", tool="mongodb", config=config)
+    )
+
+
+# ============================================================================
+# Search Tests
+# ============================================================================
+
+
+class TestMongoDBSearch:
+    """Tests for MongoDBProvider.search."""
+
+    def test_search_ranks_by_cosine_similarity(self, fake_mongo):
+        """Closest document by cosine similarity comes first."""
+        provider = make_provider()
+
+        chunks = provider.search("aaa", top_k=2)
+
+        assert [c.content for c in chunks] == ["alpha", "gamma"]
+        assert chunks[0].score == pytest.approx(1.0)
+        assert chunks[0].metadata["source"] == "s1"
+
+    def test_documents_without_text_skipped(self, fake_mongo):
+        """Hits with no text are dropped; metadata fields are copied."""
+        fake_mongo.docs = [
+            {**DOCS[0], "title": "A"},
+            {"_id": 9, "source": "s9", "embedding": [1.0, 0.1, 0.0]},
+        ]
+        provider = make_provider(metadata_fields=["title", "missing"])
+
+        chunks = provider.search("aaa", top_k=2)
+
+        assert len(chunks) == 1
+        assert chunks[0].metadata == {"_id": "1", "source": "s1", "title": "A"}
+
+
+# ============================================================================
+# Client Cache Tests
+# ============================================================================
+
+
+class TestClientCache:
+    """Tests for MongoClient reuse across providers."""
+
+    def test_client_shared_across_providers(self, fake_mongo):
+        """Providers on the same URI share one pooled client."""
+        first = make_provider()
+        second = make_provider(collection="other")
+
+        assert first.mongo_client is second.mongo_client
+        fake_mongo.client_cls.assert_called_once()
+        kwargs = fake_mongo.client_cls.call_args.kwargs
+        assert kwargs["maxPoolSize"] == 50
+        assert kwargs["minPoolSize"] == 5
+        assert kwargs["compressors"].endswith("zlib")
+        assert kwargs["zlibCompressionLevel"] == 6
+
+    def test_compressors_configurable(self, fake_mongo):
+        """Configured compressors are passed through to the client."""
+        make_provider(compressors="snappy")
+
+        assert fake_mongo.client_cls.call_args.kwargs["compressors"] == "snappy"
+
+    def test_different_options_get_separate_clients(self, fake_mongo):
+        """Pool settings are part of the cache key."""
+        make_provider()
+        make_provider(max_pool_size=10)
+
+        assert fake_mongo.client_cls.call_count == 2
+
+
+# ============================================================================
+# Embedding Cache Tests
+# ============================================================================
+
+
+class TestEmbeddingCache:
+    """Tests for the query embedding LRU cache."""
+
+    def test_repeated_query_encoded_once(self, fake_mongo):
+        """Identical queries hit the cache instead of the model."""
+        provider = make_provider()
+
+        provider.search("abc")
+        provider.search("abc")
+        provider.search("other")
+
+        assert provider.embedding_model.calls == ["abc", "other"]
+
+    def test_cache_disabled(self, fake_mongo):
+        """embedding_cache_size=0 encodes on every call."""
+        provider = make_provider(embedding_cache_size=0)
+
+        provider.search("abc")
+        provider.search("abc")
+
+        assert provider.embedding_model.calls == ["abc", "abc"]
+
+    def test_onnx_backend(self, fake_mongo):
+        """use_onnx loads the model on the ONNX Runtime CPU backend."""
+        provider = make_provider(use_onnx=True)
+
+        assert provider.embedding_model.kwargs == {
+            "backend": "onnx",
+            "model_kwargs": {"provider": "CPUExecutionProvider"},
+        }
+
+    def test_onnx_backend_unavailable(self, fake_mongo, monkeypatch):
+        """Older sentence-transformers without backends is a config error."""
+        monkeypatch.setattr(
+            sys.modules["sentence_transformers"],
+            "SentenceTransformer",
+            lambda name: FakeEncoder(name),
+        )
+
+        with pytest.raises(ConfigError, match="sentence-transformers\\[onnx\\]"):
+            make_provider(use_onnx=True)
+
+    def test_warmup_encodes_once_at_init(self, fake_mongo):
+        """Warmup runs the model at startup without filling the cache."""
+        provider = make_provider(warmup=True)
+        assert provider.embedding_model.calls == ["warmup"]
+
+        provider.search("warmup")
+
+        assert provider.embedding_model.calls == ["warmup", "warmup"]
+
+
+class TestSemanticCache:
+    """Tests for reusing results of near-duplicate queries."""
+
+    def test_paraphrase_served_from_cache(self, fake_mongo):
+        """A query above the similarity threshold skips the search."""
+        provider = make_provider(semantic_cache_threshold=0.99)
+        first = provider.search("aaaa", top_k=2)
+        calls = len(fake_mongo.find_calls)
+
+        # "aaaaa" embeds to [6, 0, 0], parallel to "aaaa" ([5, 0, 0])
+        second = provider.search("aaaaa", top_k=1)
+
+        assert second == first[:1]
+        assert len(fake_mongo.find_calls) == calls
+
+    def test_dissimilar_or_larger_query_misses(self, fake_mongo):
+        """Different queries and larger top_k run a real search."""
+        provider = make_provider(semantic_cache_threshold=0.99)
+        provider.search("aaaa", top_k=1)
+
+        assert provider.search("bbb", top_k=1)[0].content == "beta"
+        assert len(provider.search("aaaa", top_k=3)) == 3
+
+    def test_disabled_by_default(self, fake_mongo):
+        """Without a threshold nothing is cached."""
+        provider = make_provider()
+
+        provider.search("aaaa")
+
+        assert len(provider._sem_cache) == 0
+
+
+# ============================================================================
+# Embedding Matrix Cache Tests
+# ============================================================================
+
+
+class TestMatrixCache:
+    """Tests for the document embedding matrix cache."""
+
+    def test_matrix_fetched_once_across_searches(self, fake_mongo):
+        """Vectors are loaded on the first search only."""
+        provider = make_provider()
+
+        provider.search("aaa")
+        provider.search("bbb")
+
+        vector_scans = [c for c in fake_mongo.find_calls if "_id" not in c["filter"]]
+        assert len(vector_scans) == 1
+
+    def test_concurrent_first_searches_build_once(self, fake_mongo):
+        """Parallel searches on a cold provider share a single matrix build."""
+        provider = make_provider()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: provider.search("aaa"), range(8)))
+
+        assert all(r[0].content == "alpha" for r in results)
+        vector_scans = [c for c in fake_mongo.find_calls if "_id" not in c["filter"]]
+        assert len(vector_scans) == 1
+
+    def test_row_norms_precomputed(self, fake_mongo):
+        """Row norms are computed once, alongside the matrix."""
+        provider = make_provider()
+
+        provider.search("aaa")
+
+        assert provider._norms.tolist() == pytest.approx([1.0, 1.0, np.hypot(0.7, 0.7)])
+
+    def test_matrix_persisted_and_memory_mapped(self, fake_mongo, tmp_path):
+        """A second provider reuses the on-disk matrix instead of Mongo."""
+        make_provider(matrix_cache_dir=str(tmp_path)).search("aaa")
+        assert (tmp_path / "db.docs.embedding.npy").exists()
+
+        fake_mongo.find_calls.clear()
+        provider = make_provider(matrix_cache_dir=str(tmp_path))
+        chunks = provider.search("aaa", top_k=1)
+
+        assert chunks[0].content == "alpha"
+        assert isinstance(provider._matrix, np.memmap)
+        assert all("embedding" not in c["filter"] for c in fake_mongo.find_calls)
+
+    def test_stale_cache_rebuilt(self, fake_mongo, tmp_path):
+        """A document count change invalidates the persisted matrix."""
+        make_provider(matrix_cache_dir=str(tmp_path)).search("aaa")
+
+        fake_mongo.docs = DOCS + [
+            {"_id": 4, "text": "delta", "source": "s4", "embedding": [0, 0, 1.0]}
+        ]
+        chunks = make_provider(matrix_cache_dir=str(tmp_path)).search("ccc", top_k=1)
+
+        assert chunks[0].content == "delta"
+
+    def test_delete_and_insert_invalidates_cache(self, fake_mongo, tmp_path):
+        """A new largest _id invalidates the cache even at the same count."""
+        provider = make_provider(matrix_cache_dir=str(tmp_path))
+        provider.search("aaa")
+
+        delta = {"_id": 4, "text": "delta", "source": "s4", "embedding": [0, 0, 1.0]}
+        fake_mongo.docs = DOCS[1:] + [delta]
+        chunks = make_provider(matrix_cache_dir=str(tmp_path)).search("ccc", top_k=1)
+
+        assert chunks[0].content == "delta"
+        # The default key never runs the full-collection dbHash
+        provider.database.command.assert_not_called()
+
+    def test_strict_cache_detects_in_place_update(self, fake_mongo, tmp_path):
+        """With matrix_cache_strict, dbHash catches a changed vector."""
+        make_provider(matrix_cache_dir=str(tmp_path), matrix_cache_strict=True).search(
+            "aaa"
+        )
+
+        fake_mongo.docs = [DOCS[0], {**DOCS[1], "embedding": [0, 0, 1.0]}, DOCS[2]]
+        provider = make_provider(
+            matrix_cache_dir=str(tmp_path), matrix_cache_strict=True
+        )
+        chunks = provider.search("ccc", top_k=1)
+
+        assert chunks[0].content == "beta"
+        provider.database.command.assert_called_with("dbHash", collections=["docs"])
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_quantized_matrix_preserves_ranking(self, fake_mongo, tmp_path, dtype):
+        """Quantized storage keeps the same ordering as float32."""
+        provider = make_provider(
+            matrix_cache_dir=str(tmp_path), matrix_cache_dtype=dtype
+        )
+
+        chunks = provider.search("aaa", top_k=3)
+
+        assert [c.content for c in chunks] == ["alpha", "gamma", "beta"]
+        assert provider._matrix.dtype == np.dtype(dtype)
+
+    def test_scan_projects_only_needed_fields(self, fake_mongo):
+        """Vectors and payloads are fetched with narrow projections."""
+        provider = make_provider(metadata_fields=["title"])
+
+        provider.search("aaa", top_k=1)
+
+        vector_scan, payload_fetch = fake_mongo.find_calls
+        assert vector_scan["projection"] == {"embedding": 1}
+        assert payload_fetch["filter"] == {"_id": {"$in": [1]}}
+        assert payload_fetch["projection"] == {
+            "_id": 1,
+            "text": 1,
+            "source": 1,
+            "title": 1,
+        }
+
+    def test_matrix_scan_reads_raw_bson(self, fake_mongo):
+        """The vector scan avoids decoding full documents."""
+        make_provider().search("aaa")
+
+        assert fake_mongo.codec_options.document_class is RawBSONDocument
+
+    @pytest.mark.parametrize(
+        "dtype_byte,values",
+        [
+            (b"\x27", np.array([0, 0, 1], dtype="<f4")),
+            (b"\x03", np.array([0, 0, 5], dtype=np.int8)),
+        ],
+    )
+    def test_bson_vectors_decoded(self, fake_mongo, dtype_byte, values):
+        """Binary subtype 9 vectors are decoded without Python float lists."""
+        vector = Binary(dtype_byte + b"\x00" + values.tobytes(), subtype=9)
+        fake_mongo.docs = DOCS + [
+            {"_id": 4, "text": "delta", "source": "s4", "embedding": vector}
+        ]
+
+        chunks = make_provider().search("ccc", top_k=1)
+
+        assert chunks[0].content == "delta"
+        # "ccc" embeds to [1, 0, 3]
+        assert chunks[0].score == pytest.approx(3 / np.sqrt(10))
+
+    def test_invalid_dtype_rejected(self, fake_mongo):
+        """Unknown matrix dtypes are a configuration error."""
+        with pytest.raises(ConfigError, match="matrix_cache_dtype"):
+            make_provider(matrix_cache_dtype="float64")
+
+
+# ============================================================================
+# $vectorSearch Tests
+# ============================================================================
+
+
+class TestVectorSearch:
+    """Tests for the Atlas $vectorSearch path."""
+
+    def test_community_edition_uses_scan(self, fake_mongo):
+        """Without search index support, the client-side scan is used."""
+        provider = make_provider()
+
+        provider.search("aaa")
+
+        assert provider.use_vector_search is False
+        assert fake_mongo.pipelines == []
+
+    def test_atlas_index_uses_vector_search(self, fake_mongo):
+        """An existing search index routes queries through $vectorSearch."""
+        fake_mongo.search_indexes = [{"name": "vector_index", "queryable": True}]
+        provider = make_provider()
+
+        chunks = provider.search("aaa", top_k=2)
+
+        assert provider.use_vector_search is True
+        assert [c.content for c in chunks] == ["alpha", "gamma"]
+        stage = fake_mongo.pipelines[0][0]["$vectorSearch"]
+        assert stage["index"] == "vector_index"
+        assert stage["limit"] == 2
+        assert stage["numCandidates"] == 150
+        # No full collection scan
+        assert fake_mongo.find_calls == []
+
+    def test_scores_match_scan(self, fake_mongo):
+        """$vectorSearch scores are reported on the scan's cosine scale."""
+        scan = make_provider().search("aab", top_k=3)
+        fake_mongo.search_indexes = [{"name": "vector_index"}]
+        atlas = make_provider().search("aab", top_k=3)
+
+        assert [c.score for c in atlas] == pytest.approx([c.score for c in scan])
+
+    def test_search_index_errors_not_hidden(self, fake_mongo, monkeypatch):
+        """Only an unsupported-command error selects the scan path."""
+
+        def unreachable(name=None):
+            raise ServerSelectionTimeoutError("no servers")
+
+        monkeypatch.setattr(fake_mongo, "list_search_indexes", unreachable)
+
+        with pytest.raises(RunError, match="no servers"):
+            make_provider()
+
+    def test_wide_payloads_fetched_after_ranking(self, fake_mongo):
+        """With many metadata fields, $vectorSearch returns only ids and scores."""
+        fake_mongo.search_indexes = [{"name": "vector_index"}]
+        fake_mongo.docs = [{**doc, "a": 1, "b": 2, "c": 3} for doc in DOCS]
+        provider = make_provider(metadata_fields=["a", "b", "c"])
+
+        batch = provider.search_batch(["aaa", "bbb"], top_k=2)
+
+        assert [[c.content for c in r] for r in batch] == [
+            ["alpha", "gamma"],
+            ["beta", "gamma"],
+        ]
+        assert batch[0][0].metadata["c"] == 3
+        assert fake_mongo.pipelines[0][1]["$project"] == {
+            "_id": 1,
+            "score": {"$meta": "vectorSearchScore"},
+        }
+        # One payload fetch for the whole batch
+        (payload_fetch,) = fake_mongo.find_calls
+        assert sorted(payload_fetch["filter"]["_id"]["$in"]) == [1, 2, 3]
+
+    def test_missing_index_falls_back_to_scan(self, fake_mongo):
+        """A different index name does not enable $vectorSearch."""
+        fake_mongo.search_indexes = [{"name": "other_index"}]
+
+        assert make_provider().use_vector_search is False
+
+    def test_vector_search_config_override(self, fake_mongo):
+        """vector_search=False forces the scan path even on Atlas."""
+        fake_mongo.search_indexes = [{"name": "vector_index"}]
+
+        assert make_provider(vector_search=False).use_vector_search is False
+
+
+# ============================================================================
+# Batch Search Tests
+# ============================================================================
+
+
+class TestSearchBatch:
+    """Tests for MongoDBProvider.search_batch."""
+
+    def test_batch_matches_individual_searches(self, fake_mongo):
+        """Batch results equal per-query search results, in order."""
+        provider = make_provider()
+
+        batch = provider.search_batch(["aaa", "bbb", "abab"], top_k=2)
+        single = [provider.search(q, top_k=2) for q in ["aaa", "bbb", "abab"]]
+
+        assert batch == single
+
+    def test_batch_encodes_once_and_fetches_payloads_once(self, fake_mongo):
+        """All queries share one encode call and one payload fetch."""
+        provider = make_provider()
+
+        provider.search_batch(["aaa", "bbb"], top_k=1)
+
+        assert provider.embedding_model.calls == [["aaa", "bbb"]]
+        payload_fetches = [c for c in fake_mongo.find_calls if "_id" in c["filter"]]
+        assert len(payload_fetches) == 1
+        assert sorted(payload_fetches[0]["filter"]["_id"]["$in"]) == [1, 2]
+
+    def test_batch_uses_vector_search_per_query(self, fake_mongo):
+        """On Atlas each query runs its own $vectorSearch aggregation."""
+        fake_mongo.search_indexes = [{"name": "vector_index"}]
+        provider = make_provider()
+
+        results = provider.search_batch(["aaa", "bbb"], top_k=1)
+
+        assert [r[0].content for r in results] == ["alpha", "beta"]
+        assert len(fake_mongo.pipelines) == 2
+
+    def test_empty_batch(self, fake_mongo):
+        """An empty batch returns no results without encoding."""
+        provider = make_provider()
+
+        assert provider.search_batch([]) == []
+        assert provider.embedding_model.calls == []
+
+
+# ============================================================================
+# Change Stream Tests
+# ============================================================================
+
+
+def _wait_for_version(provider, version, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while provider._mat_version < version and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert provider._mat_version >= version
+
+
+class TestChangeStream:
+    """Tests for incremental matrix updates from a change stream."""
+
+    def test_insert_and_delete_applied_without_rescan(self, fake_mongo):
+        """Watched changes update the matrix in place of a full reload."""
+        provider = make_provider(watch_changes=True)
+        try:
+            provider.search("aaa")
+            version = provider._mat_version
+
+            delta = {
+                "_id": 4,
+                "text": "delta",
+                "source": "s4",
+                "embedding": [0, 0, 1.0],
+            }
+            fake_mongo.docs = DOCS + [delta]
+            fake_mongo.changes.put(
+                {
+                    "operationType": "insert",
+                    "documentKey": {"_id": 4},
+                    "fullDocument": delta,
+                }
+            )
+            _wait_for_version(provider, version + 1)
+            assert provider.search("ccc", top_k=1)[0].content == "delta"
+
+            fake_mongo.changes.put(
+                {"operationType": "delete", "documentKey": {"_id": 1}}
+            )
+            _wait_for_version(provider, version + 2)
+            assert sorted(i for i in provider._doc_ids if i is not None) == [2, 3, 4]
+            assert "alpha" not in [c.content for c in provider.search("aaa", top_k=3)]
+
+            vector_scans = [
+                c for c in fake_mongo.find_calls if "_id" not in c["filter"]
+            ]
+            assert len(vector_scans) == 1
+        finally:
+            provider.close()
+
+        assert provider._watch_thread is None
+
+    def test_update_replaces_row(self, fake_mongo):
+        """An updated vector overwrites the existing row."""
+        provider = make_provider()
+        provider.search("aaa")
+
+        provider._apply_change(
+            {
+                "operationType": "update",
+                "documentKey": {"_id": 2},
+                "fullDocument": {"_id": 2, "embedding": [1.0, 0.0, 0.0]},
+            }
+        )
+
+        row = provider._doc_ids.index(2)
+        assert provider._matrix[row].tolist() == [1.0, 0.0, 0.0]
+        assert len(provider._matrix) == 3
+        assert provider._norms[row] == pytest.approx(1.0)
+
+    def test_changes_write_rows_in_place(self, fake_mongo):
+        """Steady-state changes reuse the row buffer; deletes compact lazily."""
+        provider = make_provider()
+        provider.search("aaa")
+
+        def insert(doc_id, vector):
+            provider._apply_change(
+                {
+                    "operationType": "insert",
+                    "documentKey": {"_id": doc_id},
+                    "fullDocument": {"_id": doc_id, "embedding": vector},
+                }
+            )
+
+        insert(4, [0.0, 0.0, 1.0])  # Grows the buffer
+        buffer = provider._matrix_buffer
+        insert(5, [0.0, 0.5, 0.5])
+        provider._apply_change(
+            {
+                "operationType": "update",
+                "documentKey": {"_id": 1},
+                "fullDocument": {"_id": 1, "embedding": [0.0, 0.0, 2.0]},
+            }
+        )
+        assert provider._matrix_buffer is buffer
+        assert provider._matrix[provider._doc_ids.index(1)].tolist() == [0, 0, 2.0]
+        assert len(provider._matrix) == 5
+
+        provider._apply_change({"operationType": "delete", "documentKey": {"_id": 2}})
+        assert provider._doc_ids.count(None) == 1
+        assert provider._dead_rows == 1
+
+        # A second delete crosses the compaction threshold
+        provider._apply_change({"operationType": "delete", "documentKey": {"_id": 3}})
+        assert provider._doc_ids == [1, 4, 5]
+        assert len(provider._matrix) == 3
+        assert provider._dead_rows == 0
+
+    def test_delete_during_search_still_fills_top_k(self, fake_mongo):
+        """Rows deleted while a search scores its snapshot are skipped."""
+        provider = make_provider()
+        provider.search("aaa")
+        for doc_id in (4, 5, 6):
+            provider._apply_change(
+                {
+                    "operationType": "insert",
+                    "documentKey": {"_id": doc_id},
+                    "fullDocument": {"_id": doc_id, "embedding": [0.0, 0.0, 1.0]},
+                }
+            )
+        provider._apply_change({"operationType": "delete", "documentKey": {"_id": 6}})
+        cosine_scores = provider._cosine_scores
+
+        def score_then_delete(*args):
+            scores = cosine_scores(*args)
+            # Crosses the compaction threshold, resetting the dead-row count
+            provider._apply_change(
+                {"operationType": "delete", "documentKey": {"_id": 1}}
+            )
+            return scores
+
+        provider._cosine_scores = score_then_delete
+
+        chunks = provider.search("aab", top_k=2)
+        assert [c.content for c in chunks] == ["gamma", "beta"]
+        assert provider._dead_rows == 0
+
+    def test_changes_during_build_replayed(self, fake_mongo):
+        """An event arriving while the collection is scanned is not lost."""
+        provider = make_provider()
+        build_matrix = provider._build_matrix
+        delta = {"_id": 4, "text": "delta", "source": "s4", "embedding": [0, 0, 1.0]}
+
+        def build_then_insert():
+            loaded = build_matrix()
+            # The scan has passed; the document lands before publishing
+            fake_mongo.docs = DOCS + [delta]
+            provider._apply_change(
+                {
+                    "operationType": "insert",
+                    "documentKey": {"_id": 4},
+                    "fullDocument": delta,
+                }
+            )
+            return loaded
+
+        provider._build_matrix = build_then_insert
+
+        assert provider.search("ccc", top_k=1)[0].content == "delta"
+        assert provider._pending_changes is None
+
+    @pytest.mark.parametrize(
+        "stream_end", [RuntimeError("cursor killed"), END_OF_STREAM]
+    )
+    def test_stream_reopened_after_it_ends(self, fake_mongo, monkeypatch, stream_end):
+        """Errors and normal ends reopen the stream and reload the matrix."""
+        monkeypatch.setattr(mongodb, "_WATCH_RETRY_SECONDS", 0.01)
+        provider = make_provider(watch_changes=True)
+        try:
+            provider.search("aaa")
+            fake_mongo.changes.put(stream_end)
+
+            deadline = time.monotonic() + 2.0
+            while provider._matrix is not None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert provider._matrix is None
+            assert len(fake_mongo.watch_pipelines) == 2
+
+            # The rebuilt matrix is kept in sync by the new stream
+            provider.search("aaa")
+            version = provider._mat_version
+            delta = {"_id": 4, "text": "delta", "source": "s4", "embedding": [0, 0, 1]}
+            fake_mongo.docs = DOCS + [delta]
+            fake_mongo.changes.put(
+                {
+                    "operationType": "insert",
+                    "documentKey": {"_id": 4},
+                    "fullDocument": delta,
+                }
+            )
+            _wait_for_version(provider, version + 1)
+            assert provider.search("ccc", top_k=1)[0].content == "delta"
+        finally:
+            provider.close()
+
+    def test_watch_requires_change_streams(self, fake_mongo, monkeypatch):
+        """A deployment without change streams fails at creation."""
+
+        def no_streams(*args, **kwargs):
+            raise RuntimeError("only supported on replica sets")
+
+        monkeypatch.setattr(fake_mongo, "watch", no_streams)
+
+        with pytest.raises(ConfigError, match="replica set"):
+            make_provider(watch_changes=True)
+
+    def test_watcher_not_started_for_vector_search(self, fake_mongo):
+        """$vectorSearch has no client-side matrix to keep in sync."""
+        fake_mongo.search_indexes = [{"name": "vector_index"}]
+
+        provider = make_provider(watch_changes=True)
+
+        assert provider._watch_thread is None
+        assert fake_mongo.watch_pipelines == []
+
+
+# ============================================================================
+# Bulk Upsert Tests
+# ============================================================================
+
+
+class TestBulkEmbedAndUpsert:
+    """Tests for MongoDBProvider.bulk_embed_and_upsert."""
+
+    def test_batches_sorted_by_length(self, fake_mongo):
+        """Texts are encoded shortest first in batch_size chunks."""
+        provider = make_provider()
+
+        written = provider.bulk_embed_and_upsert(
+            [
+                {"_id": 10, "text": "cccccc", "source": "new"},
+                {"_id": 11, "text": "cc"},
+                {"_id": 12, "text": "cccc"},
+            ],
+            batch_size=2,
+        )
+
+        assert written == 3
+        assert provider.embedding_model.calls == [["cc", "cccc"], ["cccccc"]]
+        assert [len(ops) for ops, _ in fake_mongo.bulk_writes] == [2, 1]
+        assert all(ordered is False for _, ordered in fake_mongo.bulk_writes)
+
+    def test_upserted_documents_searchable(self, fake_mongo, tmp_path):
+        """The cached matrix is rebuilt to include upserted vectors."""
+        provider = make_provider(matrix_cache_dir=str(tmp_path))
+        provider.search("ccc")
+
+        provider.bulk_embed_and_upsert([{"_id": 1, "text": "ccc", "source": "s1"}])
+
+        chunks = provider.search("ccc", top_k=1)
+        assert chunks[0].content == "ccc"
+        assert chunks[0].score == pytest.approx(1.0)
+
+    def test_missing_text_rejected(self, fake_mongo):
+        """Documents without text are rejected before any write."""
+        provider = make_provider()
+
+        with pytest.raises(RunError, match="text"):
+            provider.bulk_embed_and_upsert([{"_id": 1}])
+
+        assert fake_mongo.bulk_writes == []
@@ -0,0 +1,663 @@
+"""Tests for the OpenAPI provider and its response mapping."""
+
+import asyncio
+import json
+import sys
+import types
+from unittest.mock import MagicMock
+
+import jmespath
+import pytest
+import responses
+
+from ragdiff.core.errors import ConfigError, RunError
+from ragdiff.openapi.parser import OpenAPISpec
+from ragdiff.providers.openapi import OpenAPIProvider
+from ragdiff.providers.openapi_utils import (
+    ResponseMapper,
+    TemplateEngine,
+    _compile_jmespath,
+    _compile_path,
+    _FlatPath,
+    _split_template,
+)
+
+MAPPING = {
+    "results_array": "results",
+    "fields": {"id": "id", "text": "text", "score": "score"},
+}
+
+
+URL = "https://api.example.com/v1/search"
+
+RESPONSE = {
+    "results": [
+        {"id": "a", "text": "first", "score": 0.9},
+        {"id": "b", "text": "second", "score": 0.5},
+    ]
+}
+
+
+def make_provider(**overrides):
+    config = {
+        "base_url": "https://api.example.com",
+        "endpoint": "/v1/search",
+        "auth": {"type": "bearer"},
+        "api_key": "sk-test",
+        "request_body": {"query": "${query}", "limit": "${top_k}"},
+        "response_mapping": MAPPING,
+        "retry_delay": 0,
+    }
+    config.update(overrides)
+    return OpenAPIProvider(config=config)
+
+
+def make_fake_ijson():
+    """Stand-in ijson module with its exception hierarchy."""
+    fake_ijson = types.ModuleType("ijson")
+    fake_ijson.JSONError = type("JSONError", (Exception,), {})
+    fake_ijson.IncompleteJSONError = type(
+        "IncompleteJSONError", (fake_ijson.JSONError,), {}
+    )
+    return fake_ijson
+
+
+def map_scores(scores, **overrides):
+    mapper = ResponseMapper({**MAPPING, **overrides})
+    response = {
+        "results": [
+            {"id": i, "text": f"doc {i}", "score": score}
+            for i, score in enumerate(scores)
+        ]
+    }
+    return [chunk.score for chunk in mapper.map_results(response)]
+
+
+# ============================================================================
+# Template Tests
+# ============================================================================
+
+
+class TestTemplateEngine:
+    """Tests for TemplateEngine.compile and compile_json."""
+
+    TEMPLATE = {
+        "query": "${query}",
+        "limit": "${top_k}",
+        "filter": ["lang:en", "q=${query}&k=${top_k}"],
+        "static": {"flag": True, "count": 3},
+    }
+
+    def test_compiled_matches_render(self):
+        """Compiled templates render exactly like render()."""
+        engine = TemplateEngine()
+        variables = {"query": "test", "top_k": 5}
+
+        rendered = engine.compile(self.TEMPLATE)(variables)
+
+        assert rendered == engine.render(self.TEMPLATE, variables)
+        assert rendered["limit"] == 5  # type preserved for "${var}"
+        assert rendered["filter"][1] == "q=test&k=5"
+
+    def test_compiled_returns_fresh_containers(self):
+        """Mutating one rendering does not leak into the next."""
+        render = TemplateEngine().compile(self.TEMPLATE)
+
+        first = render({"query": "a", "top_k": 1})
+        first["static"]["count"] = 99
+
+        assert render({"query": "b", "top_k": 2})["static"]["count"] == 3
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize(
+        "query", ["test", 'say "hi"\n', "caf\u00e9 \u0645\u0631\u062d\u0628\u0627"]
+    )
+    def test_compile_json_matches_render(self, monkeypatch, use_orjson, query):
+        """Pre-serialized bodies decode to the rendered template."""
+        if not use_orjson:
+            monkeypatch.setattr("ragdiff.providers.openapi_utils.orjson", None)
+        engine = TemplateEngine()
+        variables = {"query": query, "top_k": 5}
+
+        body = engine.compile_json(self.TEMPLATE)(variables)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == engine.render(self.TEMPLATE, variables)
+
+    def test_compile_json_static_template(self):
+        """Templates without variables serialize once."""
+        render = TemplateEngine().compile_json({"a": [1, None], "b": "x"})
+
+        assert render({}) == b'{"a":[1,null],"b":"x"}'
+
+    def test_template_strings_scanned_once(self):
+        """render() reuses the cached split of each template string."""
+        engine = TemplateEngine()
+        _split_template.cache_clear()
+
+        for top_k in range(5):
+            engine.render(self.TEMPLATE, {"query": "q", "top_k": top_k})
+
+        info = _split_template.cache_info()
+        assert info.misses == 4  # one per distinct string in TEMPLATE
+        assert info.hits == 16
+
+    def test_missing_variable(self):
+        """Unknown variables raise ConfigError at render time."""
+        render = TemplateEngine().compile({"q": "x-${missing}"})
+
+        with pytest.raises(ConfigError, match="missing"):
+            render({"query": "a"})
+
+
+# ============================================================================
+# Item Mapping Tests
+# ============================================================================
+
+
+class TestItemMapping:
+    """Tests for the specialized per-item mapper."""
+
+    FULL_MAPPING = {
+        "results_array": "data",
+        "fields": {
+            "id": "doc.id",
+            "text": "doc.body",
+            "score": "rank",
+            "source": "doc.origin",
+            "metadata": "{lang: doc.lang}",
+        },
+    }
+
+    ITEMS = [
+        {"doc": {"id": 1, "body": "x", "origin": "web", "lang": "en"}, "rank": 0.7},
+        {"doc": {"id": 2, "body": "y"}, "rank": 0.2},
+        {"doc": {"id": 3}, "rank": 0.1},  # missing text
+    ]
+
+    def test_specialized_matches_generic(self):
+        """The compiled mapper produces the same chunks as _map_item."""
+        mapper = ResponseMapper(self.FULL_MAPPING)
+
+        fast = mapper.map_results({"data": self.ITEMS})
+        generic = [mapper._map_item(item, i) for i, item in enumerate(self.ITEMS[:2])]
+
+        assert fast == generic
+        assert fast[0].metadata == {"id": "1", "source": "web", "lang": "en"}
+        assert fast[1].metadata == {"id": "2", "lang": None}
+
+    @pytest.mark.parametrize(
+        "expression,data",
+        [
+            ("a", {"a": 1}),
+            ("a.b", {"a": {"b": [1, 2]}}),
+            ("a.b", {"a": {"c": 1}}),
+            ("a.b", {"a": "not an object"}),
+            ("a.b.c", {"a": None}),
+            ("_x.y_1", {"_x": {"y_1": 0}}),
+            ("a", ["list"]),
+        ],
+    )
+    def test_flat_paths_match_jmespath(self, expression, data):
+        """Flat dotted paths bypass JMESPath with identical results."""
+        compiled = _compile_path(expression)
+
+        assert isinstance(compiled, _FlatPath)
+        assert compiled.search(data) == jmespath.search(expression, data)
+
+    @pytest.mark.parametrize("expression", ["a[0]", "a.b || c", "{x: a}", '"a-b"'])
+    def test_complex_paths_use_jmespath(self, expression):
+        """Anything beyond dotted identifiers is compiled by JMESPath."""
+        assert not isinstance(_compile_path(expression), _FlatPath)
+
+    def test_jmespath_compiled_once_across_mappers(self):
+        """Mappers sharing a config share compiled expressions."""
+        _compile_jmespath.cache_clear()
+        first = ResponseMapper(self.FULL_MAPPING)
+        second = ResponseMapper(self.FULL_MAPPING)
+
+        assert second.field_exprs["metadata"] is first.field_exprs["metadata"]
+        assert _compile_jmespath.cache_info().misses == 1
+
+    @pytest.mark.parametrize(
+        "path,response,expected",
+        [
+            ("data.results", {"data": {"results": [1]}}, [1]),
+            ("data.results", {"data": [1]}, None),
+            ("data[0].results", {"data": [{"results": [1]}]}, [1]),
+        ],
+    )
+    def test_results_array_path(self, path, response, expected):
+        """Flat results paths skip JMESPath but extract the same value."""
+        mapper = ResponseMapper({**MAPPING, "results_array": path})
+
+        assert isinstance(mapper.results_array_expr, _FlatPath) == ("[" not in path)
+        assert mapper.results_array_expr.search(response) == expected
+
+    def test_malformed_item_skipped_in_order(self, caplog):
+        """One bad item is logged and skipped; the rest keep API order."""
+        mapper = ResponseMapper(self.FULL_MAPPING)
+        items = [self.ITEMS[2], self.ITEMS[0], self.ITEMS[1]]
+
+        chunks = mapper.map_results({"data": items})
+
+        assert [c.content for c in chunks] == ["x", "y"]
+        assert "Failed to map result item 0" in caplog.text
+
+    def test_missing_required_mapping_falls_back(self):
+        """Without a text mapping every item is skipped, as before."""
+        mapper = ResponseMapper({"results_array": "data", "fields": {"score": "rank"}})
+
+        assert mapper.map_results({"data": self.ITEMS}) == []
+
+
+# ============================================================================
+# Score Normalization Tests
+# ============================================================================
+
+
+class TestScoreNormalization:
+    """Tests for ResponseMapper score normalization."""
+
+    def test_auto_detects_scale_per_score(self):
+        """Without score_scale each score's range is guessed."""
+        assert map_scores([0.5, 50, 500, -1]) == [0.5, 0.5, 0.5, 0.0]
+
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            (1, 1.0),
+            (1.0000001, 1.0000001 / 100),
+            ("75", 0.75),
+            (100, 1.0),
+            (100.5, 0.1005),
+            (2000, 1.0),
+            (float("nan"), 0.0),
+        ],
+    )
+    def test_auto_detect_boundaries(self, score, expected):
+        """Range boundaries, non-float inputs and NaN normalize as before."""
+        mapper = ResponseMapper(MAPPING)
+
+        assert mapper._normalize_score(score) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "scale,scores,expected",
+        [
+            ("unit", [0.25, 1.5, -0.5], [0.25, 1.0, 0.0]),
+            ("percent", [0.5, 50, 150], [0.005, 0.5, 1.0]),
+            ("per_mille", [50, 500, -5], [0.05, 0.5, 0.0]),
+        ],
+    )
+    def test_declared_scale_applied_uniformly(self, scale, scores, expected):
+        """A declared scale divides and clamps every score the same way."""
+        assert map_scores(scores, score_scale=scale) == pytest.approx(expected)
+
+    def test_invalid_scale_rejected(self):
+        """Unknown scales are a configuration error."""
+        with pytest.raises(ConfigError, match="score_scale"):
+            ResponseMapper({**MAPPING, "score_scale": "decibel"})
+
+    def test_non_numeric_score_skipped(self):
+        """Items whose score cannot be parsed are dropped from the results."""
+        assert map_scores(["high", 0.5], score_scale="unit") == [0.5]
+
+
+# ============================================================================
+# HTTP Tests
+# ============================================================================
+
+
+class TestHTTP:
+    """Tests for OpenAPIProvider request execution."""
+
+    def test_connection_pool_shared_across_providers(self, monkeypatch):
+        """Providers with the same retry policy share one adapter."""
+        monkeypatch.setattr("ragdiff.providers.openapi._ADAPTERS", {})
+        first = make_provider()
+        second = make_provider(api_key="sk-other")
+        slower = make_provider(retry_count=5)
+        dedicated = make_provider(dedicated_session=True)
+
+        adapter = first._session.get_adapter(URL)
+        assert second._session.get_adapter(URL) is adapter
+        assert slower._session.get_adapter(URL) is not adapter
+        assert dedicated._session.get_adapter(URL) is not adapter
+        # Auth stays per provider
+        assert second._session.headers["Authorization"] == "Bearer sk-other"
+
+        # Closing one provider leaves the shared pool open for the others
+        adapter.close = MagicMock()
+        first.close()
+        adapter.close.assert_not_called()
+
+    def test_missing_required_fields_reported_together(self):
+        """All missing required fields appear in one ConfigError."""
+        with pytest.raises(ConfigError, match="'base_url', 'endpoint' in config"):
+            OpenAPIProvider(config={"auth": {}, "response_mapping": MAPPING})
+
+    @responses.activate
+    def test_search_reuses_session(self):
+        """Searches share one pooled session with the rendered request."""
+        responses.post(URL, json=RESPONSE)
+        provider = make_provider()
+        session = provider._session
+
+        provider.search("first query", top_k=2)
+        chunks = provider.search("second query", top_k=1)
+
+        assert provider._session is session
+        assert [c.content for c in chunks] == ["first"]
+        assert len(responses.calls) == 2
+        request = responses.calls[1].request
+        assert request.headers["Authorization"] == "Bearer sk-test"
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"query": "second query", "limit": 1}
+        provider.close()
+
+    @responses.activate
+    def test_mapped_chunks_not_rebuilt(self, monkeypatch):
+        """Chunks from the response mapper are returned without copying."""
+        responses.post(URL, json=RESPONSE)
+        provider = make_provider()
+        mapped = []
+        map_results = provider.response_mapper.map_results
+
+        def spy(response):
+            mapped.extend(map_results(response))
+            return mapped
+
+        monkeypatch.setattr(provider.response_mapper, "map_results", spy)
+
+        chunks = provider.search("query", top_k=2)
+
+        assert [id(c) for c in chunks] == [id(c) for c in mapped]
+
+    @responses.activate
+    @pytest.mark.parametrize("count", [6, 50])
+    def test_top_k_selection(self, count):
+        """Top results are returned best first, ties in API order."""
+        scores = [round((i * 7 % 10) / 10, 1) for i in range(count)]
+        responses.post(
+            URL,
+            json={
+                "results": [
+                    {"id": i, "text": f"doc {i}", "score": score}
+                    for i, score in enumerate(scores)
+                ]
+            },
+        )
+
+        chunks = make_provider().search("query", top_k=3)
+
+        expected = sorted(range(count), key=lambda i: scores[i], reverse=True)[:3]
+        assert [c.metadata["id"] for c in chunks] == [str(i) for i in expected]
+
+    @responses.activate
+    def test_query_apikey_auth(self):
+        """Query-string API keys are sent alongside rendered params."""
+        responses.get(URL, json=RESPONSE)
+        provider = make_provider(
+            method="GET",
+            auth={"type": "apikey", "location": "query", "parameter_name": "key"},
+            request_body=None,
+            request_params={"q": "${query}"},
+        )
+
+        provider.search("hello")
+
+        assert responses.calls[0].request.params == {"q": "hello", "key": "sk-test"}
+
+    @responses.activate
+    def test_basic_auth(self):
+        """Basic credentials are attached to every request."""
+        responses.post(URL, json=RESPONSE)
+        provider = make_provider(auth={"type": "basic"}, username="u", password="p")
+
+        provider.search("hello")
+
+        assert responses.calls[0].request.headers["Authorization"].startswith("Basic ")
+
+    def test_missing_credentials_rejected_at_init(self):
+        """Auth config errors surface when the provider is created."""
+        with pytest.raises(ConfigError, match="api_key"):
+            make_provider(api_key=None)
+
+    @responses.activate
+    def test_transient_status_retried(self):
+        """5xx responses are retried by the session adapter."""
+        responses.post(URL, status=503)
+        responses.post(URL, json=RESPONSE)
+
+        chunks = make_provider().search("query")
+
+        assert len(chunks) == 2
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_client_error_not_retried(self):
+        """4xx responses fail immediately with a RunError."""
+        responses.post(URL, status=404)
+
+        with pytest.raises(RunError, match="404"):
+            make_provider().search("query")
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retries_exhausted(self):
+        """Persistent 5xx responses fail after retry_count retries."""
+        responses.post(URL, status=502)
+
+        with pytest.raises(RunError, match="502"):
+            make_provider(retry_count=2).search("query")
+
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_parsing(self, monkeypatch, use_orjson):
+        """Responses parse the same with orjson or the stdlib fallback."""
+        if not use_orjson:
+            monkeypatch.setattr("ragdiff.providers.openapi.orjson", None)
+        responses.post(URL, json=RESPONSE)
+        responses.post(URL, body="not json")
+        provider = make_provider(retry_count=0)
+
+        chunks = provider.search("query", top_k=2)
+        assert [c.content for c in chunks] == ["first", "second"]
+
+        with pytest.raises(RunError):
+            provider.search("query", top_k=2)
+
+
+class TestStreaming:
+    """Tests for incremental response parsing."""
+
+    def test_stream_prefix(self):
+        """Only plain dotted results paths map to an ijson prefix."""
+        assert ResponseMapper(MAPPING).stream_prefix == "results.item"
+        nested = {**MAPPING, "results_array": "data.hits"}
+        assert ResponseMapper(nested).stream_prefix == "data.hits.item"
+        filtered = {**MAPPING, "results_array": "results[?score > `0.5`]"}
+        assert ResponseMapper(filtered).stream_prefix is None
+
+    def test_map_stream_matches_map_results(self):
+        """Mapping an item iterator gives the same chunks as a full response."""
+        mapper = ResponseMapper(MAPPING)
+        items = iter(RESPONSE["results"] + [{"id": "c"}])
+
+        assert mapper.map_stream(items) == mapper.map_results(RESPONSE)
+
+    def test_missing_ijson(self, monkeypatch):
+        """Requesting streaming without ijson installed is a config error."""
+        monkeypatch.setitem(sys.modules, "ijson", None)
+
+        with pytest.raises(ConfigError, match="ijson"):
+            make_provider(stream_response=True)
+
+    def test_non_flat_path_falls_back(self, monkeypatch):
+        """JMESPath result paths keep parsing the full response."""
+        monkeypatch.setitem(sys.modules, "ijson", None)
+        mapping = {**MAPPING, "results_array": "results[*]"}
+
+        provider = make_provider(stream_response=True, response_mapping=mapping)
+
+        assert provider._stream_prefix is None
+
+    @responses.activate
+    def test_streamed_search(self):
+        """Streamed responses produce the same ranked chunks."""
+        pytest.importorskip("ijson")
+        responses.post(URL, json=RESPONSE)
+        responses.post(URL, body='{"results": [')
+
+        provider = make_provider(
+            stream_response=True, stream_threshold=0, retry_count=0
+        )
+        chunks = provider.search("query", top_k=2)
+
+        assert [(c.content, c.score) for c in chunks] == [
+            ("first", 0.9),
+            ("second", 0.5),
+        ]
+        with pytest.raises(RunError):
+            provider.search("query", top_k=2)
+
+    @responses.activate
+    def test_small_response_parsed_in_one_shot(self, monkeypatch):
+        """Bodies under the threshold bypass the incremental parser."""
+        fake_ijson = make_fake_ijson()
+        fake_ijson.items = MagicMock(side_effect=AssertionError("streamed"))
+        monkeypatch.setitem(sys.modules, "ijson", fake_ijson)
+        body = json.dumps(RESPONSE)
+        responses.post(
+            URL,
+            body=body,
+            content_type="application/json",
+            headers={"Content-Length": str(len(body))},
+        )
+
+        provider = make_provider(stream_response=True)
+        chunks = provider.search("query", top_k=2)
+
+        assert [c.content for c in chunks] == ["first", "second"]
+        fake_ijson.items.assert_not_called()
+
+    @responses.activate
+    def test_invalid_json_reported(self, monkeypatch):
+        """Parser errors from either path surface as invalid-JSON RunErrors."""
+        fake_ijson = make_fake_ijson()
+        fake_ijson.items = MagicMock(
+            side_effect=fake_ijson.IncompleteJSONError("premature EOF")
+        )
+        monkeypatch.setitem(sys.modules, "ijson", fake_ijson)
+        responses.post(URL, body='{"results": [')
+        responses.post(URL, body='{"results": [', headers={"Content-Length": "13"})
+
+        provider = make_provider(stream_response=True, retry_count=0)
+
+        with pytest.raises(RunError, match="invalid JSON: premature EOF"):
+            provider.search("query", top_k=2)
+        with pytest.raises(RunError, match="invalid JSON"):
+            provider.search("query", top_k=2)
+
+
+class TestAsyncSearch:
+    """Tests for asearch / search_batch over the async client."""
+
+    @pytest.fixture
+    def transport(self, monkeypatch):
+        """Route the async client through an in-memory transport."""
+        httpx = pytest.importorskip("httpx")
+        calls = []
+        statuses = []
+
+        def handler(request):
+            calls.append(request)
+            status = statuses.pop(0) if statuses else 200
+            query = json.loads(request.content)["query"]
+            body = {"results": [{"id": query, "text": query, "score": 0.5}]}
+            return httpx.Response(status, json=body)
+
+        monkeypatch.setattr(
+            httpx,
+            "AsyncHTTPTransport",
+            lambda **kwargs: httpx.MockTransport(handler),
+        )
+        return types.SimpleNamespace(calls=calls, statuses=statuses)
+
+    def test_search_batch_preserves_order(self, transport):
+        """Each query gets its own results, in input order, with auth."""
+        provider = make_provider()
+
+        batches = provider.search_batch(["q1", "q2", "q3"], top_k=1)
+
+        assert [[c.content for c in chunks] for chunks in batches] == [
+            ["q1"],
+            ["q2"],
+            ["q3"],
+        ]
+        assert all(
+            r.headers["Authorization"] == "Bearer sk-test" for r in transport.calls
+        )
+        # The loop-bound client is released with the batch
+        assert provider._aclient is None
+
+    @responses.activate
+    def test_search_batch_inside_event_loop(self):
+        """Inside a running loop, search_batch falls back to blocking search."""
+        responses.add(responses.POST, URL, json=RESPONSE)
+        provider = make_provider()
+
+        async def run():
+            return provider.search_batch(["q1", "q2"], top_k=2)
+
+        batches = asyncio.run(run())
+
+        assert [[c.content for c in chunks] for chunks in batches] == [
+            ["first", "second"],
+            ["first", "second"],
+        ]
+        assert len(responses.calls) == 2
+
+    def test_retries_transient_status(self, transport):
+        """503 responses are retried like the blocking path."""
+        transport.statuses.extend([503, 200])
+
+        chunks = asyncio.run(make_provider().asearch("query", top_k=1))
+
+        assert [c.content for c in chunks] == ["query"]
+        assert len(transport.calls) == 2
+
+    def test_client_error_not_retried(self, transport):
+        """4xx responses other than 429 fail immediately."""
+        transport.statuses.append(404)
+
+        with pytest.raises(RunError, match="404"):
+            make_provider().search_batch(["query"])
+        assert len(transport.calls) == 1
+
+    def test_missing_httpx_reports_install_hint(self, monkeypatch):
+        """Without httpx, asearch raises the ConfigError with the install hint."""
+        monkeypatch.setitem(sys.modules, "httpx", None)
+
+        with pytest.raises(ConfigError, match="pip install 'httpx\\[http2\\]'"):
+            asyncio.run(make_provider().asearch("query", top_k=1))
+
+
+class TestOpenAPISpec:
+    """Tests for OpenAPI spec version validation."""
+
+    @pytest.mark.parametrize("version", ["3.0.3", "3.1.0", "3.1", 3.0, "3.1.0-rc1"])
+    def test_supported_versions(self, version):
+        """Any 3.x spec is accepted, including YAML floats."""
+        spec = OpenAPISpec({"openapi": version})
+
+        assert spec.openapi_version == str(version)
+
+    @pytest.mark.parametrize("version", ["2.0", "30.0", "3", "", "latest"])
+    def test_unsupported_versions(self, version):
+        """Other majors and malformed versions are rejected."""
+        with pytest.raises(ConfigError, match="Unsupported OpenAPI version"):
+            OpenAPISpec({"openapi": version})
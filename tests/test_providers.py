@@ -7,17 +7,32 @@ Tests cover:
 - System implementations (Vectara, MongoDB, Agentset)
 """
 
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
 import pytest
+import requests
+import responses
 
 from ragdiff.core.errors import ConfigError, RunError
 from ragdiff.core.models import ProviderConfig, RetrievedChunk
 from ragdiff.providers import (
     Provider,
+    asearch_across,
+    clear_provider_cache,
     create_provider,
+    create_providers,
+    factory,
+    get_cached_provider,
     get_tool,
     is_tool_registered,
     list_tools,
     register_tool,
+    search_across,
+    vectara,
 )
 from ragdiff.providers.registry import TOOL_REGISTRY
 
@@ -140,6 +155,15 @@ class TestToolRegistry:
         register_tool("mock", ErrorProvider)  # Overwrite
         assert TOOL_REGISTRY["mock"] == ErrorProvider  # Second registration wins
 
+    def test_register_same_tool_twice_is_silent(self, clean_registry, caplog):
+        """Re-registering the same class is a no-op, not an overwrite."""
+        register_tool("mock", MockProvider)
+        register_tool("mock", MockProvider)
+        assert "already registered" not in caplog.text
+
+        register_tool("mock", ErrorProvider)
+        assert "already registered" in caplog.text
+
     def test_get_tool(self, clean_registry):
         """Test getting a tool from registry."""
         register_tool("mock", MockProvider)
@@ -177,6 +201,21 @@ class TestToolRegistry:
 
         assert not is_tool_registered("other")
 
+    def test_registry_import_skips_heavy_sdks(self):
+        """Registering providers does not import SDKs that are slow to load."""
+        code = (
+            "import sys, ragdiff.providers; "
+            "print(sorted({'agentset', 'google.genai'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+        assert result.stdout.strip() == "[]"
+
 
 # ============================================================================
 # Tool Factory Tests
@@ -222,6 +261,58 @@ class TestToolFactory:
         with pytest.raises(RunError, match="Failed to initialize provider"):
             create_provider(config)
 
+    def test_get_cached_provider_reuses_instance(self, clean_registry):
+        """Equal configs share one instance until the tool or config changes."""
+        clear_provider_cache()
+        register_tool("mock", MockProvider)
+        config = ProviderConfig(name="test-system", tool="mock", config={"k": 1})
+
+        provider = get_cached_provider(config)
+        assert get_cached_provider(config.model_copy()) is provider
+        assert (
+            get_cached_provider(config.model_copy(update={"config": {"k": 2}}))
+            is not provider
+        )
+
+        # Re-registering the tool must not hand out the old class
+        register_tool("mock", ErrorProvider)
+        assert isinstance(get_cached_provider(config), ErrorProvider)
+
+        clear_provider_cache()
+        register_tool("mock", MockProvider)
+        assert get_cached_provider(config) is not provider
+
+    def test_get_cached_provider_closes_evicted(self, clean_registry, monkeypatch):
+        """Providers leaving the cache are closed, on eviction and on clear."""
+        closed = []
+
+        class ClosingProvider(MockProvider):
+            def close(self) -> None:
+                closed.append(self.config["k"])
+
+        clear_provider_cache()
+        monkeypatch.setattr(factory, "PROVIDER_CACHE_SIZE", 2)
+        register_tool("mock", ClosingProvider)
+
+        def config(k):
+            return ProviderConfig(name="test-system", tool="mock", config={"k": k})
+
+        get_cached_provider(config(1))
+        get_cached_provider(config(2))
+        get_cached_provider(config(1))  # 2 is now least recently used
+        get_cached_provider(config(3))
+        assert closed == [2]
+
+        clear_provider_cache()
+        assert sorted(closed) == [1, 2, 3]
+
+    def test_get_cached_provider_unhashable_config(self, clean_registry):
+        """Configs that can't be serialized get a fresh instance each time."""
+        register_tool("mock", MockProvider)
+        config = ProviderConfig(name="test-system", tool="mock", config={"o": object()})
+
+        assert get_cached_provider(config) is not get_cached_provider(config)
+
 
 # ============================================================================
 # Vectara System Tests
@@ -269,6 +360,175 @@ class TestVectaraProvider:
         assert system.corpus_id == "test-corpus"
         assert system.timeout == 30
 
+    @responses.activate
+    def test_vectara_search_reuses_pooled_session(self):
+        """Searches share one keep-alive session and retry transient errors."""
+        url = "https://api.vectara.io/v2/query"
+        body = {"search_results": [{"text": "hit", "score": 0.8, "document_id": "d"}]}
+        responses.post(url, status=503)
+        responses.post(url, json=body)
+        responses.post(url, json=body)
+        config = ProviderConfig(
+            name="vectara-test",
+            tool="vectara",
+            config={"api_key": "vsk_test", "corpus_id": "c"},
+        )
+        system = create_provider(config)
+
+        first = system.search("q1", top_k=1)
+        second = system.search("q2", top_k=1)
+
+        assert [c.content for c in first.chunks] == ["hit"]
+        assert second.chunks[0].metadata == {"document_id": "d"}
+        assert len(responses.calls) == 3
+        assert responses.calls[2].request.headers["x-api-key"] == "vsk_test"
+        assert vectara._get_session(requests) is vectara._SESSION
+        assert json.loads(responses.calls[2].request.body) == {
+            "query": "q2",
+            "search": {"corpora": [{"corpus_key": "c"}], "limit": 1},
+        }
+
+    @responses.activate
+    def test_vectara_metadata_merge(self):
+        """Part and document metadata merge, document values winning."""
+        responses.post(
+            "https://api.vectara.io/v2/query",
+            json={
+                "search_results": [
+                    {
+                        "text": "both",
+                        "part_metadata": {"page": 1, "lang": "ar"},
+                        "document_metadata": {"lang": "en"},
+                        "document_id": "d1",
+                    },
+                    {"text": "part", "part_metadata": {"page": 2}},
+                    {"text": "doc", "document_metadata": {"title": "t"}},
+                    {"text": "none"},
+                ]
+            },
+        )
+        system = create_provider(
+            ProviderConfig(
+                name="vectara-test",
+                tool="vectara",
+                config={"api_key": "vsk_test", "corpus_id": "c"},
+            )
+        )
+
+        result = system.search("q", top_k=4)
+
+        assert [c.metadata for c in result.chunks] == [
+            {"page": 1, "lang": "en", "document_id": "d1"},
+            {"page": 2},
+            {"title": "t"},
+            {},
+        ]
+        # Extra results beyond top_k are still dropped
+        assert len(system.search("q", top_k=2).chunks) == 2
+
+    @responses.activate
+    def test_vectara_search_without_orjson(self, monkeypatch):
+        """The stdlib json fallback produces the same results."""
+        monkeypatch.setattr(vectara, "orjson", None)
+        responses.post(
+            "https://api.vectara.io/v2/query",
+            json={"search_results": [{"text": "hit", "score": 0.8}]},
+        )
+        system = create_provider(
+            ProviderConfig(
+                name="vectara-test",
+                tool="vectara",
+                config={"api_key": "vsk_test", "corpus_id": "c"},
+            )
+        )
+
+        result = system.search("q", top_k=1)
+
+        assert [c.content for c in result.chunks] == ["hit"]
+        assert json.loads(responses.calls[0].request.body)["query"] == "q"
+
+    @responses.activate
+    def test_vectara_search_error_scope(self):
+        """Bad JSON is a RunError; parsing bugs surface with their own type."""
+        url = "https://api.vectara.io/v2/query"
+        responses.post(url, body="not json", content_type="application/json")
+        responses.post(url, json={"search_results": ["not a dict"]})
+        system = create_provider(
+            ProviderConfig(
+                name="vectara-test",
+                tool="vectara",
+                config={"api_key": "vsk_test", "corpus_id": "c"},
+            )
+        )
+
+        with pytest.raises(RunError, match="invalid JSON"):
+            system.search("q", top_k=1)
+        with pytest.raises(AttributeError):
+            system.search("q", top_k=1)
+
+    def test_vectara_asearch(self, monkeypatch):
+        """asearch maps the response like search and reports HTTP errors."""
+        httpx = pytest.importorskip("httpx")
+        statuses = [200, 401]
+
+        def handler(request):
+            assert request.headers["x-api-key"] == "vsk_test"
+            body = {"search_results": [{"text": "hit", "score": 0.8}]}
+            return httpx.Response(statuses.pop(0), json=body)
+
+        monkeypatch.setattr(
+            httpx, "AsyncHTTPTransport", lambda **kw: httpx.MockTransport(handler)
+        )
+        system = create_provider(
+            ProviderConfig(
+                name="vectara-test",
+                tool="vectara",
+                config={"api_key": "vsk_test", "corpus_id": "c"},
+            )
+        )
+
+        async def run():
+            result = await system.asearch("q", top_k=1)
+            with pytest.raises(RunError, match="authentication failed"):
+                await system.asearch("q", top_k=1)
+            return result
+
+        assert [c.content for c in asyncio.run(run()).chunks] == ["hit"]
+
+    def test_vectara_aclose_releases_client(self, monkeypatch):
+        """Each event loop gets a fresh client, which aclose closes."""
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            return httpx.Response(200, json={"search_results": []})
+
+        monkeypatch.setattr(
+            httpx, "AsyncHTTPTransport", lambda **kw: httpx.MockTransport(handler)
+        )
+        system = create_provider(
+            ProviderConfig(
+                name="vectara-test",
+                tool="vectara",
+                config={"api_key": "vsk_test", "corpus_id": "c"},
+            )
+        )
+
+        async def run():
+            await system.asearch("q", top_k=1)
+            return system._aclient
+
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+        assert second is not first
+
+        async def run_and_close():
+            client = await run()
+            await system.aclose()
+            return client
+
+        assert asyncio.run(run_and_close()).is_closed
+        assert system._aclient is None
+
     def test_vectara_repr(self):
         """Test Vectara __repr__."""
         config = ProviderConfig(
@@ -370,6 +630,68 @@ class TestAgentsetProvider:
         assert system.rerank is False
 
 
+# ============================================================================
+# Concurrent Search Tests
+# ============================================================================
+
+
+class TestSearchAcross:
+    """Tests for querying several providers concurrently."""
+
+    def test_results_in_provider_order(self):
+        """Each provider's results come back in input order."""
+        providers = [MockProvider({}) for _ in range(3)]
+
+        results = search_across(providers, "test query", top_k=2)
+
+        assert len(results) == 3
+        assert all(len(chunks) == 2 for chunks in results)
+
+    def test_provider_error_propagates(self):
+        """A failing provider surfaces its RunError."""
+        with pytest.raises(RunError, match="Mock error"):
+            search_across([MockProvider({}), ErrorProvider({})], "test query")
+
+    def test_no_providers(self):
+        """An empty provider list returns no results."""
+        assert search_across([], "test query") == []
+
+    def test_create_providers_in_config_order(self, clean_registry):
+        """Providers are built concurrently and returned in config order."""
+        register_tool("mock", MockProvider)
+        configs = [
+            ProviderConfig(name=f"p{i}", tool="mock", config={"i": i}) for i in range(3)
+        ]
+
+        providers = create_providers(configs)
+
+        assert [p.config["i"] for p in providers] == [0, 1, 2]
+        assert create_providers([]) == []
+
+    def test_create_providers_error_propagates(self, clean_registry):
+        """An unknown tool fails the whole call."""
+        with pytest.raises(ConfigError, match="Failed to create provider 'p'"):
+            create_providers([ProviderConfig(name="p", tool="missing", config={})])
+
+    def test_async_mixes_native_and_threaded_providers(self):
+        """asearch providers are awaited; others run in threads, order kept."""
+
+        class AsyncProvider(MockProvider):
+            async def asearch(self, query, top_k=5):
+                return [RetrievedChunk(content=f"async: {query}", score=1.0)]
+
+        providers = [MockProvider({}), AsyncProvider({})]
+
+        results = asyncio.run(asearch_across(providers, "q", top_k=1))
+
+        assert [r[0].content for r in results] == ["Mock result 0 for: q", "async: q"]
+
+    def test_async_provider_error_propagates(self):
+        """A failing provider surfaces its RunError from the gather."""
+        with pytest.raises(RunError, match="Mock error"):
+            asyncio.run(asearch_across([ErrorProvider({})], "q"))
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================